@@ -0,0 +1,352 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the benchmark runner that times and memory profiles every analytics method on generated data.
+#              Run it from the python directory with: python -m Benchmarks.BenchmarkRunner --scale 1 --scale 10
+
+# Include the goodies we are going to need
+import argparse
+import contextlib
+import datetime
+import functools
+import inspect
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import traceback
+import numpy as np
+import pandas as pd
+
+# Import our custom defined classes
+import main
+import Papers.PaperAnalytics as PaperAnalytics
+import TUT.TutorialAnalytics as TutorialAnalytics
+import PDW.PDWAnalytics as PDWAnalytics
+import Scholarships.ScholarAnalytics as ScholarAnalytics
+import Utils.XCDCache as XCDCache
+import Utils.RunSettings as RunSettings
+import Benchmarks.DataGenerator as DataGenerator
+
+# Analytics classes whose public methods get measured
+ANALYTICS_CLASSES = [PaperAnalytics.PaperAnalytics, TutorialAnalytics.TutorialAnalytics,
+                     PDWAnalytics.PDWAnalytics, ScholarAnalytics.ScholarAnalytics]
+
+# Where the run history goes when nobody says otherwise. It lives outside the repo so benchmarking leaves the tree clean
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".cache", "iitsec_benchmarks", "benchmark_history.json")
+
+# Where the generated workbooks go when nobody says otherwise. They are big at 100x so keep them out of the repo
+DEFAULT_DATA_ROOT = os.path.join(tempfile.gettempdir(), "iitsec_benchmark_data")
+
+# Flag a method in the comparison when it got this much slower or faster than the last run
+CHANGE_THRESHOLD = 0.10
+
+
+# Find the public methods on an analytics class. That is the stage methods plus the helpers they lean on, like
+# cleanData, loadXCDFile and the cross tabs, so a slow helper shows up under its own name
+def analyticsMethodNames(cls):
+    ######################
+    # cls -> Analytics class to look through
+    ######################
+
+    return [name for name, value in vars(cls).items() if inspect.isfunction(value) and not name.startswith("_")]
+
+
+# Define the class and it's methods
+class BenchmarkRunner:
+
+    # Define what it's constructor sets up
+    def __init__(self, seed:int = 2024, dataRoot:str = DEFAULT_DATA_ROOT, historyPath:str = DEFAULT_HISTORY_PATH,
+                 workers:int = 1, profileMemory:bool = True, verbose:bool = False):
+        ######################
+        # seed:int -> Seed handed to the data generator
+        # dataRoot:str -> Directory the generated workbooks are kept in, one sub directory per seed and scale
+        # historyPath:str -> JSON file the results get appended to
+        # workers:int -> Workers handed to the stages that take them. 1 keeps everything in this process so tracemalloc sees it
+        # profileMemory:bool -> When False the tracemalloc pass is skipped, it is a lot slower than the timing pass
+        # verbose:bool -> When True the analytics output is printed instead of swallowed
+        ######################
+
+        self.seed = seed
+        self.dataRoot = dataRoot
+        self.historyPath = historyPath
+        self.workers = workers
+        self.profileMemory = profileMemory
+        self.verbose = verbose
+
+        # Class.method -> measurements for the pass that is running
+        self.methodResults = {}
+
+        # Highest traced memory seen so far. A method resets the tracemalloc peak, so the stage's own peak would be lost without this
+        self.peakSeen = 0
+
+        # Highest traced memory seen by each measured call still running. Helpers are measured too, so one call can sit
+        # inside another and reset the peak the outer one is waiting on. Format -> {token: peak_bytes}
+        self.openCalls = {}
+
+    # Fold the current tracemalloc peak into the stage peak and every call still running, before it gets reset
+    def notePeak(self):
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        self.peakSeen = max(self.peakSeen, peak_bytes)
+        for token in list(self.openCalls):
+            self.openCalls[token] = max(self.openCalls.get(token, 0), peak_bytes)
+
+    # Wrap a method so every call gets timed, and when tracemalloc is on, its peak memory recorded
+    def measured(self, methodKey:str, method):
+        ######################
+        # methodKey:str -> Name the results are stored under. Format -> "Class.method"
+        # method -> The original method
+        ######################
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            result = self.methodResults.setdefault(methodKey, {"calls": 0, "seconds": 0.0, "peakMB": None, "error": None})
+            result["calls"] += 1
+
+            token = object()
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                self.notePeak()
+                tracemalloc.reset_peak()
+                start_bytes = tracemalloc.get_traced_memory()[0]
+                self.openCalls[token] = start_bytes
+            start = time.perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            except Exception as error:
+                result["error"] = type(error).__name__ + ": " + str(error)
+                raise
+            finally:
+                result["seconds"] += time.perf_counter() - start
+                if tracing:
+                    self.notePeak()
+                    peak_bytes = self.openCalls.pop(token)
+                    peak_mb = (peak_bytes - start_bytes) / (1024 * 1024)
+                    result["peakMB"] = max(result["peakMB"] or 0.0, peak_mb)
+
+        return wrapper
+
+    # Swap the analytics methods for measured ones. Hands back what it replaced so it can be put back
+    def instrument(self):
+        originals = []
+        for cls in ANALYTICS_CLASSES:
+            for name in analyticsMethodNames(cls):
+                method = getattr(cls, name)
+                originals.append((cls, name, method))
+                setattr(cls, name, self.measured(cls.__name__ + "." + name, method))
+
+        return originals
+
+    # Put the original methods back
+    def restore(self, originals:list):
+        ######################
+        # originals:list -> What instrument handed back
+        ######################
+
+        for cls, name, method in originals:
+            setattr(cls, name, method)
+
+    # Run every stage once and measure it. Stages write their csv files into the current directory
+    def runPass(self, dataDir:str, stageNames:list, profileMemory:bool):
+        ######################
+        # dataDir:str -> Directory holding the generated workbooks
+        # stageNames:list -> Stages from main.STAGES to run
+        # profileMemory:bool -> When True tracemalloc is on for the whole pass
+        ######################
+
+        self.methodResults = {}
+        self.openCalls = {}
+        stage_results = {}
+
+        # Nothing cached so every pass measures the same cold reads
+        settings = RunSettings.RunSettings(XCDCache.XCDCache(enabled = False))
+
+        originals = self.instrument()
+        if profileMemory:
+            tracemalloc.start()
+
+        try:
+            for stage_name in stageNames:
+                stage_result = {"seconds": 0.0, "peakMB": None, "error": None}
+                if profileMemory:
+                    tracemalloc.reset_peak()
+                    start_bytes = tracemalloc.get_traced_memory()[0]
+                    self.peakSeen = start_bytes
+                start = time.perf_counter()
+
+                # The analytics are chatty, so keep them quiet unless asked
+                output = sys.stdout if self.verbose else io.StringIO()
+                try:
+                    with contextlib.redirect_stdout(output):
+                        if stage_name in ("post-paper-review", "scholarship"):
+                            main.STAGES[stage_name](dataDir, self.workers, settings)
+                        else:
+                            main.STAGES[stage_name](dataDir, settings)
+                except Exception as error:
+                    stage_result["error"] = type(error).__name__ + ": " + str(error)
+                    if self.verbose:
+                        traceback.print_exc()
+
+                stage_result["seconds"] = time.perf_counter() - start
+                if profileMemory:
+                    peak_bytes = max(self.peakSeen, tracemalloc.get_traced_memory()[1])
+                    stage_result["peakMB"] = (peak_bytes - start_bytes) / (1024 * 1024)
+                stage_results[stage_name] = stage_result
+        finally:
+            if profileMemory:
+                tracemalloc.stop()
+            self.restore(originals)
+
+        return stage_results, self.methodResults
+
+    # Generate the data for a scale and benchmark every stage on it
+    def runScale(self, scale:int, stageNames:list):
+        ######################
+        # scale:int -> How many conference years worth of data to generate
+        # stageNames:list -> Stages from main.STAGES to run
+        ######################
+
+        data_dir = os.path.abspath(os.path.join(self.dataRoot, "seed" + str(self.seed) + "_x" + str(scale)))
+        print("BenchmarkRunner::runScale - Generating data for scale", scale, "in", data_dir)
+        DataGenerator.DataGenerator(self.seed, scale).writeAll(data_dir)
+
+        previous_dir = os.getcwd()
+        try:
+            with tempfile.TemporaryDirectory() as output_dir:
+                os.chdir(output_dir)
+
+                print("BenchmarkRunner::runScale - Timing pass for scale", scale)
+                stage_results, method_results = self.runPass(data_dir, stageNames, False)
+
+                if self.profileMemory:
+                    print("BenchmarkRunner::runScale - Memory pass for scale", scale)
+                    memory_stages, memory_methods = self.runPass(data_dir, stageNames, True)
+                    for stage_name, memory_result in memory_stages.items():
+                        stage_results[stage_name]["peakMB"] = memory_result["peakMB"]
+                    for method_key, memory_result in memory_methods.items():
+                        method_results.setdefault(method_key, dict(memory_result, seconds = None))["peakMB"] = memory_result["peakMB"]
+        finally:
+            os.chdir(previous_dir)
+
+        return {"timestamp": datetime.datetime.now().isoformat(timespec = "seconds"),
+                "commit": self.gitCommit(),
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "seed": self.seed,
+                "scale": scale,
+                "workers": self.workers,
+                "stages": stage_results,
+                "methods": method_results}
+
+    # Commit the code was at, so a slow run can be tracked back to a change
+    def gitCommit(self):
+        try:
+            return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output = True, text = True,
+                                  check = True, cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    # Read the runs we have so far
+    def loadHistory(self):
+        if not os.path.exists(self.historyPath):
+            return []
+
+        with open(self.historyPath) as history_file:
+            return json.load(history_file)
+
+    # Add a run to the history
+    def saveHistory(self, history:list):
+        ######################
+        # history:list -> Every run so far, newest last
+        ######################
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.historyPath)), exist_ok = True)
+        with open(self.historyPath + ".tmp", "w") as history_file:
+            json.dump(history, history_file, indent = 2)
+        os.replace(self.historyPath + ".tmp", self.historyPath)
+
+    # Print the run next to the last one at the same seed and scale
+    def printComparison(self, run:dict, previousRun:dict):
+        ######################
+        # run:dict -> The run we just did
+        # previousRun:dict -> Last run at the same seed and scale, or None
+        ######################
+
+        print("BenchmarkRunner::printComparison - Scale", run["scale"], "at commit", run["commit"],
+              "" if previousRun is None else "vs " + str(previousRun["commit"]) + " from " + previousRun["timestamp"])
+        print("  {:<70} {:>10} {:>10} {:>10} {:>10}".format("Method", "Seconds", "Before", "Peak MB", "Before"))
+
+        previous_methods = {} if previousRun is None else previousRun["methods"]
+        for method_key, result in sorted(run["methods"].items()):
+            before = previous_methods.get(method_key, {})
+            note = ""
+            if result["error"] is not None:
+                note = "  ERROR " + result["error"]
+            elif result["seconds"] and before.get("seconds"):
+                change = (result["seconds"] - before["seconds"]) / before["seconds"]
+                if abs(change) >= CHANGE_THRESHOLD:
+                    note = "  {:+.0%}".format(change)
+
+            print("  {:<70} {:>10} {:>10} {:>10} {:>10}{}".format(method_key, formatNumber(result["seconds"]),
+                  formatNumber(before.get("seconds")), formatNumber(result["peakMB"]), formatNumber(before.get("peakMB")), note))
+
+    # Benchmark each scale, append the runs to the history, and print how they compare to the last ones
+    def run(self, scales:list, stageNames:list):
+        ######################
+        # scales:list -> Scales to benchmark at
+        # stageNames:list -> Stages from main.STAGES to run
+        ######################
+
+        history = self.loadHistory()
+        for scale in scales:
+            run = self.runScale(scale, stageNames)
+
+            previous_run = None
+            for old_run in reversed(history):
+                if old_run["scale"] == scale and old_run["seed"] == self.seed:
+                    previous_run = old_run
+                    break
+
+            self.printComparison(run, previous_run)
+            history.append(run)
+            self.saveHistory(history)
+
+        print("BenchmarkRunner::run - Results written to", self.historyPath)
+        return history
+
+
+# Keep the table lined up when a measurement is missing
+def formatNumber(value):
+    ######################
+    # value -> Number to print, or None
+    ######################
+
+    return "-" if value is None else "{:.3f}".format(value)
+
+
+# Read the command line flags
+def parseArguments():
+    parser = argparse.ArgumentParser(description = "Benchmark the I/ITSEC analytics on generated XCD data")
+    parser.add_argument("--scale", type = int, action = "append", help = "Conference years of data to generate. Repeat for more than one. Defaults to 1")
+    parser.add_argument("--seed", type = int, default = 2024, help = "Seed for the data generator")
+    parser.add_argument("--stage", action = "append", choices = list(main.STAGES), help = "Stage to benchmark. Repeat for more than one. Defaults to all of them")
+    parser.add_argument("--data-root", default = DEFAULT_DATA_ROOT, help = "Directory the generated workbooks are kept in")
+    parser.add_argument("--history", default = DEFAULT_HISTORY_PATH, help = "JSON file the results get appended to")
+    parser.add_argument("--workers", type = int, default = 1, help = "Workers for the stages that take them")
+    parser.add_argument("--no-memory", action = "store_true", help = "Skip the tracemalloc pass")
+    parser.add_argument("--verbose", action = "store_true", help = "Print the analytics output")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parseArguments()
+    BenchmarkRunner(args.seed, args.data_root, args.history, args.workers, not args.no_memory,
+                    args.verbose).run(args.scale or [1], args.stage or list(main.STAGES))
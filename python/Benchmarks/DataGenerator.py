@@ -0,0 +1,344 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains a seeded generator for fake XCD exports so we can measure how the analytics scale
+
+# Include the goodies we are going to need
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Roughly what one conference year looks like at 1x. Scale multiplies the number of submissions
+BASE_COUNTS = {"papers": 600, "tutorials": 80, "pdws": 40, "awardees": 30}
+
+# Bump this when the generated data changes so data written by an older generator gets made again
+GENERATOR_VERSION = 2
+
+# Scales we usually benchmark at
+SCALES = [1, 10, 100]
+
+# Years of paper submissions the scholarship report looks back over
+SCHOLARSHIP_YEARS = [2019, 2020, 2021, 2022, 2023, 2024]
+
+# Files main.py reads and which generator makes each one. Format -> "file name": "role"
+DATA_FILES = {"papers_post_transfer.xlsx": "paperSubmissions",
+              "paper_final_rev.xlsx": "paperSubmissions",
+              "2024_paper_Review_all_done.xlsx": "paperSubmissions",
+              "papers_review_iitsec_102934.xlsx": "paperAbstractReviews",
+              "paper_review_iitsec_2024.xlsx": "paperReviews",
+              "tut.xlsx": "tutorialSubmissions",
+              "tut_final_rev.xlsx": "tutorialSubmissions",
+              "TUT_done.xlsx": "tutorialSubmissions",
+              "tut_review_iitsec_102725.xlsx": "tutorialAbstractReviews",
+              "tut_review_iitsec_2024.xlsx": "tutorialReviews",
+              "pdw.xlsx": "pdwSubmissions",
+              "pdw_post_rev.xlsx": "pdwSubmissions",
+              "PDW_Final_Acceptance_Numbers.xlsx": "pdwSubmissions",
+              "PDW_review_iitsec_063607.xlsx": "pdwReviews",
+              "PDW_review_iitsec_2024.xlsx": "pdwReviews",
+              "Scholarships.xlsx": "awardees"}
+for year in SCHOLARSHIP_YEARS:
+    DATA_FILES[str(year) + "_Paper_Submissions.xlsx"] = "yearlySubmissions"
+
+# The values XCD actually hands us, including the odd spellings and trailing spaces
+SUBCOMMITTEES = ["Education", "Training", "Simulation", "Human Performance Analysis and Engineering",
+                 "Emerging Concepts and Innovative Technologies", "Policy, Standards, Management, and Acquisition"]
+ORG_TYPES = ["Industry", "Academia", "Government", "Military", "Non-Profit"]
+COUNTRIES = ["USA", "United Kingdom", "Germany", "Canada", "Australia", "Netherlands", "France", "Japan", "Korea", "Sweden"]
+ABSTRACT_STATUS = ["Initial Acceptance at Abstract Stage", "Initial Rejection at Abstract Stage"]
+PAPER_STATUS = ["Final Acceptance at Paper Review ", "Final_Acceptance_at_Paper_Review", "Final Rejection at Paper Review",
+                "Final Rejection at Paper Review ", "2023 Best Paper Nominee", None]
+TUT_ABSTRACT_STATUS = ["Provisional Acceptance of Tutorial Proposal", "Rejection of Tutorial Proposal"]
+TUT_PAPER_STATUS = ["Final Acceptance of Tutorial", "Final_Acceptance_of_Tutorial", "Final Rejection of Tutorial"]
+PDW_ABSTRACT_STATUS = ["Initial Acceptance of Professional Development Workshop", "Initial Rejection of Professional Dev Workshop"]
+PDW_PAPER_STATUS = ["Final Accept", "Final_Accept", "Final Reject"]
+VERDICTS = ["Accept", "Reject", "Discuss"]
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+               "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Chris", "Karen"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "O'Brien", "Martinez",
+              "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"]
+LOREM = ("Training effectiveness improved across the cohort with adaptive scenarios and better after action review. "
+         "Simulation fidelity matched the learning objectives though the evaluation sample was small.").split(" ")
+
+# Raw XCD column names. Spaces get turned into underscores by cleanData so these are what main.py's alias maps expect
+INTERNATIONAL_PAPER = " Does the primary or secondary author (first second or both) reside outside the US? "
+INTERNATIONAL_OTHER = "Does the primary or secondary author (first second or both) reside outside the USA?"
+PAST_TUTORIAL = ("Please provide your 2023 tutorial number for reference (if presented in 2023). If you presented this "
+                 "topic at other conference please list conference date location and if published.")
+
+# Define the class and it's methods
+class DataGenerator:
+
+    # Define what it's constructor sets up
+    def __init__(self, seed:int = 2024, scale:int = 1):
+        ######################
+        # seed:int -> Seed for the random numbers so the same seed always gives the same files
+        # scale:int -> How many conference years worth of submissions to put in each file
+        ######################
+
+        self.seed = seed
+        self.scale = scale
+        self.rng = np.random.default_rng(seed)
+
+    # Pick n values, leaving some of them empty like XCD does
+    def pick(self, values:list, n:int, emptyRate:float = 0.0):
+        ######################
+        # values:list -> Values to choose from
+        # n:int -> Number of values we want
+        # emptyRate:float -> Fraction of the values to leave empty
+        ######################
+
+        picked = np.asarray(values, dtype = object)[self.rng.integers(0, len(values), n)]
+        if emptyRate > 0:
+            picked[self.rng.random(n) < emptyRate] = None
+
+        return picked
+
+    # Pick one value per submission and repeat it on each of the submission's rows. XCD never gives one ID two
+    # subcommittees or countries, so anything describing the submission itself comes from here
+    def perSubmission(self, rowIDs, values:list, emptyRate:float = 0.0):
+        ######################
+        # rowIDs -> ID on each row
+        # values:list -> Values to choose from
+        # emptyRate:float -> Fraction of the submissions to leave empty
+        ######################
+
+        submission_ids, positions = np.unique(np.asarray(rowIDs), return_inverse = True)
+        return self.pick(values, len(submission_ids), emptyRate)[positions]
+
+    # Make some free text, with some of it left blank
+    def text(self, n:int, emptyRate:float = 0.2):
+        ######################
+        # n:int -> Number of comments we want
+        # emptyRate:float -> Fraction of the comments to leave empty
+        ######################
+
+        lengths = self.rng.integers(5, 40, n)
+        comments = np.array([" ".join(self.pick(LOREM, length)) for length in lengths], dtype = object)
+        comments[self.rng.random(n) < emptyRate] = None
+
+        return comments
+
+    # Ratings come in as 1-5 with the odd blank
+    def ratings(self, n:int):
+        ######################
+        # n:int -> Number of ratings we want
+        ######################
+
+        ratings = self.rng.integers(1, 6, n).astype(float)
+        ratings[self.rng.random(n) < 0.03] = np.nan
+
+        return ratings
+
+    # One row per author per submission, which is how XCD exports submissions
+    def authorRows(self, ids:np.ndarray):
+        ######################
+        # ids:np.ndarray -> One ID per submission
+        ######################
+
+        return np.repeat(ids, self.rng.integers(1, 4, len(ids)))
+
+    # A few reviews per submission, each from a named reviewer
+    def reviewRows(self, ids:np.ndarray, reviewsPerSubmission:int):
+        ######################
+        # ids:np.ndarray -> One ID per submission
+        # reviewsPerSubmission:int -> Average number of reviews each submission gets
+        ######################
+
+        review_ids = np.repeat(ids, self.rng.integers(max(1, reviewsPerSubmission - 2), reviewsPerSubmission + 3, len(ids)))
+        n = len(review_ids)
+
+        return pd.DataFrame({"ID": review_ids,
+                             "ReviewerLastname": self.pick(LAST_NAMES, n),
+                             "ReviewerFirstname": self.pick(FIRST_NAMES, n)})
+
+    # Submission IDs. XCD starts every ID with the last two digits of the year
+    def submissionIDs(self, count:int, year:int = 2024):
+        ######################
+        # count:int -> Number of submissions
+        # year:int -> Conference year the IDs are for
+        ######################
+
+        return (year % 100) * 100000 + np.arange(count * self.scale)
+
+    # Paper abstract and paper submissions
+    def paperSubmissions(self):
+        ids = self.authorRows(self.submissionIDs(BASE_COUNTS["papers"]))
+        n = len(ids)
+
+        return pd.DataFrame({"ID": ids,
+                             "Title": ["Paper " + str(paper_id) for paper_id in ids],
+                             "Main Subcommittee Category": self.perSubmission(ids, SUBCOMMITTEES),
+                             "Primary Contact - Country": self.perSubmission(ids, COUNTRIES, 0.02),
+                             "How would you label your submission?": self.perSubmission(ids, ORG_TYPES, 0.01),
+                             INTERNATIONAL_PAPER: self.perSubmission(ids, ["Yes", "No"], 0.02),
+                             "Review Status": self.perSubmission(ids, ABSTRACT_STATUS),
+                             "Paper Review Status": self.perSubmission(ids, PAPER_STATUS),
+                             "First Name": self.pick(FIRST_NAMES, n),
+                             "Last Name": self.pick(LAST_NAMES, n)})
+
+    # Reviews of the paper abstracts
+    def paperAbstractReviews(self):
+        df_reviews = self.reviewRows(self.submissionIDs(BASE_COUNTS["papers"]), 4)
+        n = len(df_reviews.index)
+
+        return df_reviews.assign(**{"Title": ["Paper " + str(paper_id) for paper_id in df_reviews["ID"]],
+                                    "Main Subcommittee Category": self.perSubmission(df_reviews["ID"], SUBCOMMITTEES),
+                                    "Would you want to Birddog this Abstract to Paper?": self.pick(["Yes", "No"], n),
+                                    "Substance_Rating": self.ratings(n),
+                                    "Originality_Rating": self.ratings(n),
+                                    "Sales_Pitch": self.pick([0, 1], n),
+                                    "Acceptance": self.pick(VERDICTS, n),
+                                    "Comments for Birddog (for author feedback)": self.text(n),
+                                    "Comments for the Subcommittee (reviewers)": self.text(n)})
+
+    # Reviews of the full papers
+    def paperReviews(self):
+        df_reviews = self.reviewRows(self.submissionIDs(BASE_COUNTS["papers"]), 4)
+        n = len(df_reviews.index)
+
+        return df_reviews.assign(**{"Title": ["Paper " + str(paper_id) for paper_id in df_reviews["ID"]],
+                                    "Birddog": self.perSubmission(df_reviews["ID"], LAST_NAMES),
+                                    "Main Subcommittee Category": self.perSubmission(df_reviews["ID"], SUBCOMMITTEES),
+                                    "Substance_Rating": self.ratings(n),
+                                    "Originality": self.ratings(n),
+                                    "Style / Writing Quality": self.ratings(n),
+                                    "Sales_Pitch": self.pick([0, 1], n),
+                                    "Is this paper a Best Paper Candidate?": self.pick(["Yes", "No"], n),
+                                    "Acceptance": self.pick(VERDICTS, n),
+                                    "Comments for Birddog (for author feedback)": self.text(n),
+                                    "Comments for the Subcommittee (reviewers)": self.text(n)})
+
+    # Tutorial proposals and final tutorials
+    def tutorialSubmissions(self):
+        ids = self.authorRows(self.submissionIDs(BASE_COUNTS["tutorials"]))
+        n = len(ids)
+
+        return pd.DataFrame({"ID": ids,
+                             "Title": ["Tutorial " + str(tutorial_id) for tutorial_id in ids],
+                             "Primary Contact - Country": self.perSubmission(ids, COUNTRIES, 0.02),
+                             "How would you label your submission?": self.perSubmission(ids, ORG_TYPES, 0.01),
+                             INTERNATIONAL_OTHER: self.perSubmission(ids, ["Yes", "No"], 0.02),
+                             "Review Status": self.perSubmission(ids, TUT_ABSTRACT_STATUS),
+                             "Paper Review Status": self.perSubmission(ids, TUT_PAPER_STATUS)})
+
+    # Reviews of the tutorial proposals
+    def tutorialAbstractReviews(self):
+        df_reviews = self.reviewRows(self.submissionIDs(BASE_COUNTS["tutorials"]), 5)
+        n = len(df_reviews.index)
+
+        return df_reviews.assign(**{"Title": ["Tutorial " + str(tutorial_id) for tutorial_id in df_reviews["ID"]],
+                                    "Are you interested in being the Birddog?": self.pick(["Yes", "No"], n),
+                                    INTERNATIONAL_OTHER: self.perSubmission(df_reviews["ID"], ["Yes", "No"]),
+                                    PAST_TUTORIAL: self.perSubmission(df_reviews["ID"], ["N/A", "T2023-01", "T2023-17", None]),
+                                    "Alignment: How well does the tutorial align with the purposes of the tutorial program?": self.ratings(n),
+                                    "Learning Objectives: How clearly does the author describe what participants will learn in the tutorial?": self.ratings(n),
+                                    "Outline & Content Description: Is the tutorial content appropriate and is it clearly described?": self.ratings(n),
+                                    "Does this tutorial proposal appear to include a sales pitch?": self.pick([0, 1], n),
+                                    "How would you label your submission?": self.perSubmission(df_reviews["ID"], ORG_TYPES),
+                                    "Acceptance": self.pick(VERDICTS, n),
+                                    "Comments": self.text(n),
+                                    "Biography": self.text(n, 0.5)})
+
+    # Reviews of the final tutorials
+    def tutorialReviews(self):
+        df_reviews = self.reviewRows(self.submissionIDs(BASE_COUNTS["tutorials"]), 5)
+        n = len(df_reviews.index)
+
+        return df_reviews.assign(**{"Title": ["Tutorial " + str(tutorial_id) for tutorial_id in df_reviews["ID"]],
+                                    "Birddog": self.perSubmission(df_reviews["ID"], LAST_NAMES),
+                                    INTERNATIONAL_OTHER: self.perSubmission(df_reviews["ID"], ["Yes", "No"]),
+                                    PAST_TUTORIAL: self.perSubmission(df_reviews["ID"], ["N/A", "T2023-01", "T2023-17", None]),
+                                    "Content Description: How clear is the tutorial content in the slides and any author-provided notes?": self.ratings(n),
+                                    "Is the amount of content appropriate for 90 minutes?": self.pick(["Seems Right", "Too Long", "Too Short"], n),
+                                    "Are the slides visually clear (readability organization)?": self.ratings(n),
+                                    "Sales Pitch?": self.pick([0, 1], n),
+                                    "Best Tutorial nomination?": self.pick(["Yes", "No"], n),
+                                    "Comments for Birddog": self.text(n),
+                                    "Comments for discussion": self.text(n),
+                                    "How would you label your submission?": self.perSubmission(df_reviews["ID"], ORG_TYPES),
+                                    "Acceptance": self.pick(VERDICTS, n),
+                                    "Comments": self.text(n),
+                                    "Biography": self.text(n, 0.5)})
+
+    # Professional development workshop submissions
+    def pdwSubmissions(self):
+        ids = self.authorRows(self.submissionIDs(BASE_COUNTS["pdws"]))
+        n = len(ids)
+
+        return pd.DataFrame({"ID": ids,
+                             "Title": ["Workshop " + str(pdw_id) for pdw_id in ids],
+                             "Primary Contact - Country": self.perSubmission(ids, COUNTRIES, 0.02),
+                             "How would you label your submission?": self.perSubmission(ids, ORG_TYPES, 0.01),
+                             INTERNATIONAL_OTHER: self.perSubmission(ids, ["Yes", "No"], 0.02),
+                             "Review Status": self.perSubmission(ids, PDW_ABSTRACT_STATUS),
+                             "Paper Review Status": self.perSubmission(ids, PDW_PAPER_STATUS)})
+
+    # Reviews of the workshops. PDW reviewers score acceptance as 1 accept, 2 reject, 3 discuss
+    def pdwReviews(self):
+        df_reviews = self.reviewRows(self.submissionIDs(BASE_COUNTS["pdws"]), 4)
+        n = len(df_reviews.index)
+
+        return df_reviews.assign(**{"AbTitle": ["Workshop " + str(pdw_id) for pdw_id in df_reviews["ID"]],
+                                    "Acceptance": self.pick([1, 2, 3], n),
+                                    "Reviewer Comments": self.text(n),
+                                    "Desired Room Setup": self.perSubmission(df_reviews["ID"], ["Classroom", "Theater", "Rounds", None]),
+                                    "Biography": self.text(n, 0.5)})
+
+    # A year of paper submissions for the scholarship look back. Older years used a different subcommittee column name
+    def yearlySubmissions(self, year:int):
+        ######################
+        # year:int -> Conference year to make
+        ######################
+
+        ids = self.authorRows(self.submissionIDs(BASE_COUNTS["papers"], year))
+        n = len(ids)
+        subcommittee_column = "Subcommittee Category" if year < 2022 else "Main Subcommittee Category"
+
+        return pd.DataFrame({"ID": ids,
+                             subcommittee_column: self.perSubmission(ids, SUBCOMMITTEES),
+                             "Title": ["Paper " + str(paper_id) for paper_id in ids],
+                             "Review Status": self.perSubmission(ids, ABSTRACT_STATUS),
+                             "Paper Review Status": self.perSubmission(ids, ["Final Acceptance at Paper Stage", "Final Rejection at Paper Stage",
+                                                                            "IITSEC Paper Approved", "Best Paper Winner", None]),
+                             "First Name": self.pick(FIRST_NAMES, n),
+                             "Last Name": self.pick(LAST_NAMES, n)})
+
+    # Scholarship awardees. Names come from the same pool as the authors so some of them match up
+    def awardees(self):
+        n = BASE_COUNTS["awardees"] * self.scale
+
+        return pd.DataFrame({"Last Name": self.pick(LAST_NAMES, n),
+                             "First Name": self.pick(FIRST_NAMES, n),
+                             "Scholarship": self.pick(["Ray Sanders", "Modeling and Simulation", "STEM"], n),
+                             "Year": self.pick(SCHOLARSHIP_YEARS, n)})
+
+    # Write every file main.py reads into a data directory. Skips the work if the same seed and scale are already there
+    def writeAll(self, dataDir:str):
+        ######################
+        # dataDir:str -> Directory to write the workbooks to
+        ######################
+
+        os.makedirs(dataDir, exist_ok = True)
+
+        manifest_path = os.path.join(dataDir, "manifest.json")
+        manifest = {"seed": self.seed, "scale": self.scale, "generator": GENERATOR_VERSION, "files": sorted(DATA_FILES)}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as manifest_file:
+                if json.load(manifest_file) == manifest:
+                    print("DataGenerator::writeAll - Data for seed", self.seed, "scale", self.scale, "already in", dataDir)
+                    return dataDir
+
+        for file_name, role in DATA_FILES.items():
+            print("DataGenerator::writeAll - Writing", file_name)
+            if role == "yearlySubmissions":
+                df_data = self.yearlySubmissions(int(file_name[:4]))
+            else:
+                df_data = getattr(self, role)()
+            df_data.to_excel(os.path.join(dataDir, file_name), index = False)
+
+        # Only write the manifest once everything is there so a half finished run gets redone
+        with open(manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        return dataDir
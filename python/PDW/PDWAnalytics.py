@@ -5,21 +5,81 @@
 # Include the goodies we are going to need
 import pandas as pd
 
+# Import our shared helpers
+import Utils.RunSettings as RunSettings
+import Utils.ValueMapper as ValueMapper
+import Utils.DtypeSchema as DtypeSchema
+import Utils.ReviewSummary as ReviewSummary
+import Utils.CountCube as CountCube
+import Utils.XLSXStream as XLSXStream
+import Utils.ColumnProjection as ColumnProjection
+import Utils.Tracer as Tracer
+
+# Review summary recipe used by both the abstract and paper review stages. Format -> (Output_Column, Source_Column, Reducer[, Value])
+PDW_REVIEW_SUMMARY = [("Title", "Title", "first"),
+                      ("Num_Accept", "Acceptance", "count_equals", 1),
+                      ("Num_Reject", "Acceptance", "count_equals", 2),
+                      ("Num_Discuss", "Acceptance", "count_equals", 3),
+                      ("Comments", "Comments", "collect"),
+                      ("Biography", "Biography", "collect"),
+                      ("Room_Type", "Room_Type", "first")]
+
+# Compact column types for the cleaned pdw data
+PDW_DTYPE_SCHEMA = {"Origin_Country" : "category",
+                    "Org_Type" : "category",
+                    "International(Y/N)" : "category",
+                    "PDW_Accept_Reject" : "category",
+                    "Acceptance" : "category",
+                    "Room_Type" : "category"}
+
+# Standard columns each report reads once the aliases are applied, so the loader can skip the rest of the export.
+# The count reports load just their cube and ID columns, see loadCountCube
+PDW_REQUIRED_COLUMNS = {"preAbstractReviewAnalytics" : ["ID"] + ReviewSummary.sourceColumns(PDW_REVIEW_SUMMARY),
+                        "prePaperReviewAnalytics" : ["ID"] + ReviewSummary.sourceColumns(PDW_REVIEW_SUMMARY)}
+
 # Define the class and it's methods
 class PDWAnalytics:
 
     # Define what it's constructor sets up
-    def __init__(self):
+    def __init__(self, settings:RunSettings.RunSettings = None):
+        ######################
+        # settings:RunSettings.RunSettings -> Cache and report options from the command line. None uses the defaults
+        ######################
+
         # Do something
         print("PDWAnalytics::__init__ - Initalizing a TutorialAnalytics object")
+        self.settings = RunSettings.RunSettings() if settings is None else settings
+
+        # Spans for the traced methods and report writes go here. None when tracing is off
+        self.tracer = self.settings.tracer
+
+    # Make the value mapper and dtype schema cleanData uses. Pass them back in to clean several chunks of one file
+    def makeCleaners(self, standard_variables_list:dict):
+        ######################
+        # standard_variables_list:dict -> Dictionary mapping the XCD names to our standard ones
+        ######################
+
+        return ValueMapper.ValueMapper(standard_variables_list), DtypeSchema.DtypeSchema(PDW_DTYPE_SCHEMA)
+
+    # Let the user know which aliases fired and how much memory the compact types saved
+    def printCleaning(self, valueMapper:ValueMapper.ValueMapper, dtypeSchema:DtypeSchema.DtypeSchema):
+        ######################
+        # valueMapper:ValueMapper.ValueMapper -> Value mapper cleanData used
+        # dtypeSchema:DtypeSchema.DtypeSchema -> Dtype schema cleanData used
+        ######################
+
+        print("PDWAnalytics::cleanData - Value aliases applied: ", valueMapper.firedAliases)
+        print("PDWAnalytics::cleanData - " + dtypeSchema.memoryReport())
 
     # Clean the data so it's usable -> TO DO: Add other data cleaning operations we want to do
     # TO DO: Move this and the PaperAnalytics function into a Util class
-    def cleanData(self, df_data:pd, standard_variables_list:list):
+    @Tracer.traced("clean")
+    def cleanData(self, df_data:pd, standard_variables_list:list, cleaners:tuple = None):
         ######################
         # df_data:pd -> DataFrame containing all the paper submissions
         # standard_variables_list:list -> List (it's really a dictionary so need to change this) 
             # storing all the names that we want to change into standard ones
+        # cleaners:tuple -> (ValueMapper, DtypeSchema) shared by the chunks of one file so their diagnostics add up. None makes new ones and prints them
         ######################
         
         # Replace the column names spaces with underscores since XCD likes to oddly throw in spaces
@@ -29,44 +89,99 @@ class PDWAnalytics:
         df_data = df_data.rename(columns = standard_variables_list)
 
         # Replace any XCD values with our standard mapping key here
-        df_data = df_data.replace(standard_variables_list)
+        # Only the status and subcommittee columns carry XCD values, so leave the free text alone
+        value_mapper, dtype_schema = cleaners or self.makeCleaners(standard_variables_list)
+        df_data = value_mapper.apply(df_data)
+
+        # Shrink the dimension and rating columns down to compact types
+        df_data = dtype_schema.apply(df_data)
+
+        # A streamed file prints once after its last chunk instead
+        if cleaners is None:
+            self.printCleaning(value_mapper, dtype_schema)
         
         # return the cleaned data with only the column names we care about
         return df_data
     
     # Load in the file from xcd and return it
-    def loadXCDFile(self, filePath:str, fileName:str):
+    @Tracer.traced("load")
+    def loadXCDFile(self, filePath:str, fileName:str, usecols = None):
         ##########################
         # filePath:str -> string containing the path to the file we want to load in 
         # fileName:str -> string containing the actual file name we want to load 
         # Note: Right now I'm being lazy and passing it in all as one. Need to change
+        # usecols -> Test on the raw header names so only the columns a report needs get loaded. None loads them all
         ##########################
 
         print("PDWAnalytics::loadXCDFile - Loading file from XCD: ", str(filePath + fileName))
 
         # Load in the file and return it
         # TO DO: Add error handling for a non-existant file
-        return pd.read_excel(filePath + fileName)
+        return self.settings.cache.readExcel(filePath + fileName, usecols = usecols)
+
+    # Load in the file from xcd and clean it, reusing the cleaned copy if an analysis session already has it
+    def loadCleanXCDFile(self, filePath:str, listOfColumnAliases:dict, requiredColumns:list = None):
+        ##########################
+        # filePath:str -> string containing the path and name of the file we want to load in
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # requiredColumns:list -> Standard column names the report reads. Only the raw columns that map to these get loaded. None loads them all
+        ##########################
+
+        if self.settings.session is not None:
+            return self.settings.session.getCleanFrame(self, filePath, listOfColumnAliases, requiredColumns)
+
+        usecols = ColumnProjection.rawColumnFilter(requiredColumns, listOfColumnAliases)
+        return self.cleanData(self.loadXCDFile(filePath, "", usecols), listOfColumnAliases)
+
+    # Count the rows and unique submissions for every combination of the given columns
+    @Tracer.traced("load")
+    def loadCountCube(self, filePath:str, listOfColumnAliases:dict, cubeColumns:list, idColumns:list = ["ID"]):
+        ##########################
+        # filePath:str -> string containing the path and name of the file we want to load in
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # cubeColumns:list -> Columns we want to be able to slice the counts by
+        # idColumns:list -> Columns that identify a unique submission
+        ##########################
+
+        # With a SQLite store the counts come out of an indexed GROUP BY and the export is only cleaned when it changed
+        if self.settings.store is not None:
+            return self.settings.store.countCube(self, filePath, listOfColumnAliases, cubeColumns, idColumns)
+
+        count_cube = CountCube.CountCube(cubeColumns, idColumns)
+
+        # The counts only ever read the cube and ID columns, so those are all we load
+        required_columns = cubeColumns + idColumns
+
+        # Streaming is off so load the whole file like normal
+        if self.settings.chunkRows is None:
+            return count_cube.update(self.loadCleanXCDFile(filePath, listOfColumnAliases, required_columns)).result()
+
+        # Clean and count one chunk at a time so only a chunk is ever in memory
+        usecols = ColumnProjection.rawColumnFilter(required_columns, listOfColumnAliases)
+        cleaners = self.makeCleaners(listOfColumnAliases)
+        for df_chunk in XLSXStream.readChunks(filePath, self.settings.chunkRows, usecols = usecols):
+            count_cube.update(self.cleanData(df_chunk, listOfColumnAliases, cleaners))
+        self.printCleaning(*cleaners)
+
+        return count_cube.result()
     
     # Group the submissions by coutnry
-    def groupByCountry(self, df_data:pd, firstColumnName:str, fileName:str):
+    def groupByCountry(self, cube:pd, firstColumnName:str, fileName:str):
         ######################
-        # df_data:pd -> DataFrame containing all the submissions
+        # cube:pd -> Counts from loadCountCube
         # firstColumnName:str -> String that contains the column that we want to group by
         # fileName:str -> String containing the name of the file we want to save out
         ######################
 
-        # Get only the quniqe
-        df_unique_submisisons = df_data.drop_duplicates(subset=["ID"])
-
-        # Group the papers by the submitter category
-        df_data = df_unique_submisisons.groupby(firstColumnName).size()
+        # Count the unique submissions for each value
+        df_data = CountCube.firstIDCounts(cube, firstColumnName)
 
         # Print out the file
-        df_data.to_csv(fileName)
+        Tracer.writeCSV(df_data, fileName, self.tracer)
 
     
     # Run analysis right after abstract review closes to get our submission demographics
+    @Tracer.traced("analytics")
     def postAbstractSubmissionClosureAnalytics(self, filePathToAbstractSubmissionFile:str, 
                                                listOfColumnAliases:list):
         ###############################
@@ -76,17 +191,15 @@ class PDWAnalytics:
         
         print("PDWAnalytics::postAbstractSubmissionClosureAnalytics - Running the analysis for when abstract review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_pdw = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_pdw = self.cleanData(df_pdw, listOfColumnAliases)
+        # Count the submissions in one pass over the file
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases, ["Origin_Country"])
         
         # Create the cross tabs by org
-        self.groupByCountry(df_pdw, "Origin_Country", "PDW_AbstractReview_Crosstabs_Country.csv")
+        self.groupByCountry(cube, "Origin_Country", "PDW_AbstractReview_Crosstabs_Country.csv")
         
    ####MLB Code    
     # Analyze the reviews for the subcommittee
+    @Tracer.traced("analytics")
     def preAbstractReviewAnalytics(self, filePathToAbstractSubmissionFile:str, listOfColumnAliases:dict):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -97,70 +210,21 @@ class PDWAnalytics:
         
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_pdw = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_pdw = self.cleanData(df_pdw, listOfColumnAliases)
+        df_pdw = self.loadCleanXCDFile(filePathToAbstractSubmissionFile, listOfColumnAliases, PDW_REQUIRED_COLUMNS["preAbstractReviewAnalytics"])
 
         print(df_pdw.columns)
         
-        # Grab all the uniqe paper IDs and put them in an array
-        pdw_with_reviews = df_pdw["ID"].unique()
-        
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns = ["ID", "Title", "Num_Accept", "Num_Reject", "Num_Discuss", "Comments", "Biography" , "Room_Type"])
-        
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in pdw_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_record = df_pdw.loc[df_pdw["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_record["Title"].iloc[0]
-
-            # Sum number of accepts
-            num_accepts = df_current_record[df_current_record["Acceptance"] == 1]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_record[df_current_record["Acceptance"] == 2]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_record[df_current_record["Acceptance"] == 3]
-            num_discuss = len(num_discuss.index)
-            
-            # Grab comments
-            list_comments = df_current_record["Comments"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            list_comments = [x for x in list_comments if str(x) != 'nan']
-            
-            # Add author bio to record
-            list_bio = df_current_record["Biography"].tolist()
-            
-            # Filter bios to make sure there are no empty junk values
-            list_bio = [x for x in list_bio if str(x) != 'nan']
-            
-            # Add Type of Room Set-up needed
-            room_type = df_current_record["Room_Type"]
-            
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID" : unique_id,
-                                       "Title" : record_title, 
-                                       "Num_Accept" : num_accepts, "Num_Reject" : num_rejects, "Num_Discuss" : num_discuss, 
-                                       "Comments" : [list_comments], "Biography" : [list_bio], "Room_Type" : room_type}, index = [0])
-            
-            # Add the record
-            df_reviews_summary = pd.concat([df_reviews_summary, df_new_entry], axis = 0)#.reset_index()
+        # Summarize every workshop in one pass
+        review_summary = ReviewSummary.ReviewSummary(PDW_REVIEW_SUMMARY, self.settings.collectShape, tracer = self.tracer)
+        df_reviews_summary = review_summary.summarize(df_pdw)
             
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("PDW_AbstractReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "PDW_AbstractReviewSummary.csv", df_pdw)
  
  ##Resume Stacy's code
 
 # Analyze the reviews for the subcommittee
+    @Tracer.traced("analytics")
     def prePaperReviewAnalytics(self, filePath:str, listOfColumnAliases:dict):
         ###############################
         # filePath:str -> String containing the file path and name to the file we want to load
@@ -171,68 +235,19 @@ class PDWAnalytics:
         
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_pdw = self.loadXCDFile(filePath, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_pdw = self.cleanData(df_pdw, listOfColumnAliases)
+        df_pdw = self.loadCleanXCDFile(filePath, listOfColumnAliases, PDW_REQUIRED_COLUMNS["prePaperReviewAnalytics"])
 
         print(df_pdw.columns)
         
-        # Grab all the uniqe paper IDs and put them in an array
-        pdw_with_reviews = df_pdw["ID"].unique()
-        
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns = ["ID", "Title", "Num_Accept", "Num_Reject", "Num_Discuss", "Comments", "Biography" , "Room_Type"])
-        
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in pdw_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_record = df_pdw.loc[df_pdw["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_record["Title"].iloc[0]
-
-            # Sum number of accepts
-            num_accepts = df_current_record[df_current_record["Acceptance"] == 1]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_record[df_current_record["Acceptance"] == 2]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_record[df_current_record["Acceptance"] == 3]
-            num_discuss = len(num_discuss.index)
-            
-            # Grab comments
-            list_comments = df_current_record["Comments"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            list_comments = [x for x in list_comments if str(x) != 'nan']
-            
-            # Add author bio to record
-            list_bio = df_current_record["Biography"].tolist()
-            
-            # Filter bios to make sure there are no empty junk values
-            list_bio = [x for x in list_bio if str(x) != 'nan']
-            
-            # Add Type of Room Set-up needed
-            room_type = df_current_record["Room_Type"]
-            
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID" : unique_id,
-                                       "Title" : record_title, 
-                                       "Num_Accept" : num_accepts, "Num_Reject" : num_rejects, "Num_Discuss" : num_discuss, 
-                                       "Comments" : [list_comments], "Biography" : [list_bio], "Room_Type" : room_type}, index = [0])
-            
-            # Add the record
-            df_reviews_summary = pd.concat([df_reviews_summary, df_new_entry], axis = 0)#.reset_index()
+        # Summarize every workshop in one pass
+        review_summary = ReviewSummary.ReviewSummary(PDW_REVIEW_SUMMARY, self.settings.collectShape, tracer = self.tracer)
+        df_reviews_summary = review_summary.summarize(df_pdw)
             
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("PDW_PaperReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "PDW_PaperReviewSummary.csv", df_pdw)
  
 
+    @Tracer.traced("analytics")
     def postAbstractReviewAcceptanceAnalytics(self, filePathToAbstractSubmissionFile:str, listOfColumnAliases:list):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -241,22 +256,21 @@ class PDWAnalytics:
         
         print("TutorialAnalytics::postAbstractReviewAcceptanceAnalytics - Running the analysis for when abstract review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_record = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_record = self.cleanData(df_record, listOfColumnAliases)
+        # Count everything we need in one pass over the file
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases,
+                                  ["International(Y/N)", "PDW_Accept_Reject"])
         
         # Create the cross tabs by org
-        #self.twoFactorCrossTab(df_record, "Org_Type", "Tutorial_Accept_Reject", "PDW_AbstractReview_AcceptReject.csv")
+        #self.twoFactorCrossTab(cube, "Org_Type", "Tutorial_Accept_Reject", "PDW_AbstractReview_AcceptReject.csv")
 
         # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
-        cross_tab_international = pd.crosstab(df_record["International(Y/N)"], df_record["PDW_Accept_Reject"])
+        cross_tab_international = CountCube.crossTab(cube, "International(Y/N)", "PDW_Accept_Reject")
 
         # Print out the cross tab file
-        cross_tab_international.to_csv("PDW_Accept_Reject_International.csv")
+        Tracer.writeCSV(cross_tab_international, "PDW_Accept_Reject_International.csv", self.tracer)
 
     # Run the post paper review analytics
+    @Tracer.traced("analytics")
     def postPaperReviewAcceptanceAnalytics(self, filePathToSubmissionFile:str, listOfColumnAliases:list):
         ###############################
         # filePathToSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -265,29 +279,26 @@ class PDWAnalytics:
         
         print("TutorialAnalytics::postPaperReviewAcceptanceAnalytics - Running the analysis for when paper review is done.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_record = self.loadXCDFile(filePathToSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_record = self.cleanData(df_record, listOfColumnAliases)
+        # Count everything we need in one pass over the file
+        cube = self.loadCountCube(filePathToSubmissionFile, listOfColumnAliases, ["Origin_Country", "PDW_Accept_Reject"])
         
         # Let's do a crosstab to see the accept/reject numbers by country
-        cross_tab = pd.crosstab(df_record["Origin_Country"], df_record["PDW_Accept_Reject"])
+        cross_tab = CountCube.crossTab(cube, "Origin_Country", "PDW_Accept_Reject")
 
         # Send this back so we can tabulate Papers, TUT, PDW accepts
         return cross_tab
 
     # Two factor cross tabulation of data
-    def twoFactorCrossTab(self, df_records:pd, firstColumnName:str, secondColumnName:str, fileName:str):
+    def twoFactorCrossTab(self, cube:pd, firstColumnName:str, secondColumnName:str, fileName:str):
         ######################
-        # df_records:pd -> DataFrame containing all the record submissions
+        # cube:pd -> Counts from loadCountCube
         # firstColumnName:str -> String containing the name of the column we want to use for our first cross tab factor
         # secondColumnName:str -> String containing the name of the column we want to use for our second cross tab factor
         # fileName:str -> String containing the name of the file we want to save out
         ######################
         
         # Let's do a crosstab
-        cross_tab = pd.crosstab(df_records[firstColumnName], df_records[secondColumnName])
+        cross_tab = CountCube.crossTab(cube, firstColumnName, secondColumnName)
 
         # Print out the cross tab file
-        cross_tab.to_csv(fileName)
+        Tracer.writeCSV(cross_tab, fileName, self.tracer)
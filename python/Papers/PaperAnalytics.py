@@ -5,6 +5,69 @@
 # Include the goodies we are going to need
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Import our shared helpers
+import Utils.RunSettings as RunSettings
+import Utils.ValueMapper as ValueMapper
+import Utils.DtypeSchema as DtypeSchema
+import Utils.ReviewSummary as ReviewSummary
+import Utils.BirddogRoster as BirddogRoster
+import Utils.ReviewDelta as ReviewDelta
+import Utils.CountCube as CountCube
+import Utils.XLSXStream as XLSXStream
+import Utils.ColumnProjection as ColumnProjection
+import Utils.Tracer as Tracer
+
+# Review summary recipes. Format -> (Output_Column, Source_Column, Reducer[, Value])
+PAPER_ABSTRACT_REVIEW_SUMMARY = [("Title", "Title", "first"),
+                                 ("Birddog_Volunteer", "Volunteer_Name", "join"),
+                                 ("Assigned_Subcommittee", "Assigned_Subcommittee", "first"),
+                                 ("Mean_Substance_Rating", "Substance_Rating", "mean"),
+                                 ("Mean_Originality_Rating", "Originality_Rating", "mean"),
+                                 ("Mean_Sales_Pitch", "Sales_Pitch", "mean"),
+                                 ("Num_Accept", "Acceptance", "count_equals", "Accept"),
+                                 ("Num_Reject", "Acceptance", "count_equals", "Reject"),
+                                 ("Num_Discuss", "Acceptance", "count_equals", "Discuss"),
+                                 ("Comments_for_Birddog", "Comments_for_Birddog", "collect"),
+                                 ("Comments_for_Subcommittee", "Comments_for_Subcommittee", "collect")]
+
+PAPER_PAPER_REVIEW_SUMMARY = [("Title", "Title", "first"),
+                              ("Birddog", "Birddog", "first"),
+                              ("Assigned_Subcommittee", "Assigned_Subcommittee", "first"),
+                              ("Num_Best_Paper_Votes", "Best_Paper_Vote", "count_equals", "Yes"),
+                              ("Mean_Substance_Rating", "Substance_Rating", "mean"),
+                              ("Mean_Originality_Rating", "Originality_Rating", "mean"),
+                              ("Mean_Style_Quality_Rating", "Quality_Rating", "mean"),
+                              ("Mean_Sales_Pitch", "Sales_Pitch", "mean"),
+                              ("Num_Accept", "Acceptance", "count_equals", "Accept"),
+                              ("Num_Reject", "Acceptance", "count_equals", "Reject"),
+                              ("Num_Discuss", "Acceptance", "count_equals", "Discuss"),
+                              ("Comments_for_Birddog", "Comments_for_Birddog", "collect"),
+                              ("Comments_for_Subcommittee", "Comments_for_Subcommittee", "collect")]
+
+# Compact column types for the cleaned paper data
+PAPER_DTYPE_SCHEMA = {"Origin_Country": "category",
+                      "Org_Type": "category",
+                      "Assigned_Subcommittee": "category",
+                      "International(Y/N)": "category",
+                      "Abstract_Accept_Reject": "category",
+                      "Paper_Accept_Reject": "category",
+                      "Acceptance": "category",
+                      "Birddog_Volunteer": "category",
+                      "Best_Paper_Vote": "category",
+                      "Substance_Rating": "float32",
+                      "Originality_Rating": "float32",
+                      "Quality_Rating": "float32",
+                      "Sales_Pitch": "int8"}
+
+# Standard columns each report reads once the aliases are applied, so the loader can skip the rest of the export.
+# The count reports load just their cube and ID columns, see loadCountCube
+PAPER_REQUIRED_COLUMNS = {"postPaperReviewAcceptanceAnalytics": ["ID", "Assigned_Subcommittee", "Org_Type", "International(Y/N)",
+                                                                 "Origin_Country", "Paper_Accept_Reject"],
+                          "preAbstractReviewAnalytics": ["ID", "ReviewerLastname", "ReviewerFirstname", "Birddog_Volunteer"] +
+                                                        ReviewSummary.sourceColumns(PAPER_ABSTRACT_REVIEW_SUMMARY),
+                          "prePaperReviewAnalytics": ReviewDelta.REVIEW_KEY_COLUMNS + ReviewSummary.sourceColumns(PAPER_PAPER_REVIEW_SUMMARY)}
 
 # Define the class and it's methods
 
@@ -12,19 +75,48 @@ import os
 class PaperAnalytics:
 
     # Define what it's constructor sets up
-    def __init__(self):
+    def __init__(self, settings: RunSettings.RunSettings=None):
+        ######################
+        # settings:RunSettings.RunSettings -> Cache and report options from the command line. None uses the defaults
+        ######################
+
         # Do something
         print("PaperAnalytics::__init__ - Initalizing a PaperAnalytics object")
+        self.settings = RunSettings.RunSettings() if settings is None else settings
+
+        # Spans for the traced methods and report writes go here. None when tracing is off
+        self.tracer = self.settings.tracer
+
+    # Make the value mapper and dtype schema cleanData uses. Pass them back in to clean several chunks of one file
+    def makeCleaners(self, standard_variables_list: dict):
+        ######################
+        # standard_variables_list:dict -> Dictionary mapping the XCD names to our standard ones
+        ######################
+
+        return ValueMapper.ValueMapper(standard_variables_list), DtypeSchema.DtypeSchema(PAPER_DTYPE_SCHEMA)
+
+    # Let the user know which aliases fired and how much memory the compact types saved
+    def printCleaning(self, valueMapper: ValueMapper.ValueMapper, dtypeSchema: DtypeSchema.DtypeSchema):
+        ######################
+        # valueMapper:ValueMapper.ValueMapper -> Value mapper cleanData used
+        # dtypeSchema:DtypeSchema.DtypeSchema -> Dtype schema cleanData used
+        ######################
+
+        print("PaperAnalytics::cleanData - Value aliases applied: ", valueMapper.firedAliases)
+        print("PaperAnalytics::cleanData - " + dtypeSchema.memoryReport())
 
     # Clean the data so it's usable -> TO DO: Add other data cleaning operations we want to do
-    def cleanData(self, df_papers: pd, standard_variables_list: list):
+    @Tracer.traced("clean")
+    def cleanData(self, df_papers: pd, standard_variables_list: list, cleaners: tuple=None):
         ######################
         # df_papers:pd -> DataFrame containing all the paper submissions
         # standard_variables_list:list -> List (it's really a dictionary so need to change this) storing all the names that we want to change into standard ones
+        # cleaners:tuple -> (ValueMapper, DtypeSchema) shared by the chunks of one file so their diagnostics add up. None makes new ones and prints them
         ######################
 
-        # Let the user know we are cleaning the data
-        print("PaperAnalytics::cleanData - Cleaning and formatting the paper data from XCD")
+        # Let the user know we are cleaning the data. A streamed file says it once before its first chunk
+        if cleaners is None:
+            print("PaperAnalytics::cleanData - Cleaning and formatting the paper data from XCD")
 
         # Replace the column names spaces with underscores since XCD likes to oddly throw in spaces
         df_papers.columns = df_papers.columns.str.replace(' ', '_')
@@ -33,18 +125,28 @@ class PaperAnalytics:
         df_papers = df_papers.rename(columns=standard_variables_list)
 
         # Replace any XCD values with our standard mapping key here
-        df_papers = df_papers.replace(standard_variables_list)
-        # print(standard_variables_list)
+        # Only the status and subcommittee columns carry XCD values, so leave the free text alone
+        value_mapper, dtype_schema = cleaners or self.makeCleaners(standard_variables_list)
+        df_papers = value_mapper.apply(df_papers)
+
+        # Shrink the dimension and rating columns down to compact types
+        df_papers = dtype_schema.apply(df_papers)
+
+        # A streamed file prints once after its last chunk instead
+        if cleaners is None:
+            self.printCleaning(value_mapper, dtype_schema)
 
         # return the cleaned data with only the column names we care about
         return df_papers
 
     # Load in the file from xcd and return it
-    def loadXCDFile(self, filePath: str, fileName: str):
+    @Tracer.traced("load")
+    def loadXCDFile(self, filePath: str, fileName: str, usecols=None):
         ##########################
         # filePath:str -> string containing the path to the file we want to load in
         # fileName:str -> string containing the actual file name we want to load
         # Note: Right now I'm being lazy adn passing it in all as one. Need to change
+        # usecols -> Test on the raw header names so only the columns a report needs get loaded. None loads them all
         ##########################
 
         print("PaperAnalytics::loadXCDFile - Loading file from XCD: ",
@@ -52,37 +154,44 @@ class PaperAnalytics:
 
         # Load in the file and return it
         # TO DO: Add error handling for a non-existant file
-        return pd.read_excel(filePath + fileName)
+        return self.settings.cache.readExcel(filePath + fileName, usecols=usecols)
+
+    # Load in the file from xcd and clean it, reusing the cleaned copy if an analysis session already has it
+    def loadCleanXCDFile(self, filePath: str, listOfColumnAliases: dict, requiredColumns: list = None):
+        ##########################
+        # filePath:str -> string containing the path and name of the file we want to load in
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # requiredColumns:list -> Standard column names the report reads. Only the raw columns that map to these get loaded. None loads them all
+        ##########################
+
+        if self.settings.session is not None:
+            return self.settings.session.getCleanFrame(self, filePath, listOfColumnAliases, requiredColumns)
+
+        usecols = ColumnProjection.rawColumnFilter(requiredColumns, listOfColumnAliases)
+        return self.cleanData(self.loadXCDFile(filePath, "", usecols), listOfColumnAliases)
 
     # Calculate percentage of submissions by org
-    def percentageSubmissionsByOrgType(self, df_papers: pd, fileName: str):
+    def percentageSubmissionsByOrgType(self, cube: pd, fileName: str):
         ######################
-        # df_papers:pd -> DataFrame containing all the paper submissions
+        # cube:pd -> Counts from loadCountCube, or a slice of them. Needs an Org_Type column
         # fileName:str -> String containing the name of the file we want to save out
         ######################
 
         # Get the total number of unique submissions using ID as the key
-        submission_count = df_papers["ID"].nunique()
-
-        # Get only the unique submissions using ID as the key
-        df_unique_submisisons = df_papers.drop_duplicates(subset=["ID"])
+        submission_count = cube["First_IDs"].sum()
 
-        # Group the papers by the submitter category
-        pie_chart = df_unique_submisisons.groupby("Org_Type").size()
+        # Group the unique submissions by the submitter category
+        pie_chart = CountCube.firstIDCounts(cube, "Org_Type")
 
         # Convert the pie chart numbers to percentages
         pie_chart = pie_chart.divide(submission_count)
 
-        # print("File Name: ", fileName)
-        # print("Pie Chart: ", pie_chart)
-        # cwd = os.getcwd()
-        # print(cwd)
-
         # Save out the results
         # TO DO: Allow user to configure save location
-        pie_chart.to_csv(fileName)
+        Tracer.writeCSV(pie_chart, fileName, self.tracer)
 
     # Run analysis right after abstract review closes to get our submission demographics
+    @Tracer.traced("analytics")
     def postAbstractSubmissionClosureAnalytics(self, filePathToAbstractSubmissionFile: str, listOfColumnAliases: dict):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -91,30 +200,28 @@ class PaperAnalytics:
 
         print("PaperAnalytics::postAbstractSubmissionClosure - Running the analysis for when abstract review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
+        # Count everything we need in one pass over the file
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_papers = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_papers = self.cleanData(df_papers, listOfColumnAliases)
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases,
+                                  ["Assigned_Subcommittee", "Org_Type", "International(Y/N)", "Origin_Country"], ["ID"])
 
         # Create the cross tabs by org
-        self.twoFactorCrossTab(df_papers, "Assigned_Subcommittee",
-                               "Org_Type", "Papers_AbstractReview_Crosstabs_OrgType.csv")
+        self.twoFactorCrossTab(cube, "Assigned_Subcommittee", "Org_Type",
+                               "Papers_AbstractReview_Crosstabs_OrgType.csv")
 
         # Compute the percentage submissions by org type
-        self.percentageSubmissionsByOrgType(
-            df_papers, "Papers_AbstractReview_PieChart.csv")
+        self.percentageSubmissionsByOrgType(cube, "Papers_AbstractReview_PieChart.csv")
 
         # Compute the number of international submissions by subcommittee
-        self.twoFactorCrossTab(df_papers, "International(Y/N)",
-                               'Assigned_Subcommittee', "Papers_AbstractReview_Crosstabs_Intl.csv")
+        self.twoFactorCrossTab(cube, "International(Y/N)", "Assigned_Subcommittee",
+                               "Papers_AbstractReview_Crosstabs_Intl.csv")
 
         # Compute where the authors are from for each subcommittee
-        self.twoFactorCrossTab(df_papers, 'Origin_Country', 'Assigned_Subcommittee',
+        self.twoFactorCrossTab(cube, "Origin_Country", "Assigned_Subcommittee",
                                "Papers_AbstractReview_Crosstabs_Country.csv")
 
     # Analyze the acceptance numbers post abstract review
+    @Tracer.traced("analytics")
     def postAbstractReviewAcceptanceAnalytics(self, filePathToAbstractSubmissionFile: str, listOfColumnAliases: dict):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -123,130 +230,89 @@ class PaperAnalytics:
 
         print("PaperAnalytics::postAbstractReviewAcceptanceAnalytics - Running the analysis for post abstract review.......")
 
-        # Load in the excel file into a data frame so we can start working with it
+        # Count everything we need in one pass, then slice the reports out of the counts
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_records = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_records = self.cleanData(df_records, listOfColumnAliases)
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases,
+                                  ["Assigned_Subcommittee", "Org_Type", "International(Y/N)", "Abstract_Accept_Reject"],
+                                  ["ID", "Abstract_Accept_Reject"])
 
         # Figure out how many papers each subcommittee accepted
-        self.twoFactorCrossTab(df_records, "Assigned_Subcommittee", "Abstract_Accept_Reject",
+        self.twoFactorCrossTab(cube, "Assigned_Subcommittee", "Abstract_Accept_Reject",
                                "Papers_PostAbstractReview_Subcommittee_AcceptReject_Stats.csv")
 
-        # Percentage of accepts by org type
-        df_accepts = df_records[df_records["Abstract_Accept_Reject"]
-                                == "Abstract_Accepted"]
-        self.percentageSubmissionsByOrgType(
-            df_accepts, "Papers_PostAbstractReview_OrgType_TotalAccepts.csv")
-
-        # Percentage of rejects by org type
-        df_rejects = df_records[df_records["Abstract_Accept_Reject"]
-                                == "Abstract_Rejected"]
-        self.percentageSubmissionsByOrgType(
-            df_rejects, "Papers_PostAbstractReview_OrgType_TotalRejects.csv")
+        # Percentage of accepts and rejects by org type
+        self.percentageSubmissionsByOrgType(CountCube.sliceCube(cube, "Abstract_Accept_Reject", "Abstract_Accepted"),
+                                            "Papers_PostAbstractReview_OrgType_TotalAccepts.csv")
+        self.percentageSubmissionsByOrgType(CountCube.sliceCube(cube, "Abstract_Accept_Reject", "Abstract_Rejected"),
+                                            "Papers_PostAbstractReview_OrgType_TotalRejects.csv")
 
         # Figure out how many we rejected or accepted from each org type
-        for current_subcommittee in df_records["Assigned_Subcommittee"].unique():
+        for current_subcommittee in cube.index.get_level_values("Assigned_Subcommittee").unique():
 
-            # Grab the data for the current subcommitee
-            df_current_subcommittee = df_records[df_records["Assigned_Subcommittee"] == str(
-                current_subcommittee)]
+            # Grab the counts for the current subcommitee
+            cube_current_subcommittee = CountCube.sliceCube(cube, "Assigned_Subcommittee", current_subcommittee)
 
             # Let's do a crosstab by org type and accept reject
-            cross_tab_orgType = pd.crosstab(
-                df_current_subcommittee["Org_Type"], df_current_subcommittee["Abstract_Accept_Reject"])
-
             # TO DO: Add in the percentage accept
-
-            # Print out the cross tab file
-            cross_tab_orgType.to_csv(
-                "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv")
+            self.twoFactorCrossTab(cube_current_subcommittee, "Org_Type", "Abstract_Accept_Reject",
+                                   "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv")
 
             # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
-            cross_tab_international = pd.crosstab(
-                df_current_subcommittee["International(Y/N)"], df_current_subcommittee["Abstract_Accept_Reject"])
-
-            # Print out the cross tab file
-            cross_tab_international.to_csv(
-                "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv")
+            self.twoFactorCrossTab(cube_current_subcommittee, "International(Y/N)", "Abstract_Accept_Reject",
+                                   "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv")
 
     # Analyze the acceptance numbers post abstract review
-    def postPaperReviewAcceptanceAnalytics(self, filePath: str, listOfColumnAliases: dict):
+    @Tracer.traced("analytics")
+    def postPaperReviewAcceptanceAnalytics(self, filePath: str, listOfColumnAliases: dict, maxWorkers: int = None):
         ###############################
         # filePath:str -> String containing the file path and name to the file we want to load
         # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # maxWorkers:int -> Number of threads used to build the per-subcommittee reports. None or 1 runs them one after another
         ##############################
 
         print("PaperAnalytics::postPaperReviewAcceptanceAnalytics - Running the analysis for post paper review.......")
 
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_records = self.loadXCDFile(filePath, "")
+        df_records = self.loadCleanXCDFile(filePath, listOfColumnAliases, PAPER_REQUIRED_COLUMNS["postPaperReviewAcceptanceAnalytics"])
 
-        # Clean the data and standardize the delimiters so we can use
-        df_records = self.cleanData(df_records, listOfColumnAliases)
+        # Count the overall numbers in one pass
+        cube = CountCube.CountCube(["Assigned_Subcommittee", "Org_Type", "Paper_Accept_Reject"],
+                                   ["ID", "Paper_Accept_Reject"]).update(df_records).result()
 
         # Figure out how many papers each subcommittee accepted
-        self.twoFactorCrossTab(df_records, "Assigned_Subcommittee", "Paper_Accept_Reject",
+        self.twoFactorCrossTab(cube, "Assigned_Subcommittee", "Paper_Accept_Reject",
                                "Papers_PostPaperReview_Subcommittee_AcceptReject_Stats.csv")
 
-        # Percentage of accepts by org type
-        df_accepts = df_records[df_records["Paper_Accept_Reject"]
-                                == "Paper_Accepted"]
-        print(df_accepts)
-        self.percentageSubmissionsByOrgType(
-            df_accepts, "Papers_PostPaperReview_OrgType_TotalAccepts.csv")
-
-        # Percentage of rejects by org type
-        df_rejects = df_records[df_records["Paper_Accept_Reject"]
-                                == "Paper_Rejected"]
-        self.percentageSubmissionsByOrgType(
-            df_rejects, "Papers_PostPaperReview_OrgType_TotalRejects.csv")
-
-        # Figure out how many we rejected or accepted from each org type
-        for current_subcommittee in df_records["Assigned_Subcommittee"].unique():
-
-            # Grab the data for the current subcommitee
-            df_current_subcommittee = df_records[df_records["Assigned_Subcommittee"] == str(
-                current_subcommittee)]
-
-            # Let's do a crosstab by org type and accept reject
-            cross_tab_orgType = pd.crosstab(
-                df_current_subcommittee["Org_Type"], df_current_subcommittee["Paper_Accept_Reject"])
-
-            # TO DO: Add in the percentage accept
-
-            # Print out the cross tab file
-            cross_tab_orgType.to_csv(
-                "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv")
-
-            # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
-            cross_tab_international = pd.crosstab(
-                df_current_subcommittee["International(Y/N)"], df_current_subcommittee["Paper_Accept_Reject"])
-
-            # Print out the cross tab file
-            cross_tab_international.to_csv(
-                "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv")
+        # Percentage of accepts and rejects by org type
+        self.percentageSubmissionsByOrgType(CountCube.sliceCube(cube, "Paper_Accept_Reject", "Paper_Accepted"),
+                                            "Papers_PostPaperReview_OrgType_TotalAccepts.csv")
+        self.percentageSubmissionsByOrgType(CountCube.sliceCube(cube, "Paper_Accept_Reject", "Paper_Rejected"),
+                                            "Papers_PostPaperReview_OrgType_TotalRejects.csv")
+
+        # Split the records up by subcommittee once. Subcommittees with no rows (like empty cells) get an empty slice
+        partitions = dict(tuple(df_records.groupby("Assigned_Subcommittee", observed=True, sort=False)))
+        subcommittees = df_records["Assigned_Subcommittee"].unique()
+        slices = [partitions.get(current_subcommittee, df_records.iloc[0:0]) for current_subcommittee in subcommittees]
+
+        # Figure out how many we rejected or accepted from each org type, one subcommittee per task.
+        # Serial unless asked, the crosstabs and csv writes mostly hold the GIL so threads rarely pay off
+        if maxWorkers is not None and maxWorkers > 1:
+            with ThreadPoolExecutor(max_workers=min(maxWorkers, len(subcommittees))) as executor:
+                reports = list(executor.map(self.subcommitteePaperReviewReport, subcommittees, slices))
+        else:
+            reports = list(map(self.subcommitteePaperReviewReport, subcommittees, slices))
 
         # Make a summary table for the final accept/rejects by country for each subcommittee
-        df_records_accepts = df_records[df_records["Paper_Accept_Reject"]
-                                        == "Paper_Accepted"]
-        df_records_rejects = df_records[df_records["Paper_Accept_Reject"]
-                                        == "Paper_Rejected"]
-
-        # Let's do a crosstab to see the accepted numbers by country by committee
-        cross_tab_accepted = pd.crosstab(
-            df_records_accepts["Origin_Country"], df_records_accepts["Assigned_Subcommittee"])
-
-        # Add the column for the toal
+        cross_tab_accepted = self.countryCrossTab(
+            {current_subcommittee: accepted for current_subcommittee, (accepted, _) in zip(subcommittees, reports)
+             if len(accepted) > 0})
+        cross_tab_rejected = self.countryCrossTab(
+            {current_subcommittee: rejected for current_subcommittee, (_, rejected) in zip(subcommittees, reports)
+             if len(rejected) > 0})
+
+        # Add the columns for the toals
         cross_tab_accepted['Paper_Accepted'] = cross_tab_accepted.sum(axis=1)
-
-        # Let's figure out the number of rejected
-        cross_tab_rejected = pd.crosstab(
-            df_records_rejects["Origin_Country"], df_records_rejects["Assigned_Subcommittee"])
-
-        # Add the column for the toal
         cross_tab_rejected["Paper_Rejected"] = cross_tab_rejected.sum(axis=1)
 
         # Combine the dataframes so we can get the visual we need
@@ -257,7 +323,44 @@ class PaperAnalytics:
         # Send this back so we can tabulate Papers, TUT, PDW accepts
         return combined
 
+    # Write the reports for one subcommittee and hand back its accepted and rejected counts by country
+    def subcommitteePaperReviewReport(self, current_subcommittee, df_current_subcommittee: pd):
+        ######################
+        # current_subcommittee -> Name of the subcommittee, used in the file names
+        # df_current_subcommittee:pd -> The records for just this subcommittee
+        ######################
+
+        # Let's do a crosstab by org type and accept reject
+        # TO DO: Add in the percentage accept
+        Tracer.writeCSV(pd.crosstab(df_current_subcommittee["Org_Type"], df_current_subcommittee["Paper_Accept_Reject"]),
+                        "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv", self.tracer)
+
+        # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
+        Tracer.writeCSV(pd.crosstab(df_current_subcommittee["International(Y/N)"], df_current_subcommittee["Paper_Accept_Reject"]),
+                        "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv", self.tracer)
+
+        # Count the accepted and rejected papers by country for the summary table
+        countries = df_current_subcommittee["Origin_Country"]
+        status = df_current_subcommittee["Paper_Accept_Reject"]
+        accepted = countries[status == "Paper_Accepted"].value_counts(sort=False)
+        rejected = countries[status == "Paper_Rejected"].value_counts(sort=False)
+
+        # Categorical columns list every country, so only keep the ones we actually saw
+        return accepted[accepted > 0], rejected[rejected > 0]
+
+    # Put the per-subcommittee country counts together into a country by subcommittee cross tab
+    def countryCrossTab(self, countsBySubcommittee: dict):
+        ######################
+        # countsBySubcommittee:dict -> Subcommittee -> counts by Origin_Country
+        ######################
+
+        cross_tab = pd.DataFrame(countsBySubcommittee).fillna(0).astype("int64")
+        cross_tab = cross_tab[sorted(cross_tab.columns)].sort_index()
+
+        return cross_tab.rename_axis(index="Origin_Country", columns="Assigned_Subcommittee")
+
     # Analyze the reviews for the subcommittee
+    @Tracer.traced("analytics")
     def preAbstractReviewAnalytics(self, filePathToAbstractSubmissionFile: str, listOfColumnAliases: dict):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -268,103 +371,25 @@ class PaperAnalytics:
 
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_papers = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_papers = self.cleanData(df_papers, listOfColumnAliases)
-
-        # Grab all the uniqe paper IDs and put them in an array
-        papers_with_reviews = df_papers["ID"].unique()
-
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns=["ID", "Title", "Birddog_Volunteer", "Assigned_Subcommittee",
-                                                   "Mean_Substance_Rating", "Mean_Originality_Rating",
-                                                   "Mean_Sales_Pitch", "Num_Accept", "Num_Reject", "Num_Discuss",
-                                                   "Comments_for_Birddog", "Comments_for_Subcommittee"])
-
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in papers_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_paper = df_papers.loc[df_papers["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_paper["Title"].iloc[1]
-
-            # Grab the list of birddog volunteers. This grabs all the records for a paper that someone responded yes to the birddog question
-            birddog_volunteers_list = df_current_paper[df_current_paper["Birddog_Volunteer"] == "Yes"]
-
-            # Combine the first and last name into a new column called "Combined_Name" so we can use it
-            birddog_volunteers_list["Combined_Name"] = birddog_volunteers_list["ReviewerLastname"] + \
-                ',' + birddog_volunteers_list["ReviewerFirstname"]
-
-            # Change the data from a dataframe to a list of strings without the index number
-            birddog_volunteers_list = birddog_volunteers_list["Combined_Name"].to_string(
-                index=False)
-
-            # Grab the subcommittee assignment
-            assigned_subcommittee = df_current_paper["Assigned_Subcommittee"].iloc[1]
-
-            # Calculate the mean substance rating
-            mean_substance = round(
-                df_current_paper.loc[:, "Substance_Rating"].mean(), 2)
+        df_papers = self.loadCleanXCDFile(filePathToAbstractSubmissionFile, listOfColumnAliases, PAPER_REQUIRED_COLUMNS["preAbstractReviewAnalytics"])
 
-            # Calculate the mean org rating
-            mean_orig = round(
-                df_current_paper.loc[:, "Originality_Rating"].mean(), 2)
+        # Combine the first and last name of everyone that said yes to the birddog question so we can list them per paper
+        df_papers = df_papers.assign(Volunteer_Name=BirddogRoster.volunteerNames(df_papers))
 
-            # Calculate mean sales pitch
-            mean_sales_pitch = round(
-                df_current_paper.loc[:, "Sales_Pitch"].mean(), 2)
-
-            # Sum number of accepts
-            num_accepts = df_current_paper[df_current_paper["Acceptance"] == "Accept"]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_paper[df_current_paper["Acceptance"] == "Reject"]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_paper[df_current_paper["Acceptance"] == "Discuss"]
-            num_discuss = len(num_discuss.index)
-
-            # Grab comments for birddog
-            list_comments_to_birddog = df_current_paper["Comments_for_Birddog"].tolist(
-            )
-
-            # Filter through list to make sure there are no empty junk values
-            list_comments_to_birddog = [
-                x for x in list_comments_to_birddog if str(x) != 'nan']
-
-            # Grab comments to subcommittee
-            list_comments_to_subcommittee = df_current_paper["Comments_for_Subcommittee"].tolist(
-            )
-
-            # Filter through list to make sure there are no empty junk values
-            list_comments_to_subcommittee = [
-                x for x in list_comments_to_subcommittee if str(x) != 'nan']
-
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID": unique_id,
-                                         "Title": record_title, "Birddog_Volunteer": [birddog_volunteers_list],
-                                         "Assigned_Subcommittee": assigned_subcommittee,
-                                         "Mean_Substance_Rating": mean_substance,
-                                         "Mean_Originality_Rating": mean_orig,
-                                         "Mean_Sales_Pitch": mean_sales_pitch,
-                                         "Num_Accept": num_accepts, "Num_Reject": num_rejects, "Num_Discuss": num_discuss,
-                                         "Comments_for_Birddog": [list_comments_to_birddog],
-                                         "Comments_for_Subcommittee": [list_comments_to_subcommittee]}, index=[0])
-            # Add the record
-            df_reviews_summary = pd.concat(
-                [df_reviews_summary, df_new_entry], axis=0)  # .reset_index()
+        # Summarize every paper in one pass
+        review_summary = ReviewSummary.ReviewSummary(PAPER_ABSTRACT_REVIEW_SUMMARY, self.settings.collectShape, tracer=self.tracer)
+        df_reviews_summary = review_summary.summarize(df_papers)
 
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("Papers_AbstractReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "Papers_AbstractReviewSummary.csv", df_papers)
+
+        # Save the volunteers the other way around so the chairs can even out who birddogs what
+        Tracer.writeCSV(BirddogRoster.reviewerIndex(df_papers, tracer=self.tracer), "Papers_BirddogVolunteers.csv", self.tracer)
 
      # Analyze the reviews for the subcommittee
 
     # Analyze reviews for the subcommittee before paper review
+    @Tracer.traced("analytics")
     def prePaperReviewAnalytics(self, filePath: str, listOfColumnAliases: dict):
         ###############################
         # filePath:str -> String containing the file path and name to the file we want to load
@@ -375,114 +400,62 @@ class PaperAnalytics:
 
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_papers = self.loadXCDFile(filePath, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_papers = self.cleanData(df_papers, listOfColumnAliases)
-
-        # Grab all the uniqe paper IDs and put them in an array
-        papers_with_reviews = df_papers["ID"].unique()
-
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns=["ID", "Title", "Birddog", "Assigned_Subcommittee", "Num_Best_Paper_Votes",
-                                                   "Mean_Substance_Rating", "Mean_Originality_Rating", "Mean_Style_Quality_Rating",
-                                                   "Mean_Sales_Pitch", "Num_Accept", "Num_Reject", "Num_Discuss",
-                                                   "Comments_for_Birddog", "Comments_for_Subcommittee"])
-
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in papers_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_paper = df_papers.loc[df_papers["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_paper["Title"].iloc[0]
-
-            # Grab birddog
-            birddog = df_current_paper["Birddog"].iloc[0]
-
-            # Grab the subcommittee assignment
-            assigned_subcommittee = df_current_paper["Assigned_Subcommittee"].iloc[0]
-
-            # Calculate the mean substance rating
-            mean_substance = round(
-                df_current_paper.loc[:, "Substance_Rating"].mean(), 2)
-
-            # Calculate the mean style quality rating
-            mean_style_quality = round(
-                df_current_paper.loc[:, "Quality_Rating"].mean(), 2)
-
-            # Calculate the mean org rating
-            mean_orig = round(
-                df_current_paper.loc[:, "Originality_Rating"].mean(), 2)
-
-            # Calculate mean sales pitch
-            mean_sales_pitch = round(
-                df_current_paper.loc[:, "Sales_Pitch"].mean(), 2)
-
-            # Sum number of accepts
-            num_accepts = df_current_paper[df_current_paper["Acceptance"] == "Accept"]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_paper[df_current_paper["Acceptance"] == "Reject"]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_paper[df_current_paper["Acceptance"] == "Discuss"]
-            num_discuss = len(num_discuss.index)
-
-            # Number of best paper votes
-            num_best_paper_votes = df_current_paper[df_current_paper["Best_Paper_Vote"] == "Yes"]
-            num_best_paper_votes = len(num_best_paper_votes.index)
-
-            # Grab comments for birddog
-            list_comments_to_birddog = df_current_paper["Comments_for_Birddog"].tolist(
-            )
-
-            # Filter through list to make sure there are no empty junk values
-            list_comments_to_birddog = [
-                x for x in list_comments_to_birddog if str(x) != 'nan']
-
-            # Grab comments to subcommittee
-            list_comments_to_subcommittee = df_current_paper["Comments_for_Subcommittee"].tolist(
-            )
-
-            # Filter through list to make sure there are no empty junk values
-            list_comments_to_subcommittee = [
-                x for x in list_comments_to_subcommittee if str(x) != 'nan']
-
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID": unique_id,
-                                         "Title": record_title, "Birddog": birddog,
-                                         "Assigned_Subcommittee": assigned_subcommittee,
-                                         "Mean_Substance_Rating": mean_substance,
-                                         "Mean_Originality_Rating": mean_orig,
-                                         "Mean_Sales_Pitch": mean_sales_pitch,
-                                         "Mean_Style_Quality_Rating": mean_style_quality,
-                                         "Num_Accept": num_accepts, "Num_Reject": num_rejects, "Num_Discuss": num_discuss,
-                                         "Num_Best_Paper_Votes": num_best_paper_votes,
-                                         "Comments_for_Birddog": [list_comments_to_birddog],
-                                         "Comments_for_Subcommittee": [list_comments_to_subcommittee]}, index=[0])
-            # Add the record
-            df_reviews_summary = pd.concat(
-                [df_reviews_summary, df_new_entry], axis=0)  # .reset_index()
+        df_papers = self.loadCleanXCDFile(filePath, listOfColumnAliases, PAPER_REQUIRED_COLUMNS["prePaperReviewAnalytics"])
+
+        # Summarize every paper in one pass, or only the ones with new reviews when delta mode is on
+        review_summary = ReviewSummary.ReviewSummary(PAPER_PAPER_REVIEW_SUMMARY, self.settings.collectShape, tracer=self.tracer)
+        if self.settings.deltaStatePath is None:
+            df_reviews_summary = review_summary.summarize(df_papers)
+        else:
+            df_reviews_summary = ReviewDelta.ReviewDelta(self.settings.deltaStatePath, review_summary).summarize(df_papers)
 
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("Papers_PaperReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "Papers_PaperReviewSummary.csv", df_papers)
 
     # Two factor cross tabulation of data
-    def twoFactorCrossTab(self, df_papers: pd, firstColumnName: str, secondColumnName: str, fileName: str):
+    def twoFactorCrossTab(self, cube: pd, firstColumnName: str, secondColumnName: str, fileName: str):
         ######################
-        # df_papers:pd -> DataFrame containing all the paper submissions
+        # cube:pd -> Counts from loadCountCube, or a slice of them
         # firstColumnName:str -> String containing the name of the column we want to use for our first cross tab factor
         # secondColumnName:str -> String containing the name of the column we want to use for our second cross tab factor
         # fileName:str -> String containing the name of the file we want to save out
         ######################
 
         # Let's do a crosstab
-        cross_tab = pd.crosstab(
-            df_papers[firstColumnName], df_papers[secondColumnName])
+        cross_tab = CountCube.crossTab(cube, firstColumnName, secondColumnName)
 
         # Print out the cross tab file
-        cross_tab.to_csv(fileName)
+        Tracer.writeCSV(cross_tab, fileName, self.tracer)
+
+    # Count the rows and unique submissions for every combination of the given columns
+    @Tracer.traced("load")
+    def loadCountCube(self, filePath: str, listOfColumnAliases: dict, cubeColumns: list, idColumns: list):
+        ######################
+        # filePath:str -> String containing the file path and name to the file we want to load
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # cubeColumns:list -> Columns we want to be able to slice the counts by
+        # idColumns:list -> Columns that identify a unique submission for the percentage reports
+        ######################
+
+        # With a SQLite store the counts come out of an indexed GROUP BY and the export is only cleaned when it changed
+        if self.settings.store is not None:
+            return self.settings.store.countCube(self, filePath, listOfColumnAliases, cubeColumns, idColumns)
+
+        count_cube = CountCube.CountCube(cubeColumns, idColumns)
+
+        # The counts only ever read the cube and ID columns, so those are all we load
+        required_columns = cubeColumns + idColumns
+
+        # Streaming is off so load the whole file like normal
+        if self.settings.chunkRows is None:
+            return count_cube.update(self.loadCleanXCDFile(filePath, listOfColumnAliases, required_columns)).result()
+
+        # Clean and count one chunk at a time so only a chunk is ever in memory
+        usecols = ColumnProjection.rawColumnFilter(required_columns, listOfColumnAliases)
+        cleaners = self.makeCleaners(listOfColumnAliases)
+        print("PaperAnalytics::cleanData - Cleaning and formatting the paper data from XCD")
+        for df_chunk in XLSXStream.readChunks(filePath, self.settings.chunkRows, usecols=usecols):
+            count_cube.update(self.cleanData(df_chunk, listOfColumnAliases, cleaners))
+        self.printCleaning(*cleaners)
+
+        return count_cube.result()
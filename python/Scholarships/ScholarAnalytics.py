@@ -3,130 +3,210 @@
 # Description: This program cleans, formats, and analyzes Scholarship winners to track submissions
 
 # Import all the external goodies we need for our analysis
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Import our shared helpers
+import Utils.XCDCache as XCDCache
+import Utils.RunSettings as RunSettings
+import Utils.ValueMapper as ValueMapper
+import Utils.DtypeSchema as DtypeSchema
+import Utils.Tracer as Tracer
+import Utils.ColumnProjection as ColumnProjection
+import Utils.StageMemo as StageMemo
+
+#Compact column types for the Paper Submissions DF
+SCHOLAR_DTYPE_SCHEMA = {"SubK" : "category", "Ab_status" : "category", "Paper_status" : "category"}
+
+#Standard columns the yearly Paper files and the awardee file get read for. Everything else is skipped at load time
+SCHOLAR_PAPER_COLUMNS = ["ID", "Subcommittee", "Title", "Abstract_Accept", "Paper_Accept", "First_Name", "Last_Name"]
+SCHOLAR_AWARDEE_COLUMNS = ["First_Name", "Last_Name", "Scholarship", "Year"]
+
+#Load one year's Paper file in a worker process with a cache set up like the parent's. Hands back the frame and the cache hits and misses it took
+def loadPaperFileInWorker(filename:str, standard_variables_list:list, cacheSettings:dict):
+	######################
+	# filename:str -> Path to one year's paper submission file
+	# standard_variables_list:list -> Dictionary mapping the XCD names to our standard ones
+	# cacheSettings:dict -> Settings from the parent's XCDCache.settings
+	######################
+	
+	cache = XCDCache.XCDCache(**cacheSettings)
+	df_year = ScholarAnalytics(RunSettings.RunSettings(cache)).loadPaperFile(filename, standard_variables_list)
+	return df_year, cache.hits, cache.misses
 
 class ScholarAnalytics:
 	
 	# Define what it's constructor sets up
-	def __init__(self):
+	def __init__(self, settings:RunSettings.RunSettings = None):
+		######################
+		# settings:RunSettings.RunSettings -> Cache and report options from the command line. None uses the defaults
+		######################
+		
 	# Do something
 		print("ScholarAnalytics::__init__ - Starting Scholarship Analytics object")
+		self.settings = RunSettings.RunSettings() if settings is None else settings
+
+		# Spans for the traced methods and report writes go here. None when tracing is off
+		self.tracer = self.settings.tracer
+	
+	#Load every year's Paper file and stack them into the Paper Submissions DF
+	@Tracer.traced("load")
+	def loadPaperSubmissions(self, path_to_papers:list, standard_variables_list:list, workers:int = None):
+		######################
+		# path_to_papers:list -> List of the yearly paper submission files
+		# standard_variables_list:list -> Dictionary mapping the XCD names to our standard ones
+		# workers:int -> Number of processes parsing files at the same time. None uses every core, 1 loads them one after another
+		######################
+		
+		if workers is None:
+			workers = os.cpu_count() or 1
+		workers = min(workers, len(path_to_papers))
+		
+		#The worker processes can't tell the stage memo what they read, so note the files here
+		for filename in path_to_papers:
+			StageMemo.recordInput(filename)
+		
+		#Load each file on its own. Parsing excel is CPU bound so each year gets its own process
+		if workers > 1:
+			print("ScholarAnalytics::loadPaperSubmissions - Loading", len(path_to_papers), "files with", workers, "worker processes")
+			with ProcessPoolExecutor(max_workers = workers) as executor:
+				results = list(executor.map(loadPaperFileInWorker, path_to_papers, repeat(standard_variables_list), repeat(self.settings.cache.settings())))
+			
+			#Fold the workers' cache hits and misses into ours so printStats covers every file
+			yearly_frames = [df_year for df_year, _, _ in results]
+			self.settings.cache.hits += sum(hits for _, hits, _ in results)
+			self.settings.cache.misses += sum(misses for _, _, misses in results)
+		else:
+			yearly_frames = [self.loadPaperFile(filename, standard_variables_list) for filename in path_to_papers]
+		
+		#Put all the years together in a single concat
+		return pd.concat(yearly_frames, axis = 0, ignore_index = True)
+	
+	#Load a single year's Paper file and project it down to the Paper Submissions DF columns
+	@Tracer.traced("load")
+	def loadPaperFile(self, filename:str, standard_variables_list:list):
+		######################
+		# filename:str -> Path to one year's paper submission file
+		# standard_variables_list:list -> Dictionary mapping the XCD names to our standard ones
+		######################
+		
+		#Load file data into Data DF. Only the columns that map to the Paper Submissions DF are read
+		df_data = self.settings.cache.readExcel(filename, usecols = ColumnProjection.rawColumnFilter(SCHOLAR_PAPER_COLUMNS, standard_variables_list))
+
+		#Clean the data
+		#Remove pesky white space
+		df_data.columns = df_data.columns.str.replace(' ', '_')
+	
+		#Replace column names with variable dictionary
+		df_data = df_data.rename(columns = standard_variables_list)
+		
+		# Replace any XCD values with our standard mapping key here. Only the status and subcommittee columns carry XCD values
+		df_data = ValueMapper.ValueMapper(standard_variables_list).apply(df_data)
+		
+		return self.paperSubmissionFrame(df_data, filename)
 	
-	#Analytics function...the only function    
-	def Analytics(self, path_to_papers:list, path_to_awardees:str, standard_variables_list:list):
+	#Load every year's paper submissions out of the submission warehouse. Only the years in its range and the columns we use get read
+	@Tracer.traced("load")
+	def loadWarehouseSubmissions(self, warehouse):
+		######################
+		# warehouse -> SubmissionWarehouse holding the paper partitions. They are already renamed and value mapped
+		######################
+		
+		return self.paperSubmissionFrame(warehouse.read("papers", SCHOLAR_PAPER_COLUMNS), warehouse.rootDir)
+	
+	#Turn cleaned paper data into the Paper Submissions DF
+	def paperSubmissionFrame(self, df_data:pd.DataFrame, source:str):
+		######################
+		# df_data:pd.DataFrame -> Paper data with the standard names and values
+		# source:str -> Where the data came from, for the memory report
+		######################
+		
+		#Grab only the fields we need and give them the Paper Submissions DF names
+		df_current = pd.DataFrame({"ID" : df_data["ID"].astype(int), "SubK" : df_data["Subcommittee"], "Title" : df_data["Title"], "Ab_status" : df_data["Abstract_Accept"], "Paper_status" : df_data["Paper_Accept"], "First_Name" : df_data["First_Name"], "Last_Name" : df_data["Last_Name"]})
+		
+		#Create 'year' value from the first two digits of each ID (24xxx -> 2024)
+		df_current.insert(1, "Sub_Year", ("20" + df_current["ID"].astype(str).str[:2]).astype("int16"))
+		
+		#Keep the frame small since it gets shipped back from a worker process. The status columns only have a handful of values
+		dtype_schema = DtypeSchema.DtypeSchema(SCHOLAR_DTYPE_SCHEMA)
+		df_current = dtype_schema.apply(df_current)
+		print("ScholarAnalytics::paperSubmissionFrame - " + source + " " + dtype_schema.memoryReport())
+		
+		return df_current
+	
+	#Fold the case, white space and punctuation out of a name so small typing differences still match
+	def nameKey(self, first_names:pd.Series, last_names:pd.Series):
+		######################
+		# first_names:pd.Series -> First names
+		# last_names:pd.Series -> Last names lined up with the first names
+		######################
+		
+		full_names = first_names.fillna("").astype(str) + " " + last_names.fillna("").astype(str)
+		full_names = full_names.str.lower().str.replace(r"[^\w\s]", "", regex = True)
+		return full_names.str.split().str.join(" ")
+	
+	#Turn a True/False column into the Yes/No the report uses
+	def yesNo(self, flags:pd.Series):
+		return flags.map({True : "Yes", False : "No"})
+	
+	#Analytics function
+	@Tracer.traced("analytics")
+	def Analytics(self, path_to_papers:list, path_to_awardees:str, standard_variables_list:list, workers:int = None):
+		######################
+		# path_to_papers:list -> List of the yearly paper submission files
+		# path_to_awardees:str -> Path to the scholarship awardee file
+		# standard_variables_list:list -> Dictionary mapping the XCD names to our standard ones
+		# workers:int -> Number of processes used to load the yearly files. None uses every core
+		######################
 		 	
 		#Create the Awardee DataFrame
 		#Load the file
-		df_names = pd.read_excel(path_to_awardees)
+		df_names = self.settings.cache.readExcel(path_to_awardees, usecols = ColumnProjection.rawColumnFilter(SCHOLAR_AWARDEE_COLUMNS, {}))
 	
 		#Clean the data
 		df_names.columns = df_names.columns.str.replace(' ', '_')
 		
-		#Create Output DF 
-		df_Schol_submissions = pd.DataFrame(columns = ["Awardee Name", "Scholarship Name", "Scholarship Year", "Abstract Submitted?", "Submission Year", "Abstract ID", "Abstract Title", "Subcommittee", "First Author?", "Accepted?", "Paper Submitted?", "Paper Accepted?"])
-			
-		
-		#Build the Paper Submissions DataFrame
-		#Create Paper Submissions DF
-		df_paperdata = pd.DataFrame(columns = ["ID", "Sub_Year", "SubK", "Title", "Ab_status", "Paper_status", "First_Name", "Last_Name"])
-	
-	
-		#Load each Paper file, load data into DF, run the analyses, and add results to Output DF
-		for filename in path_to_papers:	
-			#Load file data into Data DF
-			df_data = pd.read_excel(filename)
-
-			#Clean the data
-			#Remove pesky white space
-			df_data.columns = df_data.columns.str.replace(' ', '_')
+		#Build the Paper Submissions DataFrame from every year's file in one go, or from the warehouse when there is one
+		if self.settings.warehouse is not None:
+			df_paperdata = self.loadWarehouseSubmissions(self.settings.warehouse)
+		else:
+			df_paperdata = self.loadPaperSubmissions(path_to_papers, standard_variables_list, workers)
 		
-			#Replace column names with variable dictionary
-			df_data = df_data.rename(columns = standard_variables_list)
-
-     		# Replace any XCD values with our standard mapping key here
-			df_data = df_data.replace(standard_variables_list)
-		
-			#Get data fields from file data (Data DF) and add into Paper Submissions DF
-			#Create 'year' value
-			fileIDvalue = str(df_data.loc[0 , "ID"]) 
-			fileYear = ("20"+ fileIDvalue[:2]) 
-			subYear = int(fileYear)
-					
-			#Iterate through Data DF/file putting data into Paper Submission DF
-			i = int(0) #index counter for Data DF...know where we are in the dataframe
-			for row in df_data["ID"]:
-				#Create a temporay df (Current DF) to hold the data merge	
-				df_current = pd.DataFrame({"ID" : int(row), "Sub_Year" : subYear, "SubK" : df_data["Subcommittee"], "Title" : df_data["Title"], "Ab_status" : df_data["Abstract_Accept"], "Paper_status" : df_data["Paper_Accept"], "First_Name" : df_data["First_Name"], "Last_Name" : df_data["Last_Name"]}, index = [i])
-					
-				df_paperdata = pd.concat([df_paperdata, df_current], axis = 0, ignore_index = True)
-					 
-				i += 1
+		#Work out the per submission flags for every row at once. Int64 keeps the years and IDs whole through the join
+		#First Author: the first author row is the first row listed for an ID
+		df_submissions = pd.DataFrame({"Name_Key" : self.nameKey(df_paperdata["First_Name"], df_paperdata["Last_Name"]),
+									   "Abstract Submitted?" : "Yes",
+									   "Submission Year" : df_paperdata["Sub_Year"].astype("Int64"),
+									   "Abstract ID" : df_paperdata["ID"].astype("Int64"),
+									   "Abstract Title" : df_paperdata["Title"],
+									   "Subcommittee" : df_paperdata["SubK"],
+									   "First Author?" : self.yesNo(df_paperdata["ID"] != df_paperdata["ID"].shift()),
+									   "Accepted?" : self.yesNo(df_paperdata["Ab_status"] == "Abstract_Accepted"),
+									   "Paper Submitted?" : self.yesNo(df_paperdata["Paper_status"].isin(["Paper_Accepted", "Paper_Rejected"])),
+									   "Paper Accepted?" : self.yesNo(df_paperdata["Paper_status"] == "Paper_Accepted")})
 		
 		#Run the analysis
-		#Get each awardee name and search submission DF
-		a = int(0) #index counter for Awardee Names...Know which awardee we are using
-		for awardee in df_names["Last_Name"]:
-				
-			#Initialize output variables. These are the default values and will load into the output if the awardee did not submit
-			scholarship = df_names.loc[a , "Scholarship"]
-			schol_year = df_names.loc[a , "Year"]
-			firstName = df_names.loc[a , "First_Name"] 
-			name = (firstName + " " + awardee)
-			abstract = "No"
-			subyear = ""
-			id = ""
-			title = ""
-			subK = ""
-			f_author = "No"
-			ab_accept = "No"
-			paper_submit = "No"
-			paper_accept = "No"
-				
-			#Iterate through Paper Submission DF to find each instance of an awardee's name and then set variables as appropriate
-			entry = int(0) #Counter to determine if awardee had a submission. This controls assignment of data if the is no submission 
-			count = int(0) #Index counter for Paper Submissions DF...Know which row in Paper Submission DF we are using
-			for x in df_paperdata["ID"]:
-				#Compare current Awardee Name with author name in Paper Submission DF.  Assign data if a match.	
-				if df_paperdata.loc[count , "Last_Name"] == awardee and df_paperdata.loc[count , "First_Name"] == firstName :
-								
-					abstract = "Yes"
-					subyear = df_paperdata.loc[count , "Sub_Year"]
-					id = x
-					title = df_paperdata.loc[count , "Title"]
-					subK = df_paperdata.loc[count , "SubK"]
-					if df_paperdata.loc[count , "Ab_status"] == "Abstract_Accepted": ab_accept = "Yes"
-					else: ab_accept = "No"
-					if df_paperdata.loc[count , "Paper_status"] == "Paper_Accepted": 
-						paper_submit = "Yes"
-						paper_accept = "Yes"
-					elif df_paperdata.loc[count , "Paper_status"] == "Paper_Rejected":
-						paper_submit = "Yes"
-						paper_accept = "No"
-					else: paper_submit = "No"
-					#First Author
-					if x != df_paperdata.loc[count-1 , "ID"]: f_author = "Yes"
-					else: f_author = "No"
-					
-					##Create a temporay df (Entry DF) to hold the variable assignments for Output	DF
-					df_entry = pd.DataFrame({"Awardee Name" : name, "Scholarship Name" : scholarship, "Scholarship Year" : schol_year, "Abstract Submitted?" : abstract , "Submission Year" : subyear, "Abstract ID" : id , "Abstract Title" : title , "Subcommittee" : subK , "Accepted?" : ab_accept, "Paper Submitted?" : paper_submit, "Paper Accepted?" : paper_accept, "First Author?" : f_author}, index = [count])
-				
-					df_Schol_submissions = pd.concat([df_Schol_submissions, df_entry], axis = 0, ignore_index = True)
-					
-					entry += 1
-				
-				count += 1
-			
-			#Load default data into Output DF if awardee name was not in the Paper Submission DF 
-			if entry < 1:
-				df_entry = pd.DataFrame({"Awardee Name" : name, "Scholarship Name" : scholarship, "Scholarship Year" : schol_year, "Abstract Submitted?" : abstract , "Submission Year" : subyear, "Abstract ID" : id , "Abstract Title" : title , "Subcommittee" : subK , "Accepted?" : ab_accept, "Paper Submitted?" : paper_submit, "Paper Accepted?" : paper_accept, "First Author?" : f_author}, index = [count])
-				
-				df_Schol_submissions = pd.concat([df_Schol_submissions, df_entry], axis = 0, ignore_index = True)
-								
-			a += 1
-			
+		#Join every awardee to their submissions through the normalized name. This is a single hash join instead of a scan per awardee
+		df_awardees = pd.DataFrame({"Awardee Name" : df_names["First_Name"] + " " + df_names["Last_Name"],
+									"Scholarship Name" : df_names["Scholarship"],
+									"Scholarship Year" : df_names["Year"],
+									"Name_Key" : self.nameKey(df_names["First_Name"], df_names["Last_Name"])})
+		df_Schol_submissions = df_awardees.merge(df_submissions, on = "Name_Key", how = "left").drop(columns = ["Name_Key"])
+		
+		#Load default data into Output DF if awardee name was not in the Paper Submission DF
+		submitted = df_Schol_submissions["Abstract Submitted?"].notna()
+		for column in ["Abstract Submitted?", "First Author?", "Accepted?", "Paper Submitted?", "Paper Accepted?"]:
+			df_Schol_submissions[column] = df_Schol_submissions[column].where(submitted, "No")
+		for column in ["Submission Year", "Abstract ID", "Abstract Title", "Subcommittee"]:
+			df_Schol_submissions[column] = df_Schol_submissions[column].astype(object).where(submitted, "")
+		
+		#Put the columns in the order the report has always used
+		df_Schol_submissions = df_Schol_submissions[["Awardee Name", "Scholarship Name", "Scholarship Year", "Abstract Submitted?", "Submission Year", "Abstract ID", "Abstract Title", "Subcommittee", "First Author?", "Accepted?", "Paper Submitted?", "Paper Accepted?"]]
 						
 		#Create Output file
-		df_Schol_submissions.to_csv("ScholarshipsAwardeeSubmissions.csv")
+		Tracer.writeCSV(df_Schol_submissions, "ScholarshipsAwardeeSubmissions.csv", self.tracer)
 		
 		#Let us know when process is complete
 		print ("\nScholarAnalytics::Analytics - Analysis Complete. Results written to ScholarshipsAwardeeSubmissions.csv")
@@ -4,22 +4,118 @@
 
 # Include the goodies we are going to need 
 import pandas as pd
-import numpy as np
+
+# Import our shared helpers
+import Utils.RunSettings as RunSettings
+import Utils.ValueMapper as ValueMapper
+import Utils.DtypeSchema as DtypeSchema
+import Utils.ReviewSummary as ReviewSummary
+import Utils.BirddogRoster as BirddogRoster
+import Utils.CountCube as CountCube
+import Utils.XLSXStream as XLSXStream
+import Utils.ColumnProjection as ColumnProjection
+import Utils.Tracer as Tracer
+
+# Review summary recipes. Format -> (Output_Column, Source_Column, Reducer[, Value])
+TUT_ABSTRACT_REVIEW_SUMMARY = [("Title", "Title", "first"),
+                               ("Birddog_Volunteer", "Volunteer_Name", "join"),
+                               ("International(Y/N)", "International(Y/N)", "first"),
+                               ("Past_Year_Tutorial_Number", "Past_Year_Tutorial_Number", "first"),
+                               ("Mean_Alignment", "Mean_Alignment", "mean"),
+                               ("Mean_Learning_Objectives", "Mean_Learning_Objectives", "mean"),
+                               ("Mean_Outline_Content", "Mean_Outline_Content", "mean"),
+                               ("Num_Sales_Pitch", "Num_Sales_Pitch", "sum"),
+                               ("Num_Accept", "Acceptance", "count_equals", "Accept"),
+                               ("Num_Reject", "Acceptance", "count_equals", "Reject"),
+                               ("Num_Discuss", "Acceptance", "count_equals", "Discuss"),
+                               ("Organization_Type", "Organization_Type", "first"),
+                               ("Comments", "Comments", "collect"),
+                               ("Biography", "Biography", "collect")]
+
+TUT_PAPER_REVIEW_SUMMARY = [("Title", "Title", "first"),
+                            ("Birddog", "Birddog", "first"),
+                            ("International(Y/N)", "International(Y/N)", "first"),
+                            ("Past_Year_Tutorial_Number", "Past_Year_Tutorial_Number", "first"),
+                            ("Content_Quantity_Right", "Content_Quantity_Appropriate", "count_equals", "Seems Right"),
+                            ("Content_Quantity_Long", "Content_Quantity_Appropriate", "count_equals", "Too Long"),
+                            ("Content_Description", "Content_Description", "mean"),
+                            ("Slide_Quality", "Slide_Quality", "mean"),
+                            ("Mean_Sales_Pitch", "Sales_Pitch", "mean"),
+                            ("Num_Best_Tutorial", "Best_Tutorial", "count_equals", "Yes"),
+                            ("Num_Accept", "Acceptance", "count_equals", "Accept"),
+                            ("Num_Reject", "Acceptance", "count_equals", "Reject"),
+                            ("Num_Discuss", "Acceptance", "count_equals", "Discuss"),
+                            ("Organization_Type", "Organization_Type", "first"),
+                            ("Comments_to_Birddog", "Comments_for_Birddog", "collect"),
+                            ("Discussion_Comments", "Comments_for_Discussion", "collect"),
+                            ("Biography", "Biography", "collect")]
+
+# Compact column types for the cleaned tutorial data
+TUT_DTYPE_SCHEMA = {"Origin_Country" : "category",
+                    "Org_Type" : "category",
+                    "Organization_Type" : "category",
+                    "International(Y/N)" : "category",
+                    "Tutorial_Accept_Reject" : "category",
+                    "Acceptance" : "category",
+                    "Birddog_Volunteer" : "category",
+                    "Content_Quantity_Appropriate" : "category",
+                    "Best_Tutorial" : "category",
+                    "Mean_Alignment" : "float32",
+                    "Mean_Learning_Objectives" : "float32",
+                    "Mean_Outline_Content" : "float32",
+                    "Content_Description" : "float32",
+                    "Slide_Quality" : "float32",
+                    "Num_Sales_Pitch" : "int8",
+                    "Sales_Pitch" : "int8"}
+
+# Standard columns each report reads once the aliases are applied, so the loader can skip the rest of the export.
+# The count reports load just their cube and ID columns, see loadCountCube
+TUT_REQUIRED_COLUMNS = {"preAbstractReviewAnalytics" : ["ID", "ReviewerLastname", "ReviewerFirstname", "Birddog_Volunteer"] +
+                                                       ReviewSummary.sourceColumns(TUT_ABSTRACT_REVIEW_SUMMARY),
+                        "prePaperReviewAnalytics" : ["ID"] + ReviewSummary.sourceColumns(TUT_PAPER_REVIEW_SUMMARY)}
 
 # Define the class and it's methods
 class TutorialAnalytics:
 
     # Define what it's constructor sets up
-    def __init__(self):
+    def __init__(self, settings:RunSettings.RunSettings = None):
+        ######################
+        # settings:RunSettings.RunSettings -> Cache and report options from the command line. None uses the defaults
+        ######################
+
         # Do something
         print("TutorialAnalytics::__init__ - Initalizing a TutorialAnalytics object")
+        self.settings = RunSettings.RunSettings() if settings is None else settings
+
+        # Spans for the traced methods and report writes go here. None when tracing is off
+        self.tracer = self.settings.tracer
+
+    # Make the value mapper and dtype schema cleanData uses. Pass them back in to clean several chunks of one file
+    def makeCleaners(self, standard_variables_list:dict):
+        ######################
+        # standard_variables_list:dict -> Dictionary mapping the XCD names to our standard ones
+        ######################
+
+        return ValueMapper.ValueMapper(standard_variables_list), DtypeSchema.DtypeSchema(TUT_DTYPE_SCHEMA)
+
+    # Let the user know which aliases fired and how much memory the compact types saved
+    def printCleaning(self, valueMapper:ValueMapper.ValueMapper, dtypeSchema:DtypeSchema.DtypeSchema):
+        ######################
+        # valueMapper:ValueMapper.ValueMapper -> Value mapper cleanData used
+        # dtypeSchema:DtypeSchema.DtypeSchema -> Dtype schema cleanData used
+        ######################
+
+        print("TutorialAnalytics::cleanData - Value aliases applied: ", valueMapper.firedAliases)
+        print("TutorialAnalytics::cleanData - " + dtypeSchema.memoryReport())
 
     # Clean the data so it's usable -> TO DO: Add other data cleaning operations we want to do
     # TO DO: Move this and the PaperAnalytics function into a Util class
-    def cleanData(self, df_tut:pd, standard_variables_list:list):
+    @Tracer.traced("clean")
+    def cleanData(self, df_tut:pd, standard_variables_list:list, cleaners:tuple = None):
         ######################
         # df_tut:pd -> DataFrame containing all the paper submissions
         # standard_variables_list:list -> List (it's really a dictionary so need to change this) storing all the names that we want to change into standard ones
+        # cleaners:tuple -> (ValueMapper, DtypeSchema) shared by the chunks of one file so their diagnostics add up. None makes new ones and prints them
         ######################
 
         # Replace the column names spaces with underscores since XCD likes to oddly throw in spaces
@@ -29,44 +125,99 @@ class TutorialAnalytics:
         df_tut = df_tut.rename(columns = standard_variables_list)
 
         # Replace any XCD values with our standard mapping key here
-        df_tut = df_tut.replace(standard_variables_list)
+        # Only the status and subcommittee columns carry XCD values, so leave the free text alone
+        value_mapper, dtype_schema = cleaners or self.makeCleaners(standard_variables_list)
+        df_tut = value_mapper.apply(df_tut)
+
+        # Shrink the dimension and rating columns down to compact types
+        df_tut = dtype_schema.apply(df_tut)
+
+        # A streamed file prints once after its last chunk instead
+        if cleaners is None:
+            self.printCleaning(value_mapper, dtype_schema)
         
         # return the cleaned data with only the column names we care about
         return df_tut
     
     # Load in the file from xcd and return it
-    def loadXCDFile(self, filePath:str, fileName:str):
+    @Tracer.traced("load")
+    def loadXCDFile(self, filePath:str, fileName:str, usecols = None):
         ##########################
         # filePath:str -> string containing the path to the file we want to load in 
         # fileName:str -> string containing the actual file name we want to load 
         # Note: Right now I'm being lazy and passing it in all as one. Need to change
+        # usecols -> Test on the raw header names so only the columns a report needs get loaded. None loads them all
         ##########################
 
         print("TutorialAnalytics::loadXCDFile - Loading file from XCD: ", str(filePath + fileName))
 
         # Load in the file and return it
         # TO DO: Add error handling for a non-existant file
-        return pd.read_excel(filePath + fileName)
+        return self.settings.cache.readExcel(filePath + fileName, usecols = usecols)
+
+    # Load in the file from xcd and clean it, reusing the cleaned copy if an analysis session already has it
+    def loadCleanXCDFile(self, filePath:str, listOfColumnAliases:dict, requiredColumns:list = None):
+        ##########################
+        # filePath:str -> string containing the path and name of the file we want to load in
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # requiredColumns:list -> Standard column names the report reads. Only the raw columns that map to these get loaded. None loads them all
+        ##########################
+
+        if self.settings.session is not None:
+            return self.settings.session.getCleanFrame(self, filePath, listOfColumnAliases, requiredColumns)
+
+        usecols = ColumnProjection.rawColumnFilter(requiredColumns, listOfColumnAliases)
+        return self.cleanData(self.loadXCDFile(filePath, "", usecols), listOfColumnAliases)
+
+    # Count the rows and unique submissions for every combination of the given columns
+    @Tracer.traced("load")
+    def loadCountCube(self, filePath:str, listOfColumnAliases:dict, cubeColumns:list, idColumns:list = ["ID"]):
+        ##########################
+        # filePath:str -> string containing the path and name of the file we want to load in
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # cubeColumns:list -> Columns we want to be able to slice the counts by
+        # idColumns:list -> Columns that identify a unique submission
+        ##########################
+
+        # With a SQLite store the counts come out of an indexed GROUP BY and the export is only cleaned when it changed
+        if self.settings.store is not None:
+            return self.settings.store.countCube(self, filePath, listOfColumnAliases, cubeColumns, idColumns)
+
+        count_cube = CountCube.CountCube(cubeColumns, idColumns)
+
+        # The counts only ever read the cube and ID columns, so those are all we load
+        required_columns = cubeColumns + idColumns
+
+        # Streaming is off so load the whole file like normal
+        if self.settings.chunkRows is None:
+            return count_cube.update(self.loadCleanXCDFile(filePath, listOfColumnAliases, required_columns)).result()
+
+        # Clean and count one chunk at a time so only a chunk is ever in memory
+        usecols = ColumnProjection.rawColumnFilter(required_columns, listOfColumnAliases)
+        cleaners = self.makeCleaners(listOfColumnAliases)
+        for df_chunk in XLSXStream.readChunks(filePath, self.settings.chunkRows, usecols = usecols):
+            count_cube.update(self.cleanData(df_chunk, listOfColumnAliases, cleaners))
+        self.printCleaning(*cleaners)
+
+        return count_cube.result()
     
     # Group the submissions by coutnry
-    def groupByCountry(self, df_tut:pd, firstColumnName:str, fileName:str):
+    def groupByCountry(self, cube:pd, firstColumnName:str, fileName:str):
         ######################
-        # df_tut:pd -> DataFrame containing all the submissions
+        # cube:pd -> Counts from loadCountCube
         # firstColumnName:str -> String that contains the column that we want to group by
         # fileName:str -> String containing the name of the file we want to save out
         ######################
 
-        # Get only the quniqe
-        df_unique_submisisons = df_tut.drop_duplicates(subset=["ID"])
-
-        # Group the papers by the submitter category
-        df_tut = df_unique_submisisons.groupby(firstColumnName).size()
+        # Count the unique submissions for each value
+        df_tut = CountCube.firstIDCounts(cube, firstColumnName)
 
         # Print out the file
-        df_tut.to_csv(fileName)
+        Tracer.writeCSV(df_tut, fileName, self.tracer)
 
     
     # Run analysis right after abstract review closes to get our submission demographics
+    @Tracer.traced("analytics")
     def postAbstractSubmissionClosureAnalytics(self, filePathToAbstractSubmissionFile:str, listOfColumnAliases:list):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -75,15 +226,13 @@ class TutorialAnalytics:
         
         print("TutorialAnalytics::postAbstractSubmissionClosureAnalytics - Running the analysis for when abstract review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_tut = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_tut = self.cleanData(df_tut, listOfColumnAliases)
+        # Count the submissions in one pass over the file
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases, ["Origin_Country"])
         
         # Create the cross tabs by org
-        self.groupByCountry(df_tut, "Origin_Country", "TUT_AbstractReview_Crosstabs_Country.csv")
+        self.groupByCountry(cube, "Origin_Country", "TUT_AbstractReview_Crosstabs_Country.csv")
 
+    @Tracer.traced("analytics")
     def postAbstractReviewAcceptanceAnalytics(self, filePathToAbstractSubmissionFile:str, listOfColumnAliases:list):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -92,21 +241,20 @@ class TutorialAnalytics:
         
         print("TutorialAnalytics::postAbstractReviewAcceptanceAnalytics - Running the analysis for when abstract review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_tut = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_tut = self.cleanData(df_tut, listOfColumnAliases)
+        # Count everything we need in one pass over the file
+        cube = self.loadCountCube(filePathToAbstractSubmissionFile, listOfColumnAliases,
+                                  ["Org_Type", "International(Y/N)", "Tutorial_Accept_Reject"])
         
         # Create the cross tabs by org
-        self.twoFactorCrossTab(df_tut, "Org_Type", "Tutorial_Accept_Reject", "TUT_AbstractReview_AcceptReject.csv")
+        self.twoFactorCrossTab(cube, "Org_Type", "Tutorial_Accept_Reject", "TUT_AbstractReview_AcceptReject.csv")
 
         # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
-        cross_tab_international = pd.crosstab(df_tut["International(Y/N)"], df_tut["Tutorial_Accept_Reject"])
+        cross_tab_international = CountCube.crossTab(cube, "International(Y/N)", "Tutorial_Accept_Reject")
 
         # Print out the cross tab file
-        cross_tab_international.to_csv("TUT_Accept_Reject_International.csv")
+        Tracer.writeCSV(cross_tab_international, "TUT_Accept_Reject_International.csv", self.tracer)
 
+    @Tracer.traced("analytics")
     def postPaperReviewAcceptanceAnalytics(self, filePath:str, listOfColumnAliases:list):
         ###############################
         # filePath:str -> String containing the file path and name to the file we want to load
@@ -115,28 +263,27 @@ class TutorialAnalytics:
         
         print("TutorialAnalytics::postPaperReviewAcceptanceAnalytics - Running the analysis for when paper review closes.......")
 
-        # Load in the excel file into a data frame so we can start working with it
-        df_tut = self.loadXCDFile(filePath, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_tut = self.cleanData(df_tut, listOfColumnAliases)
+        # Count everything we need in one pass over the file
+        cube = self.loadCountCube(filePath, listOfColumnAliases,
+                                  ["Org_Type", "International(Y/N)", "Origin_Country", "Tutorial_Accept_Reject"])
         
         # Create the cross tabs by org
-        self.twoFactorCrossTab(df_tut, "Org_Type", "Tutorial_Accept_Reject", "TUT_PaperReview_AcceptReject.csv")
+        self.twoFactorCrossTab(cube, "Org_Type", "Tutorial_Accept_Reject", "TUT_PaperReview_AcceptReject.csv")
 
         # Let's do a crosstab by international and accept/reject to figure out how all the intenat'l paper faired
-        cross_tab_international = pd.crosstab(df_tut["International(Y/N)"], df_tut["Tutorial_Accept_Reject"])
+        cross_tab_international = CountCube.crossTab(cube, "International(Y/N)", "Tutorial_Accept_Reject")
 
         # Print out the cross tab file
-        cross_tab_international.to_csv("TUT_Accept_Reject_International.csv")
+        Tracer.writeCSV(cross_tab_international, "TUT_Accept_Reject_International.csv", self.tracer)
         
         # Let's do a crosstab to see the accept/reject numbers by country
-        cross_tab = pd.crosstab(df_tut["Origin_Country"], df_tut["Tutorial_Accept_Reject"])
+        cross_tab = CountCube.crossTab(cube, "Origin_Country", "Tutorial_Accept_Reject")
 
         # Send this back so we can tabulate Papers, TUT, PDW accepts
         return cross_tab
  
     # Analyze the reviews for the subcommittee
+    @Tracer.traced("analytics")
     def preAbstractReviewAnalytics(self, filePathToAbstractSubmissionFile:str, listOfColumnAliases:dict):
         ###############################
         # filePathToAbstractSubmissionFile:str -> String containing the file path and name to the file we want to load
@@ -147,103 +294,23 @@ class TutorialAnalytics:
 
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_tut = self.loadXCDFile(filePathToAbstractSubmissionFile, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_tut = self.cleanData(df_tut, listOfColumnAliases)
-        
-        # Grab all the uniqe paper IDs and put them in an array
-        tut_with_reviews = df_tut["ID"].unique()
-
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns = ["ID", "Title", "Birddog_Volunteer", "International(Y/N)", "Past_Year_Tutorial_Number",
-                                                    "Mean_Alignment", "Mean_Learning_Objectives", "Mean_Outline_Content",
-                                                    "Num_Sales_Pitch","Num_Accept", "Num_Reject", "Num_Discuss", "Organization_Type", 
-                                                    "Comments", "Biography"])
+        df_tut = self.loadCleanXCDFile(filePathToAbstractSubmissionFile, listOfColumnAliases, TUT_REQUIRED_COLUMNS["preAbstractReviewAnalytics"])
         
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in tut_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_record = df_tut.loc[df_tut["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_record["Title"].iloc[1]
+        # Combine the first and last name of everyone that said yes to the birddog question so we can list them per tutorial
+        df_tut = df_tut.assign(Volunteer_Name = BirddogRoster.volunteerNames(df_tut))
 
-            # Grab the list of birddog volunteers. This grabs all the records for a paper that someone responded yes to the birddog question
-            birddog_volunteers_list = df_current_record[df_current_record["Birddog_Volunteer"] == "Yes"]
-            
-            # Combine the first and last name into a new column called "Combined_Name" so we can use it
-            birddog_volunteers_list["Combined_Name"] = birddog_volunteers_list["ReviewerLastname"] + ',' + birddog_volunteers_list["ReviewerFirstname"]
-            
-            # Change the data from a dataframe to a list of strings without the index number
-            birddog_volunteers_list = birddog_volunteers_list["Combined_Name"].to_string(index = False)
-
-            # Figure out if it's an internatioal record
-            bool_international = df_current_record["International(Y/N)"].iloc[1]
-
-            # Figure out if they presented this in the past
-            past_year_id = df_current_record["Past_Year_Tutorial_Number"].iloc[1]
-
-            # Calculate the mean substance rating
-            mean_align = round(df_current_record.loc[:, "Mean_Alignment"].mean(), 2)
-
-            # Calculate the mean org rating
-            mean_obj = round(df_current_record.loc[:, "Mean_Learning_Objectives"].mean(), 2)
-
-            # Calculate the mean org rating
-            mean_outline = round(df_current_record.loc[:, "Mean_Outline_Content"].mean(), 2)
-
-            # Calculate sum of sales pitch vodes
-            num_sales_pitch = df_current_record.loc[:, "Num_Sales_Pitch"].sum()
-
-            # Sum number of accepts
-            num_accepts = df_current_record[df_current_record["Acceptance"] == "Accept"]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_record[df_current_record["Acceptance"] == "Reject"]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_record[df_current_record["Acceptance"] == "Discuss"]
-            num_discuss = len(num_discuss.index)
-
-            # Figure out Organization_Type
-            org_type = df_current_record["Organization_Type"].iloc[1]
-            
-            # Grab comments
-            list_comments = df_current_record["Comments"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            list_comments = [x for x in list_comments if str(x) != 'nan']
-            
-            # Grab Bios
-            list_bio = df_current_record ["Biography"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            list_bio = [x for x in list_bio if str(x) != 'nan']
-            
-
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID" : unique_id,
-                                       "Title" : record_title, "Birddog_Volunteer" : [birddog_volunteers_list], 
-                                       "International(Y/N)" : bool_international,
-                                       "Past_Year_Tutorial_Number" : past_year_id,
-                                       "Mean_Alignment" : mean_align,
-                                       "Mean_Learning_Objectives" : mean_obj,
-                                       "Mean_Outline_Content" : mean_outline, 
-                                       "Num_Sales_Pitch" : num_sales_pitch,
-                                       "Num_Accept" : num_accepts, "Num_Reject" : num_rejects, "Num_Discuss" : num_discuss, 
-                                       "Organization_Type" : org_type,
-                                       "Comments" : [list_comments], "Biography" : [list_bio]}, index = [0])
-            # Add the record
-            df_reviews_summary = pd.concat([df_reviews_summary, df_new_entry], axis = 0)#.reset_index()
+        # Summarize every tutorial in one pass
+        review_summary = ReviewSummary.ReviewSummary(TUT_ABSTRACT_REVIEW_SUMMARY, self.settings.collectShape, tracer = self.tracer)
+        df_reviews_summary = review_summary.summarize(df_tut)
             
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("TUT_AbstractReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "TUT_AbstractReviewSummary.csv", df_tut)
+
+        # Save the volunteers the other way around so the chairs can even out who birddogs what
+        Tracer.writeCSV(BirddogRoster.reviewerIndex(df_tut, tracer = self.tracer), "TUT_BirddogVolunteers.csv", self.tracer)
 
 # Analyze the reviews for the subcommittee
+    @Tracer.traced("analytics")
     def prePaperReviewAnalytics(self, filePath:str, listOfColumnAliases:dict):
         ###############################
         # filePath:str -> String containing the file path and name to the file we want to load
@@ -254,149 +321,28 @@ class TutorialAnalytics:
 
         # Load in the excel file into a data frame so we can start working with it
         # TO DO: Figure ouw how I want to deal with file name vs file path
-        df_tut = self.loadXCDFile(filePath, "")
-
-        # Clean the data and standardize the delimiters so we can use
-        df_tut = self.cleanData(df_tut, listOfColumnAliases)
-        
-        # Grab all the uniqe paper IDs and put them in an array
-        tut_with_reviews = df_tut["ID"].unique()
-
-        # Create a new data frame to store our results
-        df_reviews_summary = pd.DataFrame(columns = ["ID", "Title", "Birddog", "International(Y/N)", 
-                                                    "Past_Year_Tutorial_Number",
-                                                    "Content_Quantity_Right",
-                                                    "Content_Quantity_Long",
-                                                    "Content_Description",
-                                                    "Slide_Quality", 
-                                                    "Mean_Sales_Pitch",
-                                                    "Num_Best_Tutorial",
-                                                    "Num_Accept", 
-                                                    "Num_Reject", 
-                                                    "Num_Discuss", 
-                                                    "Organization_Type", 
-                                                    "Comments_to_Birddog", 
-                                                    "Discussion_Comments",
-                                                    "Biography"])
+        df_tut = self.loadCleanXCDFile(filePath, listOfColumnAliases, TUT_REQUIRED_COLUMNS["prePaperReviewAnalytics"])
         
-        # Cycle through all the unique IDs and populate the info
-        for unique_id in tut_with_reviews:
-
-            # Grab all the records for that ID
-            df_current_record = df_tut.loc[df_tut["ID"] == unique_id]
-
-            # Grab the title of the paper
-            record_title = df_current_record["Title"].iloc[1]
-
-            # Grab the birddog 
-            birddog = df_current_record["Birddog"].iloc[1]
-            
-            # Figure out if it's an internatioal record
-            bool_international = df_current_record["International(Y/N)"].iloc[1]
-
-            # Figure out if they presented this in the past
-            past_year_id = df_current_record["Past_Year_Tutorial_Number"].iloc[1]
-
-            # Calculate how many right sized content votes we have
-            num_content_quantity_right = df_current_record[df_current_record["Content_Quantity_Appropriate"] == "Seems Right"]
-            num_content_quantity_right = len(num_content_quantity_right.index)
-
-            # Calculate how many too long votes we have
-            num_content_quantity_long = df_current_record[df_current_record["Content_Quantity_Appropriate"] == "Too Long"]
-            num_content_quantity_long = len(num_content_quantity_long.index)
-            
-            # Calcuate mean of contnet quality score
-            qual = list(filter(None, df_current_record.loc[:, "Content_Description"]))
-            qual = pd.to_numeric(qual, errors="coerce")
-            qual = qual[~np.isnan(qual)]
-            mean_quality = round(qual.mean(), 2)
-
-            # Calcualte the mean of slide quailty
-            slide = list(filter(None, df_current_record.loc[:, "Slide_Quality"]))
-            slide = pd.to_numeric(slide, errors="coerce")
-            slide = slide[~np.isnan(slide)]
-            slide_quality = round(slide.mean(), 2)
-
-            # Calculate sum of sales pitch vodes
-            sales = list(filter(None, df_current_record.loc[:, "Sales_Pitch"]))
-            sales = pd.to_numeric(sales, errors="coerce")
-            sales = sales[~np.isnan(sales)]
-            mean_sales_pitch = round(sales.mean(), 2)
-            
-            # Sum number of accepts
-            num_accepts = df_current_record[df_current_record["Acceptance"] == "Accept"]
-            num_accepts = len(num_accepts.index)
-
-            # Sum number of rejects
-            num_rejects = df_current_record[df_current_record["Acceptance"] == "Reject"]
-            num_rejects = len(num_rejects.index)
-
-            # Sum number of Discuss
-            num_discuss = df_current_record[df_current_record["Acceptance"] == "Discuss"]
-            num_discuss = len(num_discuss.index)
-
-            # Num best tutorial
-            num_best_tut = df_current_record[df_current_record["Best_Tutorial"] == "Yes"]
-            num_best_tut = len(num_best_tut.index)
-
-            # Figure out Organization_Type
-            org_type = df_current_record["Organization_Type"].iloc[1]
-            
-            # Grab comments for birddog
-            birddog_list_comments = df_current_record["Comments_for_Birddog"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            birddog_list_comments = [x for x in birddog_list_comments if str(x) != 'nan']
-
-            # Grab comments for discussion
-            discussion_list_comments = df_current_record["Comments_for_Discussion"].tolist()
-
-            # Filter through list to make sure there are no empty junk values 
-            discussion_list_comments = [x for x in discussion_list_comments if str(x) != 'nan']
-            
-            # Grab Bios
-            list_bio = df_current_record ["Biography"].tolist() 
-
-            # Filter through list to make sure there are no empty junk values 
-            list_bio = [x for x in list_bio if str(x) != 'nan']
-            
-            # Add this record into the data frame
-            df_new_entry = pd.DataFrame({"ID" : unique_id,
-                                       "Title" : record_title, "Birddog" : birddog, 
-                                       "International(Y/N)" : bool_international,
-                                       "Past_Year_Tutorial_Number" : past_year_id,
-                                       "Content_Quantity_Right" : num_content_quantity_right,
-                                       "Content_Quantity_Long" : num_content_quantity_long,
-                                       "Content_Description" : mean_quality,
-                                       "Slide_Quality" : slide_quality, 
-                                       "Mean_Sales_Pitch" : mean_sales_pitch,
-                                       "Num_Accept" : num_accepts, 
-                                       "Num_Reject" : num_rejects, 
-                                       "Num_Discuss" : num_discuss, 
-                                       "Num_Best_Tutorial" : num_best_tut,
-                                       "Organization_Type" : org_type,
-                                       "Comments_to_Birddog" : [birddog_list_comments], 
-                                       "Discussion_Comments" : [discussion_list_comments],
-                                       "Biography" : [list_bio]}, index = [0])
-            # Add the record
-            df_reviews_summary = pd.concat([df_reviews_summary, df_new_entry], axis = 0)#.reset_index()
+        # Summarize every tutorial in one pass
+        review_summary = ReviewSummary.ReviewSummary(TUT_PAPER_REVIEW_SUMMARY, self.settings.collectShape, tracer = self.tracer)
+        df_reviews_summary = review_summary.summarize(df_tut)
             
         # Save our our file with the review summary
-        df_reviews_summary.to_csv("TUT_PaperReviewSummary.csv")
+        review_summary.writeCSV(df_reviews_summary, "TUT_PaperReviewSummary.csv", df_tut)
 
 
     # Two factor cross tabulation of data
-    def twoFactorCrossTab(self, df_records:pd, firstColumnName:str, secondColumnName:str, fileName:str):
+    def twoFactorCrossTab(self, cube:pd, firstColumnName:str, secondColumnName:str, fileName:str):
         ######################
-        # df_records:pd -> DataFrame containing all the record submissions
+        # cube:pd -> Counts from loadCountCube
         # firstColumnName:str -> String containing the name of the column we want to use for our first cross tab factor
         # secondColumnName:str -> String containing the name of the column we want to use for our second cross tab factor
         # fileName:str -> String containing the name of the file we want to save out
         ######################
         
         # Let's do a crosstab
-        cross_tab = pd.crosstab(df_records[firstColumnName], df_records[secondColumnName])
+        cross_tab = CountCube.crossTab(cube, firstColumnName, secondColumnName)
 
         # Print out the cross tab file
-        cross_tab.to_csv(fileName)
+        Tracer.writeCSV(cross_tab, fileName, self.tracer)
             
@@ -0,0 +1,108 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the analysis session that keeps cleaned XCD data in memory between report runs
+
+# Include the goodies we are going to need
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+# Import our shared helpers
+import Utils.ColumnProjection as ColumnProjection
+import Utils.StageMemo as StageMemo
+
+# How much cleaned data the session is allowed to hold before it drops the least recently used frames
+DEFAULT_MAX_MEMORY_MB = 1024
+
+# Define the class and it's methods
+class AnalysisSession:
+
+    # Define what it's constructor sets up
+    def __init__(self, maxMemoryMB:int = DEFAULT_MAX_MEMORY_MB):
+        ######################
+        # maxMemoryMB:int -> Memory limit for all the resident frames together
+        ######################
+
+        self.maxMemoryBytes = int(maxMemoryMB) * 1024 * 1024
+
+        # Frame key -> (cleaned frame, size in bytes). Oldest use first
+        self.frames = OrderedDict()
+
+        # Frame key -> (analytics, file path, alias map) it was built from, so it can be rebuilt when the export changes
+        self.sources = {}
+
+        # Keep track of how often we could skip loading and cleaning
+        self.hits = 0
+        self.misses = 0
+
+    # Fingerprint an alias map so two stages using the same map share the cleaned frame
+    def aliasFingerprint(self, listOfColumnAliases:dict):
+        ######################
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        encoded = json.dumps(sorted(listOfColumnAliases.items(), key = str), default = str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    # Build the key for a cleaned frame. The file stats make sure a re-downloaded export gets loaded again
+    def frameKey(self, analytics, filePath:str, listOfColumnAliases:dict):
+        ######################
+        # analytics -> The Paper/TUT/PDW analytics object doing the cleaning
+        # filePath:str -> Path to the XCD export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        file_stat = os.stat(filePath)
+        return (type(analytics).__name__, os.path.abspath(filePath), file_stat.st_mtime_ns, file_stat.st_size,
+                self.aliasFingerprint(listOfColumnAliases))
+
+    # Get a cleaned frame, loading and cleaning it only if the session does not have it yet
+    def getCleanFrame(self, analytics, filePath:str, listOfColumnAliases:dict, requiredColumns:list = None):
+        ######################
+        # analytics -> The Paper/TUT/PDW analytics object. Its loadXCDFile and cleanData do the work on a miss
+        # filePath:str -> Path to the XCD export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # requiredColumns:list -> Standard columns the report reads. The session keeps every column so later reports can use it
+        ######################
+
+        # A reused frame still came from this file, so the stage memo has to know the stage depends on it
+        StageMemo.recordInput(filePath)
+
+        key = self.frameKey(analytics, filePath, listOfColumnAliases)
+
+        if key in self.frames:
+            self.hits += 1
+            self.frames.move_to_end(key)
+            print("AnalysisSession::getCleanFrame - Reusing the cleaned data for", filePath)
+        else:
+            self.misses += 1
+            df_data = analytics.cleanData(analytics.loadXCDFile(filePath, ""), listOfColumnAliases)
+            self.frames[key] = (df_data, int(df_data.memory_usage(deep = True).sum()))
+            self.sources[key] = (analytics, filePath, listOfColumnAliases)
+            self.evict()
+
+            # A single frame bigger than the limit gets evicted right away, so just hand it back
+            if key not in self.frames:
+                return ColumnProjection.selectStandardColumns(df_data, requiredColumns)
+
+        # Hand back a copy so a report adding columns does not change what the next report sees
+        return ColumnProjection.selectStandardColumns(self.frames[key][0], requiredColumns)
+
+    # Drop the least recently used frames until we are under the memory limit
+    def evict(self):
+        while self.frames and self.residentBytes() > self.maxMemoryBytes:
+            key, _ = self.frames.popitem(last = False)
+            self.sources.pop(key, None)
+            print("AnalysisSession::evict - Dropping", key[1], "from memory")
+
+    # Total size of everything we are holding on to
+    def residentBytes(self):
+        return sum(frame_size for _, frame_size in self.frames.values())
+
+    # Let the user know what is loaded
+    def printResident(self):
+        print("AnalysisSession::printResident -", len(self.frames), "frames resident using %.2f MB of %.2f MB (hits: %d misses: %d)"
+              % (self.residentBytes() / 1048576, self.maxMemoryBytes / 1048576, self.hits, self.misses))
+        for key, (df_data, frame_size) in self.frames.items():
+            print("    %s %s: %d rows, %.2f MB" % (key[0], key[1], len(df_data.index), frame_size / 1048576))
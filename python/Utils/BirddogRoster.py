@@ -0,0 +1,44 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the birddog roster helpers that list who volunteered for what, both per submission and per reviewer
+
+# Include the goodies we are going to need
+import pandas as pd
+
+# Import our shared helpers
+import Utils.ReviewSummary as ReviewSummary
+
+# Column the reviewer's name goes in, "Last,First" like the review summaries show it
+REVIEWER_COLUMN = "Reviewer"
+
+# What the reverse index keeps for each reviewer. Format -> (Output_Column, Source_Column, Reducer)
+REVIEWER_INDEX_SUMMARY = [("Volunteered_IDs", "ID", "join")]
+
+
+# Name of everyone that said yes to the birddog question, empty for everyone else. Lines up with the reviews
+def volunteerNames(df_reviews:pd.DataFrame):
+    ######################
+    # df_reviews:pd.DataFrame -> Cleaned review data with the reviewer names and Birddog_Volunteer, one row per review
+    ######################
+
+    return (df_reviews["ReviewerLastname"] + ',' + df_reviews["ReviewerFirstname"]).where(df_reviews["Birddog_Volunteer"] == "Yes")
+
+
+# Flip the roster around so each volunteer lists the submissions they offered to birddog. The chairs use this to
+# spread the birddog load out without going back through every review. Busiest volunteers come first
+def reviewerIndex(df_reviews:pd.DataFrame, idColumn:str = "ID", tracer = None):
+    ######################
+    # df_reviews:pd.DataFrame -> Cleaned review data, one row per review
+    # idColumn:str -> Column holding the submission ID
+    # tracer -> Tracer the summarize span records into. None turns tracing off
+    ######################
+
+    df_volunteers = pd.DataFrame({REVIEWER_COLUMN: volunteerNames(df_reviews), "ID": df_reviews[idColumn]})
+
+    # Someone reviewing the same submission twice still only volunteered for it once
+    df_volunteers = df_volunteers.dropna().drop_duplicates()
+
+    df_index = ReviewSummary.ReviewSummary(REVIEWER_INDEX_SUMMARY, tracer = tracer).summarize(df_volunteers, REVIEWER_COLUMN)
+    df_index.insert(1, "Num_Volunteered", df_volunteers.groupby(REVIEWER_COLUMN, sort = False).size().to_numpy())
+
+    return df_index.sort_values(["Num_Volunteered", REVIEWER_COLUMN], ascending = [False, True], kind = "stable").reset_index(drop = True)
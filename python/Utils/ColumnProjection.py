@@ -0,0 +1,52 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the column projection that lets a report load only the XCD columns it actually uses
+
+# Include the goodies we are going to need
+import pandas as pd
+
+
+# Build a test that says whether a raw XCD header is one of the standard columns a report needs. None keeps every column
+def rawColumnFilter(requiredColumns:list, listOfColumnAliases:dict):
+    ######################
+    # requiredColumns:list -> Standard column names the report reads, after the aliases are applied. None keeps everything
+    # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+    ######################
+
+    if requiredColumns is None:
+        return None
+
+    required = set(requiredColumns)
+
+    # Resolve the header the same way cleanData does: spaces become underscores, then the alias map renames it
+    def keepColumn(rawName):
+        name = str(rawName).replace(" ", "_")
+        return listOfColumnAliases.get(name, name) in required
+
+    return keepColumn
+
+
+# Keep the raw columns a filter from rawColumnFilter asks for. Goes by position since XCD sometimes repeats a header
+def selectRawColumns(df_data:pd.DataFrame, keepColumn):
+    ######################
+    # df_data:pd.DataFrame -> Raw XCD data straight out of the excel file
+    # keepColumn -> Filter from rawColumnFilter, or None to keep everything
+    ######################
+
+    if keepColumn is None:
+        return df_data.copy(deep = False)
+
+    return df_data.loc[:, [keepColumn(column) for column in df_data.columns]]
+
+
+# Keep the standard columns a report needs from data that has already been cleaned
+def selectStandardColumns(df_data:pd.DataFrame, requiredColumns:list):
+    ######################
+    # df_data:pd.DataFrame -> Cleaned XCD data with the standard column names
+    # requiredColumns:list -> Standard column names the report reads. None keeps everything
+    ######################
+
+    if requiredColumns is None:
+        return df_data.copy(deep = False)
+
+    return df_data.loc[:, df_data.columns.isin(requiredColumns)]
@@ -0,0 +1,123 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the incremental count cube the crosstab and count reports are sliced from
+
+# Include the goodies we are going to need
+import numpy as np
+import pandas as pd
+
+# Define the class and it's methods
+class CountCube:
+
+    # Define what it's constructor sets up
+    def __init__(self, cubeColumns:list, idColumns:list = ["ID"]):
+        ######################
+        # cubeColumns:list -> Columns we want to be able to slice the counts by
+        # idColumns:list -> Columns that identify a unique submission. First_IDs counts each one once like drop_duplicates(subset=idColumns) would
+        ######################
+
+        self.cubeColumns = cubeColumns
+        self.idColumns = idColumns
+
+        # Running counts. One row per combination of the cube columns with Rows and First_IDs
+        self.counts = None
+
+        # Submissions already counted in an earlier chunk. One set that grows in place with the number of unique
+        # submissions, so each chunk only pays for looking up its own new IDs
+        self.seenKeys = set()
+
+    # Add a frame (or a chunk of one) to the counts
+    def update(self, df_records:pd.DataFrame):
+        ######################
+        # df_records:pd.DataFrame -> Cleaned records with the cube and ID columns
+        ######################
+
+        # Flag the first time each submission shows up in this chunk. Rows without an ID never count as a submission
+        first_ids = ~self.keyIndex(df_records).duplicated() & df_records[self.idColumns].notna().all(axis = 1).to_numpy()
+
+        # Then drop the ones an earlier chunk already counted and remember the rest
+        positions = np.flatnonzero(first_ids)
+        keys = self.keyValues(df_records, positions)
+        first_ids[positions] = ~np.fromiter(map(self.seenKeys.__contains__, keys), dtype = bool, count = len(keys))
+        self.seenKeys.update(keys)
+
+        # Keep the empty cells as their own groups so the unique submission totals still count them
+        partial = df_records[self.cubeColumns].assign(Rows = 1, First_IDs = first_ids).groupby(
+            self.cubeColumns, dropna = False, observed = True)[["Rows", "First_IDs"]].sum()
+
+        if self.counts is None:
+            self.counts = partial
+        else:
+            self.counts = pd.concat([self.counts, partial]).groupby(
+                level = self.cubeColumns, dropna = False, observed = True).sum()
+
+        return self
+
+    # Index of the submission each record belongs to. A single ID column stays a flat index so it is a plain array
+    def keyIndex(self, df_records:pd.DataFrame):
+        ######################
+        # df_records:pd.DataFrame -> Cleaned records with the ID columns
+        ######################
+
+        if len(self.idColumns) == 1:
+            return pd.Index(df_records[self.idColumns[0]])
+
+        return pd.MultiIndex.from_frame(df_records[self.idColumns])
+
+    # Hashable key for each of the given records. A single ID column is the plain value, several make a tuple
+    def keyValues(self, df_records:pd.DataFrame, positions:np.ndarray):
+        ######################
+        # df_records:pd.DataFrame -> Cleaned records with the ID columns
+        # positions:np.ndarray -> Row positions to make keys for
+        ######################
+
+        columns = [df_records[column].to_numpy()[positions].tolist() for column in self.idColumns]
+        if len(columns) == 1:
+            return columns[0]
+
+        return list(zip(*columns))
+
+    # Hand back the counts
+    def result(self):
+        if self.counts is None:
+            empty_index = pd.MultiIndex.from_arrays([[] for _ in self.cubeColumns], names = self.cubeColumns)
+            return pd.DataFrame({"Rows": [], "First_IDs": []}, index = empty_index, dtype = "int64")
+
+        return self.counts
+
+
+# Grab the part of the cube where a column has the given value
+def sliceCube(cube:pd.DataFrame, columnName:str, value):
+    ######################
+    # cube:pd.DataFrame -> Counts from CountCube.result, or a slice of them
+    # columnName:str -> Cube column to filter on
+    # value -> Value to keep
+    ######################
+
+    return cube[cube.index.get_level_values(columnName) == value]
+
+
+# Roll the cube up into a two factor cross tab. Empty cells in either column are left out like pd.crosstab does
+def crossTab(cube:pd.DataFrame, firstColumnName:str, secondColumnName:str):
+    ######################
+    # cube:pd.DataFrame -> Counts from CountCube.result, or a slice of them
+    # firstColumnName:str -> Cube column for the rows of the cross tab
+    # secondColumnName:str -> Cube column for the columns of the cross tab
+    ######################
+
+    counts = cube["Rows"].groupby(level = [firstColumnName, secondColumnName], observed = True).sum()
+    return counts.unstack(fill_value = 0).rename_axis(columns = secondColumnName)
+
+
+# Number of unique submissions for each value of a column, like drop_duplicates(subset=["ID"]) then groupby().size()
+def firstIDCounts(cube:pd.DataFrame, columnName:str):
+    ######################
+    # cube:pd.DataFrame -> Counts from CountCube.result, or a slice of them
+    # columnName:str -> Cube column to count by
+    ######################
+
+    counts = cube["First_IDs"].groupby(level = columnName, observed = True).sum()
+    counts = counts[counts > 0]
+    counts.name = None
+
+    return counts
@@ -0,0 +1,74 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the dtype schema that shrinks cleaned XCD data down to compact column types
+
+# Include the goodies we are going to need
+import pandas as pd
+
+# Column types a schema can ask for
+# category -> dictionary encoded strings for dimension columns like country, org type and status
+# float32 -> ratings. Text junk becomes empty
+# int8 -> vote flags and small counts. Falls back to float32 unless every cell is a whole number from -128 to 127
+SCHEMA_TYPES = ["category", "float32", "int8"]
+
+# Define the class and it's methods
+class DtypeSchema:
+
+    # Define what it's constructor sets up
+    def __init__(self, schema:dict):
+        ######################
+        # schema:dict -> Dictionary mapping standard column names to one of the SCHEMA_TYPES
+        ######################
+
+        for column, column_type in schema.items():
+            if column_type not in SCHEMA_TYPES:
+                raise ValueError("DtypeSchema::__init__ - Unknown type '" + str(column_type) + "' for column " + column)
+
+        self.schema = schema
+
+        # Memory usage in bytes before and after, added up over every apply so the chunks of one file report together
+        self.bytesBefore = 0
+        self.bytesAfter = 0
+
+    # Convert the schema columns that are in the frame
+    def apply(self, df_data:pd.DataFrame):
+        ######################
+        # df_data:pd.DataFrame -> Cleaned XCD data with standard column names. Converted in place
+        ######################
+
+        self.bytesBefore += int(df_data.memory_usage(deep = True).sum())
+
+        # Go by position since XCD sometimes gives us two columns that map to the same standard name
+        for position, column in enumerate(df_data.columns):
+            column_type = self.schema.get(column)
+            if column_type is None:
+                continue
+
+            values = df_data.iloc[:, position]
+            if column_type == "category":
+                values = values.astype("category")
+            else:
+                values = pd.to_numeric(values, errors = "coerce")
+                if column_type == "int8" and self.fitsInt8(values):
+                    values = values.astype("int8")
+                else:
+                    values = values.astype("float32")
+
+            df_data.isetitem(position, values)
+
+        self.bytesAfter += int(df_data.memory_usage(deep = True).sum())
+
+        return df_data
+
+    # Check a column can go to int8 without anything getting cut off or wrapping around
+    def fitsInt8(self, values:pd.Series):
+        ######################
+        # values:pd.Series -> Numeric column
+        ######################
+
+        as_float = values.astype("float64")
+        return bool(as_float.notna().all() and (as_float == as_float.round()).all() and as_float.between(-128, 127).all())
+
+    # Describe how much memory the applies saved
+    def memoryReport(self):
+        return "Memory usage before: %.2f MB after: %.2f MB" % (self.bytesBefore / 1048576, self.bytesAfter / 1048576)
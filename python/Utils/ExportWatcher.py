@@ -0,0 +1,204 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the watcher that reruns the right report stages when a new XCD export lands in the data directory
+
+# Include the goodies we are going to need
+import fnmatch
+import json
+import os
+import queue
+import threading
+import time
+
+# How often the data directory gets looked at, and how long a file has to sit still before we trust it is fully written
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_SETTLE_SECONDS = 5.0
+
+# Define the class and it's methods
+class ExportWatcher:
+
+    # Define what it's constructor sets up
+    def __init__(self, watchDir:str, patterns:dict, runStage, pollSeconds:float = DEFAULT_POLL_SECONDS,
+                 settleSeconds:float = DEFAULT_SETTLE_SECONDS, queueSize:int = 8, logPath:str = None):
+        ######################
+        # watchDir:str -> Directory the exports get dropped into
+        # patterns:dict -> File name pattern -> list of stages that read files matching it. Matching ignores case
+        # runStage -> Called with a stage name and the names of the files that set it off. Returns 0 when the stage ran, and the absolute paths of the files it read
+        # pollSeconds:float -> Seconds between looks at the directory
+        # settleSeconds:float -> Seconds a file's size and modified time have to stay the same before it counts as landed
+        # queueSize:int -> Most stages that can be waiting to run. The poller waits when it is full
+        # logPath:str -> File to append a json line per refresh to. None only prints them
+        ######################
+
+        self.watchDir = watchDir
+        self.patterns = patterns
+        self.runStage = runStage
+        self.pollSeconds = pollSeconds
+        self.settleSeconds = settleSeconds
+        self.logPath = logPath
+
+        # Stages wait here for the worker. Stages share the output directory and the caches, so only one runs at a time
+        self.stageQueue = queue.Queue(maxsize = queueSize)
+
+        # Stage -> files that triggered it, for stages waiting in the queue. A stage that is already waiting just picks up more files
+        self.waiting = {}
+        self.lock = threading.Lock()
+
+        # File name -> (size, modified time) the last time we looked
+        self.seen = {}
+
+        # File name -> what we know about a file that changed but hasn't settled yet
+        self.settling = {}
+
+        self.stopping = threading.Event()
+
+    # Stages whose inputs match a file name
+    def stagesFor(self, fileName:str):
+        ######################
+        # fileName:str -> Name of the file, without the directory
+        ######################
+
+        stages = []
+        for pattern, pattern_stages in self.patterns.items():
+            if fnmatch.fnmatchcase(fileName.lower(), pattern.lower()):
+                stages.extend(stage for stage in pattern_stages if stage not in stages)
+
+        return stages
+
+    # Size and modified time of everything in the directory we care about
+    def snapshot(self):
+        files = {}
+        for entry in os.scandir(self.watchDir):
+            # Excel and LibreOffice drop lock files next to the workbook while it is open
+            if entry.is_file() and not entry.name.startswith(("~$", ".~lock")) and self.stagesFor(entry.name):
+                entry_stat = entry.stat()
+                files[entry.name] = (entry_stat.st_size, entry_stat.st_mtime_ns)
+
+        return files
+
+    # Look at the directory once. Files that changed start settling, files that settled get their stages queued
+    def poll(self):
+        now = time.time()
+        files = self.snapshot()
+
+        for fileName, signature in files.items():
+            if self.seen.get(fileName) == signature:
+                continue
+
+            # Still being written, or just showed up. The clock restarts every time it changes
+            settling = self.settling.get(fileName)
+            if settling is None:
+                # The modified time is the closest thing we have to when the export arrived
+                self.settling[fileName] = {"arrived": min(now, signature[1] / 1e9), "detected": now,
+                                           "signature": signature, "stableSince": now}
+                print("ExportWatcher::poll - Saw", fileName, "change, waiting for it to settle")
+            elif settling["signature"] != signature:
+                settling["signature"] = signature
+                settling["stableSince"] = now
+
+        # A file that went away while it was settling was a temp file or a cancelled copy
+        for fileName in [fileName for fileName in self.settling if fileName not in files]:
+            del self.settling[fileName]
+
+        for fileName, settling in list(self.settling.items()):
+            if now - settling["stableSince"] < self.settleSeconds:
+                continue
+
+            del self.settling[fileName]
+            self.seen[fileName] = settling["signature"]
+            settling["settled"] = now
+            settling["file"] = fileName
+            for stage in self.stagesFor(fileName):
+                self.enqueue(stage, settling)
+
+        # Files that were deleted can come back later as new exports
+        for fileName in [fileName for fileName in self.seen if fileName not in files]:
+            del self.seen[fileName]
+
+    # Put a stage in line to run, unless it is already waiting
+    def enqueue(self, stage:str, trigger:dict):
+        ######################
+        # stage:str -> Stage to rerun
+        # trigger:dict -> The settled file that set it off, with its timings
+        ######################
+
+        with self.lock:
+            if stage in self.waiting:
+                self.waiting[stage].append(trigger)
+                return
+            self.waiting[stage] = [trigger]
+
+        print("ExportWatcher::enqueue - Queued", stage, "for", trigger["file"])
+        self.stageQueue.put(stage)
+
+    # Run queued stages one at a time until we are told to stop
+    def work(self):
+        while not self.stopping.is_set():
+            try:
+                stage = self.stageQueue.get(timeout = self.pollSeconds)
+            except queue.Empty:
+                continue
+
+            # Files that land from here on need another run, so let go of the triggers before starting
+            with self.lock:
+                triggers = self.waiting.pop(stage)
+
+            started = time.time()
+            try:
+                status, inputs = self.runStage(stage, [trigger["file"] for trigger in triggers])
+            except Exception as error:
+                print("ExportWatcher::work - Error: Stage", stage, "failed:", error)
+                status, inputs = 1, []
+            self.logRefresh(stage, triggers, started, time.time(), status, inputs)
+            self.stageQueue.task_done()
+
+    # Report how long it took from each export landing to its report being refreshed
+    def logRefresh(self, stage:str, triggers:list, started:float, finished:float, status:int, inputs:list):
+        ######################
+        # stage:str -> Stage that ran
+        # triggers:list -> Settled files that set it off
+        # started:float -> When the stage started
+        # finished:float -> When the stage finished
+        # status:int -> 0 when the stage ran
+        # inputs:list -> Absolute paths of the files the stage read
+        ######################
+
+        for trigger in triggers:
+            # A stage that ran without reading the new export didn't refresh anything from it
+            if status == 0 and os.path.abspath(os.path.join(self.watchDir, trigger["file"])) not in inputs:
+                print("ExportWatcher::logRefresh - Warning: " + stage + " ran but never read " + trigger["file"] +
+                      ", so its reports were not refreshed from it")
+                continue
+
+            record = {"stage": stage, "file": trigger["file"], "status": status,
+                      "arrived": round(trigger["arrived"], 3),
+                      "detectSeconds": round(trigger["detected"] - trigger["arrived"], 3),
+                      "settleSeconds": round(trigger["settled"] - trigger["detected"], 3),
+                      "queueSeconds": round(started - trigger["settled"], 3),
+                      "runSeconds": round(finished - started, 3),
+                      "latencySeconds": round(finished - trigger["arrived"], 3)}
+
+            print("ExportWatcher::logRefresh - {} {} after {} arrived: {:.1f}s total ({:.1f}s to notice, {:.1f}s settling, "
+                  "{:.1f}s queued, {:.1f}s running)".format(stage, "refreshed" if status == 0 else "FAILED", record["file"], record["latencySeconds"], record["detectSeconds"], record["settleSeconds"],
+                  record["queueSeconds"], record["runSeconds"]))
+
+            if self.logPath is not None:
+                with open(self.logPath, "a") as log_file:
+                    log_file.write(json.dumps(record) + "\n")
+
+    # Watch until interrupted. Files already in the directory when we start count as seen
+    def run(self):
+        self.seen = self.snapshot()
+        print("ExportWatcher::run - Watching", self.watchDir, "for", len(self.patterns), "export patterns. Ctrl+C to stop")
+
+        worker = threading.Thread(target = self.work, name = "ExportWatcherWorker", daemon = True)
+        worker.start()
+        try:
+            while not self.stopping.is_set():
+                self.poll()
+                self.stopping.wait(self.pollSeconds)
+        except KeyboardInterrupt:
+            print("ExportWatcher::run - Stopping")
+        finally:
+            self.stopping.set()
+            worker.join()
@@ -0,0 +1,359 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the local JSON service the dashboard can fetch crosstabs and counts from instead of parsing the exports in the browser
+
+# Include the goodies we are going to need
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Import our shared helpers
+import Utils.CountCube as CountCube
+
+# Where the service listens when nobody says otherwise. Local only, since the exports have reviewer names in them
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# The only web page allowed to read the responses. Next's dev server runs the dashboard here
+DEFAULT_ALLOWED_ORIGIN = "http://localhost:3000"
+
+# Most encoded results kept around. The least recently used ones get dropped past this
+MAX_CACHED_RESULTS = 256
+
+# What the summary view holds, matching what the dashboard works out for a submission export.
+# Format -> "result name": ("crosstab", rows column, columns column) or ("percent", column)
+SUMMARY_VIEWS = {"orgTypeCrossTab": ("crosstab", "Assigned_Subcommittee", "Org_Type"),
+                 "intlCrossTab": ("crosstab", "International(Y/N)", "Assigned_Subcommittee"),
+                 "countryCrossTab": ("crosstab", "Origin_Country", "Assigned_Subcommittee"),
+                 "orgTypePercentages": ("percent", "Org_Type"),
+                 "orgTypeBySubcommitteeCrossTab": ("crosstab", "Org_Type", "Assigned_Subcommittee")}
+
+# Columns the crosstab and counts views will slice by. Only the summary's dimensions, so names and comments never go out
+DIMENSIONS = list(dict.fromkeys(column for spec in SUMMARY_VIEWS.values() for column in spec[1:]))
+
+# Query string values each view reads. Anything else is dropped before the result is looked up
+VIEW_PARAMETERS = {"crosstab": ["rows", "cols"],
+                   "counts": ["by", "unique", "percent"],
+                   "summary": [],
+                   "columns": []}
+
+
+# Raised for a request that can't be answered. Carries the HTTP status to send back
+class ServiceError(Exception):
+
+    # Define what it's constructor sets up
+    def __init__(self, status:int, message:str):
+        ######################
+        # status:int -> HTTP status code
+        # message:str -> What went wrong, sent back in the json body
+        ######################
+
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# Define the class and it's methods
+class ReportService:
+
+    # Define what it's constructor sets up
+    def __init__(self, session, allowedOrigin:str = DEFAULT_ALLOWED_ORIGIN, maxResults:int = MAX_CACHED_RESULTS):
+        ######################
+        # session -> AnalysisSession holding the cleaned frames. The stages that ran before the service started filled it
+        # allowedOrigin:str -> Origin of the dashboard page. Requests from any other page get turned away
+        # maxResults:int -> Most encoded results to keep
+        ######################
+
+        self.session = session
+        self.allowedOrigin = allowedOrigin
+        self.maxResults = maxResults
+
+        # (data fingerprint, view, parameters) -> encoded json body. Oldest use first. Requests only ever read the frames, so results never go stale
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+
+        # The session isn't thread safe, so looking frames up and rebuilding them happens one request at a time
+        self.sessionLock = threading.RLock()
+
+    # Name a frame is served under, like paper/papers_post_transfer
+    def datasetName(self, key:tuple):
+        ######################
+        # key:tuple -> Frame key from the session
+        ######################
+
+        program = key[0].replace("Analytics", "").lower()
+        return program + "/" + os.path.splitext(os.path.basename(key[1]))[0]
+
+    # Every frame being served. The same file cleaned with two alias maps gets the map's fingerprint tacked on
+    def datasets(self):
+        with self.sessionLock:
+            keys = [key for key in self.session.frames if key in self.session.sources]
+
+        names = [self.datasetName(key) for key in keys]
+        datasets = {}
+        for name, key in zip(names, keys):
+            if names.count(name) > 1:
+                name = name + "~" + key[4][:6]
+            datasets[name] = key
+
+        return datasets
+
+    # Fingerprint of the data behind a frame. The session key holds the file's modified time and size and the alias map
+    def dataFingerprint(self, key:tuple):
+        ######################
+        # key:tuple -> Frame key from the session
+        ######################
+
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+
+    # Find a dataset's frame, rebuilding it first if its export changed on disk since it was cleaned
+    def frameFor(self, name:str):
+        ######################
+        # name:str -> Dataset name from datasets
+        ######################
+
+        with self.sessionLock:
+            key = self.datasets().get(name)
+            if key is None:
+                raise ServiceError(404, "No dataset named " + name)
+
+            try:
+                file_stat = os.stat(key[1])
+            except FileNotFoundError:
+                raise ServiceError(404, "The export behind " + name + " is gone")
+            if (file_stat.st_mtime_ns, file_stat.st_size) == (key[2], key[3]):
+                return key, self.session.frames[key][0]
+
+            # Drop the old frame first so it doesn't count against the memory limit while the new one is cleaned
+            analytics, filePath, listOfColumnAliases = self.session.sources.pop(key)
+            self.session.frames.pop(key, None)
+            print("ReportService::frameFor -", filePath, "changed, cleaning it again")
+
+            # Results for the old data can never be asked for again
+            old_fingerprint = self.dataFingerprint(key)
+            with self.lock:
+                self.results = OrderedDict((result_key, body) for result_key, body in self.results.items() if result_key[0] != old_fingerprint)
+
+            # The session may not keep a frame bigger than its limit, so serve the one it hands back
+            key = self.session.frameKey(analytics, filePath, listOfColumnAliases)
+            return key, self.session.getCleanFrame(analytics, filePath, listOfColumnAliases)
+
+    # Rows by columns counts, keyed the way the dashboard's CrossTabResult is
+    def crossTab(self, df_data, rowsColumn:str, columnsColumn:str):
+        ######################
+        # df_data -> Cleaned frame
+        # rowsColumn:str -> Column for the rows of the cross tab
+        # columnsColumn:str -> Column for the columns of the cross tab
+        ######################
+
+        self.checkColumns(df_data, [rowsColumn, columnsColumn, "ID"])
+        cube = CountCube.CountCube([rowsColumn, columnsColumn]).update(df_data).result()
+        cross_tab = CountCube.crossTab(cube, rowsColumn, columnsColumn)
+
+        return {str(row): {str(column): int(count) for column, count in counts.items() if count}
+                for row, counts in cross_tab.iterrows()}
+
+    # Counts for each value of a column, either submissions (first row for each ID) or rows
+    def counts(self, df_data, column:str, unique:bool = True, percent:bool = False):
+        ######################
+        # df_data -> Cleaned frame
+        # column:str -> Column to count by
+        # unique:bool -> Count each submission once like the reports do. False counts rows like the dashboard does
+        # percent:bool -> Hand back fractions of the total instead of counts
+        ######################
+
+        self.checkColumns(df_data, [column, "ID"])
+        cube = CountCube.CountCube([column]).update(df_data).result()
+        if unique:
+            counts = CountCube.firstIDCounts(cube, column)
+        else:
+            counts = cube["Rows"].groupby(level = column, observed = True).sum()
+
+        if percent:
+            total = counts.sum()
+            return {str(value): float(count / total) for value, count in counts.items()}
+
+        return {str(value): int(count) for value, count in counts.items()}
+
+    # Turn away a column the service won't slice by. Names, emails, and comments stay on this machine
+    def checkDimensions(self, columns:list):
+        ######################
+        # columns:list -> Columns asked for in the query string
+        ######################
+
+        not_allowed = [column for column in columns if column not in DIMENSIONS]
+        if not_allowed:
+            raise ServiceError(400, "Can only slice by " + ", ".join(DIMENSIONS) + ", not " + ", ".join(not_allowed))
+
+    # Let the caller know about a column the frame doesn't have
+    def checkColumns(self, df_data, columns:list):
+        ######################
+        # df_data -> Cleaned frame
+        # columns:list -> Columns the view needs
+        ######################
+
+        missing = [column for column in columns if column not in df_data.columns]
+        if missing:
+            raise ServiceError(400, "Dataset has no column " + ", ".join(missing))
+
+    # Work out a view of a dataset
+    def compute(self, df_data, view:str, parameters:dict):
+        ######################
+        # df_data -> Cleaned frame
+        # view:str -> One of crosstab, counts, summary, columns
+        # parameters:dict -> Query string values
+        ######################
+
+        if view == "crosstab":
+            if "rows" not in parameters or "cols" not in parameters:
+                raise ServiceError(400, "crosstab needs rows and cols")
+            self.checkDimensions([parameters["rows"], parameters["cols"]])
+            return self.crossTab(df_data, parameters["rows"], parameters["cols"])
+
+        if view == "counts":
+            if "by" not in parameters:
+                raise ServiceError(400, "counts needs by")
+            self.checkDimensions([parameters["by"]])
+            return self.counts(df_data, parameters["by"], parameters.get("unique", "1") != "0",
+                               parameters.get("percent", "0") != "0")
+
+        if view == "summary":
+            summary = {}
+            for result_name, spec in SUMMARY_VIEWS.items():
+                if all(column in df_data.columns for column in spec[1:]):
+                    if spec[0] == "crosstab":
+                        summary[result_name] = self.crossTab(df_data, spec[1], spec[2])
+                    else:
+                        summary[result_name] = self.counts(df_data, spec[1], percent = True)
+            return summary
+
+        if view == "columns":
+            return {"rows": int(df_data.shape[0]), "columns": [str(column) for column in df_data.columns]}
+
+        raise ServiceError(404, "No view named " + view)
+
+    # Answer a GET. Hands back (status, encoded body, etag)
+    def handle(self, path:str, ifNoneMatch:str = None):
+        ######################
+        # path:str -> Request path with its query string
+        # ifNoneMatch:str -> The request's If-None-Match header, or None
+        ######################
+
+        url = urlsplit(path)
+        parts = [part for part in url.path.split("/") if part]
+
+        # /api/datasets lists what is being served
+        if parts == ["api", "datasets"]:
+            listing = []
+            with self.sessionLock:
+                datasets = [(name, key, self.session.frames[key][0]) for name, key in self.datasets().items()]
+            for name, key, df_data in datasets:
+                listing.append({"name": name, "file": os.path.basename(key[1]), "rows": int(df_data.shape[0]),
+                                "etag": self.dataFingerprint(key)})
+            return 200, json.dumps(listing).encode("utf-8"), None
+
+        # /api/<program>/<file>/<view>
+        if len(parts) != 4 or parts[0] != "api":
+            raise ServiceError(404, "Expected /api/datasets or /api/<program>/<file>/<view>")
+
+        if parts[3] not in VIEW_PARAMETERS:
+            raise ServiceError(404, "No view named " + parts[3])
+        key, df_data = self.frameFor(parts[1] + "/" + parts[2])
+
+        # Only the values the view reads are part of the result, so junk in the query string can't fill the cache
+        parameters = {name: values[-1] for name, values in parse_qs(url.query).items() if name in VIEW_PARAMETERS[parts[3]]}
+        for flag in ("unique", "percent"):
+            if flag in parameters:
+                parameters[flag] = "0" if parameters[flag] == "0" else "1"
+
+        # The tag changes whenever the export or the alias map does, so a cached response is good as long as it matches
+        result_key = (self.dataFingerprint(key), parts[3], tuple(sorted(parameters.items())))
+        etag = '"' + hashlib.sha256(repr(result_key).encode("utf-8")).hexdigest()[:24] + '"'
+        if ifNoneMatch is not None and etag in [tag.strip() for tag in ifNoneMatch.split(",")]:
+            return 304, b"", etag
+
+        with self.lock:
+            body = self.results.get(result_key)
+            if body is not None:
+                self.results.move_to_end(result_key)
+        if body is None:
+            body = json.dumps(self.compute(df_data, parts[3], parameters)).encode("utf-8")
+            with self.lock:
+                self.results[result_key] = body
+                while len(self.results) > self.maxResults:
+                    self.results.popitem(last = False)
+
+        return 200, body, etag
+
+    # Serve until interrupted
+    def serve(self, host:str = DEFAULT_HOST, port:int = DEFAULT_PORT):
+        ######################
+        # host:str -> Address to listen on
+        # port:int -> Port to listen on
+        ######################
+
+        server = ThreadingHTTPServer((host, port), requestHandler(self))
+        server.daemon_threads = True
+
+        print("ReportService::serve - Serving", len(self.datasets()), "datasets on http://" + host + ":" + str(port) + "/api/datasets to",
+              self.allowedOrigin + ". Ctrl+C to stop")
+        for name in self.datasets():
+            print("    " + name)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("ReportService::serve - Stopping")
+        finally:
+            server.server_close()
+
+
+# Build the request handler class for a service. The standard library server makes a handler per request from the class
+def requestHandler(service:ReportService):
+    ######################
+    # service:ReportService -> The service the requests go to
+    ######################
+
+    class ReportRequestHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            start = time.perf_counter()
+            origin = self.headers.get("Origin")
+            try:
+                # Browsers send the page's origin on cross site fetches. Any page but the dashboard gets nothing
+                if origin is not None and origin != service.allowedOrigin:
+                    raise ServiceError(403, "Origin " + origin + " is not allowed")
+                status, body, etag = service.handle(self.path, self.headers.get("If-None-Match"))
+            except ServiceError as error:
+                status, body, etag = error.status, json.dumps({"error": error.message}).encode("utf-8"), None
+            except Exception as error:
+                print("ReportService::do_GET - Error:", repr(error))
+                status, body, etag = 500, json.dumps({"error": "Internal error"}).encode("utf-8"), None
+
+            self.send_response(status)
+            # The dashboard runs on its own port, so let it and only it read the responses
+            self.send_header("Access-Control-Allow-Origin", service.allowedOrigin)
+            self.send_header("Access-Control-Expose-Headers", "ETag")
+            self.send_header("Vary", "Origin")
+            if etag is not None:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            if status != 304:
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+
+            print("ReportService::request - GET %s %d %.1f ms" % (self.path, status, (time.perf_counter() - start) * 1000))
+
+        # Our own request line above replaces the default stderr log
+        def log_message(self, format, *args):
+            pass
+
+    return ReportRequestHandler
@@ -0,0 +1,123 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the delta mode that only re-summarizes the submissions whose reviews changed since the last pull
+
+# Include the goodies we are going to need
+import hashlib
+import os
+import pickle
+import pandas as pd
+
+# Bump this when the layout of the saved state changes so old state files get ignored
+STATE_VERSION = 2
+
+# Columns that identify a single review. The export has no review ID so the reviewer's name has to do
+REVIEW_KEY_COLUMNS = ["ID", "ReviewerLastname", "ReviewerFirstname"]
+
+# Define the class and it's methods
+class ReviewDelta:
+
+    # Define what it's constructor sets up
+    def __init__(self, statePath:str, reviewSummary, keyColumns:list = REVIEW_KEY_COLUMNS, idColumn:str = "ID"):
+        ######################
+        # statePath:str -> File where the review hashes and per-ID summary rows are kept between runs
+        # reviewSummary -> ReviewSummary object with the spec we are summarizing with
+        # keyColumns:list -> Columns that identify a single review
+        # idColumn:str -> Column holding the submission ID we summarize by
+        ######################
+
+        self.statePath = statePath
+        self.reviewSummary = reviewSummary
+        self.keyColumns = keyColumns
+        self.idColumn = idColumn
+
+        # A different spec or text shape means the saved summary rows have different columns, so both are part of the state
+        self.specFingerprint = hashlib.sha256(repr((reviewSummary.spec, reviewSummary.collectShape)).encode("utf-8")).hexdigest()
+
+        # What the last run did
+        self.affectedIDs = []
+
+    # Hash every review so we can tell which ones were added, removed, or edited since the last pull
+    def reviewHashes(self, df_reviews:pd.DataFrame):
+        ######################
+        # df_reviews:pd.DataFrame -> Cleaned review data, one row per review
+        ######################
+
+        key_columns = [column for column in self.keyColumns if column in df_reviews.columns]
+
+        # Number repeat reviews by the same person so each one still gets its own key
+        occurrence = df_reviews.groupby(key_columns, dropna = False, sort = False).cumcount()
+        review_keys = pd.util.hash_pandas_object(df_reviews[key_columns].assign(_Occurrence = occurrence), index = False)
+
+        # Only the columns the spec reads can change the summary
+        source_columns = list(dict.fromkeys([self.idColumn] + [entry[1] for entry in self.reviewSummary.spec]))
+        row_hashes = pd.util.hash_pandas_object(df_reviews[source_columns], index = False)
+
+        return pd.DataFrame({"Key": review_keys.to_numpy(), self.idColumn: df_reviews[self.idColumn].to_numpy(),
+                             "Hash": row_hashes.to_numpy()})
+
+    # Read the state from the last run. Returns None when there is nothing usable
+    def loadState(self):
+        if not os.path.exists(self.statePath):
+            return None
+
+        with open(self.statePath, "rb") as state_file:
+            state = pickle.load(state_file)
+
+        if state.get("version") != STATE_VERSION or state.get("spec") != self.specFingerprint:
+            print("ReviewDelta::loadState - Saved state was built differently, starting over")
+            return None
+
+        return state
+
+    # Save the state for the next run
+    def saveState(self, df_hashes:pd.DataFrame, df_summary:pd.DataFrame):
+        ######################
+        # df_hashes:pd.DataFrame -> Review keys and hashes from reviewHashes
+        # df_summary:pd.DataFrame -> Summary rows, one per ID
+        ######################
+
+        state = {"version": STATE_VERSION, "spec": self.specFingerprint, "hashes": df_hashes, "summary": df_summary}
+
+        # Write to a temp name first so a crash never leaves a half written state behind
+        with open(self.statePath + ".tmp", "wb") as state_file:
+            pickle.dump(state, state_file)
+        os.replace(self.statePath + ".tmp", self.statePath)
+
+    # Summarize the reviews, only redoing the IDs whose reviews changed since the saved state
+    def summarize(self, df_reviews:pd.DataFrame):
+        ######################
+        # df_reviews:pd.DataFrame -> Cleaned review data from the latest export, one row per review
+        ######################
+
+        df_hashes = self.reviewHashes(df_reviews)
+        state = self.loadState()
+
+        # Nothing to compare against so do everything
+        if state is None:
+            df_summary = self.reviewSummary.summarize(df_reviews, self.idColumn)
+            self.affectedIDs = df_summary[self.idColumn].tolist()
+            self.saveState(df_hashes, df_summary)
+            print("ReviewDelta::summarize - No saved state, summarized all", len(self.affectedIDs), "IDs")
+            return df_summary
+
+        # Line up the old and new reviews. Anything added, removed, or edited touches its ID
+        df_compare = state["hashes"].merge(df_hashes, on = "Key", how = "outer", suffixes = ("_Old", "_New"))
+        changed = df_compare["Hash_Old"] != df_compare["Hash_New"]
+        self.affectedIDs = pd.concat([df_compare.loc[changed, self.idColumn + "_Old"],
+                                      df_compare.loc[changed, self.idColumn + "_New"]]).dropna().unique().tolist()
+
+        # Re-summarize just the affected IDs from their current reviews
+        df_affected = df_reviews[df_reviews[self.idColumn].isin(self.affectedIDs)]
+        df_updated = self.reviewSummary.summarize(df_affected, self.idColumn)
+
+        # Swap the updated rows in and keep the IDs in the order they show up in the export, like a full run would
+        df_kept = state["summary"][~state["summary"][self.idColumn].isin(self.affectedIDs)]
+        id_order = df_reviews[self.idColumn].dropna().drop_duplicates()
+        df_summary = pd.concat([df_kept, df_updated]).set_index(self.idColumn).reindex(id_order).reset_index()
+
+        self.saveState(df_hashes, df_summary)
+        print("ReviewDelta::summarize - Updated", len(df_updated.index), "of", len(df_summary.index),
+              "IDs. Reviews changed:", int(changed.sum()))
+
+        return df_summary
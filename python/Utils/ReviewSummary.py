@@ -0,0 +1,207 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the shared engine that turns a declarative spec into a per-ID review summary
+
+# Include the goodies we are going to need
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Import our shared helpers
+import Utils.Tracer as Tracer
+
+# Reducers a spec entry can ask for
+# first -> first value seen for the ID
+# mean -> numeric mean rounded to 2 places. Text junk is ignored
+# sum -> numeric sum. Text junk is ignored
+# count_equals -> number of reviews where the source column equals the given value
+# collect -> the non-empty values, laid out the way collectShape says
+# join -> non-empty values joined into one string, one per line
+# json -> non-empty values as a JSON array string
+REDUCERS = ["first", "mean", "sum", "count_equals", "collect", "join", "json"]
+
+# Reducers that gather free text. These skip the groupby and go through collate instead
+TEXT_REDUCERS = ["collect", "join", "json"]
+
+# How a collect entry lays out the text it gathers
+# list -> python list in the cell, like the reports have always had
+# joined -> one string, one value per line
+# json -> JSON array string
+# long -> left out of the summary and written to its own table with one row per value
+COLLECT_SHAPES = ["list", "joined", "json", "long"]
+
+
+# Source columns a spec reads, in the order they first show up. Reports use this to say which columns to load
+def sourceColumns(spec:list):
+    ######################
+    # spec:list -> Review summary recipe. Format -> (Output_Column, Source_Column, Reducer[, Value])
+    ######################
+
+    return list(dict.fromkeys(entry[1] for entry in spec))
+
+
+# Define the class and it's methods
+class ReviewSummary:
+
+    # Define what it's constructor sets up. The spec is compiled once here so it can be reused on any number of frames
+    def __init__(self, spec:list, collectShape:str = "list", tracer:Tracer.Tracer = None):
+        ######################
+        # spec:list -> List of (Output_Column, Source_Column, Reducer) tuples. count_equals takes a 4th value to compare against
+        # collectShape:str -> How the collect entries lay out the text they gather. One of COLLECT_SHAPES
+        # tracer:Tracer.Tracer -> Tracer the summarize and write spans record into. None turns tracing off
+        ######################
+
+        self.spec = spec
+        self.collectShape = collectShape
+        self.tracer = tracer
+
+        # Output column -> (working column, aggregation) for the single groupby call
+        self.aggregations = {}
+
+        # (output column, source column, shape) for the text entries, in spec order
+        self.textEntries = []
+
+        # Columns that need rounding once we are done
+        self.meanColumns = []
+
+        for entry in spec:
+            output_column, source_column, reducer = entry[:3]
+
+            if reducer not in REDUCERS:
+                raise ValueError("ReviewSummary::__init__ - Unknown reducer '" + str(reducer) + "' for column " + output_column)
+
+            # The working frame uses the output name so two outputs can read the same source column
+            if reducer == "count_equals":
+                self.aggregations[output_column] = (output_column, "sum")
+            elif reducer == "collect":
+                self.textEntries.append((output_column, source_column, self.collectShape))
+            elif reducer == "join":
+                self.textEntries.append((output_column, source_column, "joined"))
+            elif reducer == "json":
+                self.textEntries.append((output_column, source_column, "json"))
+            else:
+                self.aggregations[output_column] = (output_column, reducer)
+
+            if reducer == "mean":
+                self.meanColumns.append(output_column)
+
+    # Run the spec over all the reviews and return one row per ID
+    @Tracer.traced("summarize")
+    def summarize(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        ######################
+        # df_reviews:pd.DataFrame -> Cleaned review data, one row per review
+        # idColumn:str -> Column holding the submission ID we summarize by
+        ######################
+
+        # Build the working columns each reducer needs
+        working_columns = {idColumn: df_reviews[idColumn]}
+        for entry in self.spec:
+            output_column, source_column, reducer = entry[:3]
+
+            if reducer == "count_equals":
+                working_columns[output_column] = df_reviews[source_column] == entry[3]
+            elif reducer in ("mean", "sum"):
+                working_columns[output_column] = pd.to_numeric(df_reviews[source_column], errors = "coerce")
+            elif reducer not in TEXT_REDUCERS:
+                working_columns[output_column] = df_reviews[source_column]
+
+        # Summarize every ID in one pass. sort = False keeps the IDs in the order they first show up
+        grouped = pd.DataFrame(working_columns).groupby(idColumn, sort = False)
+        if self.aggregations:
+            df_summary = grouped.agg(**self.aggregations).reset_index()
+        else:
+            df_summary = grouped.size().reset_index()[[idColumn]]
+
+        # The text columns get gathered separately, lined up with the summary rows by group number
+        group_numbers = grouped.ngroup().to_numpy()
+        for output_column, cells in self.collate(df_reviews, group_numbers, df_summary.shape[0]).items():
+            df_summary[output_column] = pd.Series(cells, index = df_summary.index, dtype = object)
+
+        # Put the columns back in the order the spec lists them. Long shaped entries aren't in the summary at all
+        df_summary = df_summary[[idColumn] + [entry[0] for entry in self.spec if entry[0] in df_summary.columns]]
+
+        # Round the means like the chairs are used to seeing
+        return df_summary.round({column: 2 for column in self.meanColumns})
+
+    # Gather the non-empty text for every ID. One null check covers all the text columns, then each column is
+    # sorted by group once and sliced, instead of calling back into python for every ID
+    def collate(self, df_reviews:pd.DataFrame, groupNumbers:np.ndarray, groupCount:int):
+        ######################
+        # df_reviews:pd.DataFrame -> Cleaned review data, one row per review
+        # groupNumbers:np.ndarray -> Summary row each review belongs to. -1 for reviews without an ID
+        # groupCount:int -> Number of summary rows
+        ######################
+
+        text_entries = [entry for entry in self.textEntries if entry[2] != "long"]
+        if not text_entries:
+            return {}
+
+        present = df_reviews[[entry[1] for entry in text_entries]].notna().to_numpy() & (groupNumbers >= 0)[:, None]
+
+        collated = {}
+        for position, (output_column, source_column, shape) in enumerate(text_entries):
+            rows = present[:, position]
+            row_groups = groupNumbers[rows]
+
+            # A stable sort keeps each ID's values in the order the reviews came in
+            values = df_reviews[source_column][rows]
+            if shape == "joined":
+                values = values.astype(str)
+            values = values.iloc[np.argsort(row_groups, kind = "stable")].tolist()
+            bounds = np.concatenate(([0], np.cumsum(np.bincount(row_groups, minlength = groupCount)))).tolist()
+
+            cells = [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            if shape == "joined":
+                cells = ["\n".join(cell) for cell in cells]
+            elif shape == "json":
+                cells = [json.dumps(cell, default = str) for cell in cells]
+            collated[output_column] = cells
+
+        return collated
+
+    # The long shaped text entries as their own table, one row per non-empty value. IDs stay in the order they first
+    # show up, then the columns in spec order, then the reviews in the order they came in
+    def longTable(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        ######################
+        # df_reviews:pd.DataFrame -> Cleaned review data, one row per review
+        # idColumn:str -> Column holding the submission ID we summarize by
+        ######################
+
+        long_entries = [entry for entry in self.textEntries if entry[2] == "long"]
+        group_numbers, id_values = pd.factorize(df_reviews[idColumn])
+        present = df_reviews[[entry[1] for entry in long_entries]].notna().to_numpy() & (group_numbers >= 0)[:, None]
+
+        row_groups, entry_numbers, review_rows, values = [], [], [], []
+        for position, (output_column, source_column, shape) in enumerate(long_entries):
+            rows = present[:, position]
+            row_groups.append(group_numbers[rows])
+            entry_numbers.append(np.full(rows.sum(), position))
+            review_rows.append(np.flatnonzero(rows))
+            values.extend(df_reviews[source_column][rows].tolist())
+
+        if not values:
+            return pd.DataFrame({idColumn: [], "Column": [], "Value": []})
+
+        row_groups, entry_numbers, review_rows = np.concatenate(row_groups), np.concatenate(entry_numbers), np.concatenate(review_rows)
+        order = np.lexsort((review_rows, entry_numbers, row_groups))
+        column_names = np.array([entry[0] for entry in long_entries], dtype = object)
+
+        return pd.DataFrame({idColumn: id_values.take(row_groups[order]),
+                             "Column": column_names[entry_numbers[order]],
+                             "Value": np.array(values, dtype = object)[order]})
+
+    # Write the summary report. In the long shape the gathered text goes next to it as <name>_Text.csv
+    def writeCSV(self, df_summary:pd.DataFrame, fileName:str, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        ######################
+        # df_summary:pd.DataFrame -> Summary from summarize
+        # fileName:str -> Name of the summary report
+        # df_reviews:pd.DataFrame -> The reviews the summary came from
+        # idColumn:str -> Column holding the submission ID we summarize by
+        ######################
+
+        Tracer.writeCSV(df_summary, fileName, self.tracer)
+
+        if any(entry[2] == "long" for entry in self.textEntries):
+            stem, extension = os.path.splitext(fileName)
+            Tracer.writeCSV(self.longTable(df_reviews, idColumn), stem + "_Text" + extension, self.tracer)
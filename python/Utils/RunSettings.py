@@ -0,0 +1,43 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the run settings main.py builds from the command line and hands to every analytics object
+
+# Import our shared helpers
+import Utils.XCDCache as XCDCache
+import Utils.AnalysisSession as AnalysisSession
+import Utils.Tracer as Tracer
+import Utils.SQLiteStore as SQLiteStore
+import Utils.SubmissionWarehouse as SubmissionWarehouse
+import Utils.StageMemo as StageMemo
+
+# Define the class and it's methods
+class RunSettings:
+
+    # Define what it's constructor sets up
+    def __init__(self, cache:XCDCache.XCDCache = None, session:AnalysisSession.AnalysisSession = None, chunkRows:int = None,
+                 deltaStatePath:str = None, tracer:Tracer.Tracer = None, store:SQLiteStore.SQLiteStore = None,
+                 collectShape:str = "list", warehouse:SubmissionWarehouse.SubmissionWarehouse = None, memo:StageMemo.StageMemo = None,
+                 exports:dict = None):
+        ######################
+        # cache:XCDCache.XCDCache -> Cache every analytics loader reads the XCD exports through. None makes one with the default settings
+        # session:AnalysisSession.AnalysisSession -> Session the cleaned frames are kept in between reports. None cleans every load
+        # chunkRows:int -> Rows per chunk when the count reports stream the exports. None reads whole files like normal
+        # deltaStatePath:str -> State file for the paper review summary delta mode. None summarizes everything every time
+        # tracer:Tracer.Tracer -> Tracer the loads, cleans, analytics, and report writes record spans into. None turns tracing off
+        # store:SQLiteStore.SQLiteStore -> Store the count reports run against. None counts straight from the cleaned frames
+        # collectShape:str -> How the review summaries lay out the comments and biographies they gather. One of ReviewSummary.COLLECT_SHAPES
+        # warehouse:SubmissionWarehouse.SubmissionWarehouse -> Warehouse the scholarship analysis reads the past years from. None reads the yearly excel files
+        # memo:StageMemo.StageMemo -> Memo main.py checks before running a stage. None always runs the stages
+        # exports:dict -> Usual export file name -> path of a newer download to read in its place. The watcher fills this in
+        ######################
+
+        self.cache = XCDCache.XCDCache() if cache is None else cache
+        self.session = session
+        self.chunkRows = chunkRows
+        self.deltaStatePath = deltaStatePath
+        self.tracer = tracer
+        self.store = store
+        self.collectShape = collectShape
+        self.warehouse = warehouse
+        self.memo = memo
+        self.exports = {} if exports is None else exports
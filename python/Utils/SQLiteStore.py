@@ -0,0 +1,249 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the SQLite store that keeps cleaned XCD exports in indexed tables so the count reports and ad hoc questions run as GROUP BY queries
+
+# Include the goodies we are going to need
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import pandas as pd
+
+# Import our shared helpers
+import Utils.StageMemo as StageMemo
+
+# Bump this when the layout of the tables changes so an old database gets rebuilt instead of misread
+STORE_VERSION = 1
+
+# Columns that get an index when a table has them. These are what the reports and the chairs slice by
+INDEXED_COLUMNS = ["ID",
+                   "Assigned_Subcommittee",
+                   "Origin_Country",
+                   "Abstract_Accept_Reject",
+                   "Paper_Accept_Reject",
+                   "Tutorial_Accept_Reject",
+                   "PDW_Accept_Reject",
+                   "Acceptance"]
+
+# Bookkeeping columns every table carries. The hash identifies a row across exports, the order is its row in the latest export
+ROW_HASH_COLUMN = "_row_hash"
+ROW_ORDER_COLUMN = "_row_order"
+
+# Quote a column or table name for SQL. XCD names have spaces, slashes and question marks in them
+def quoteName(name:str):
+    ######################
+    # name:str -> Column or table name
+    ######################
+
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+# Define the class and it's methods
+class SQLiteStore:
+
+    # Define what it's constructor sets up
+    def __init__(self, dbPath:str):
+        ######################
+        # dbPath:str -> SQLite database file. It gets created if it isn't there yet
+        ######################
+
+        self.dbPath = dbPath
+        if os.path.dirname(dbPath):
+            os.makedirs(os.path.dirname(dbPath), exist_ok = True)
+
+        # The post paper review reports run on worker threads, so they share the connection through the lock
+        self.connection = sqlite3.connect(dbPath, check_same_thread = False)
+        self.lock = threading.RLock()
+
+        # Tables already checked against their export in this run
+        self.freshTables = set()
+
+        # One row per table saying which export and alias map it holds
+        with self.lock:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS _store_sources (table_name TEXT PRIMARY KEY, version INTEGER, "
+                                    "source TEXT, digest TEXT, aliases TEXT, columns TEXT, rows INTEGER, refreshed_at TEXT)")
+            self.connection.commit()
+
+    # Check every export against its table again on next use. The watcher calls this when a new export lands
+    def clearChecks(self):
+        with self.lock:
+            self.freshTables.clear()
+
+    # Name of the table an export lands in. The alias map is part of it since a different map gives different columns
+    def tableName(self, analytics, filePath:str, listOfColumnAliases:dict):
+        ######################
+        # analytics -> Analytics object that cleans the export
+        # filePath:str -> Path to the XCD export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        stem = re.sub(r"\W+", "_", os.path.splitext(os.path.basename(filePath))[0]).strip("_")
+        return type(analytics).__name__ + "_" + stem + "_" + self.aliasFingerprint(listOfColumnAliases)[:8]
+
+    # Hash of an alias map so we can tell when a table was cleaned with a different one
+    def aliasFingerprint(self, listOfColumnAliases:dict):
+        ######################
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        return hashlib.sha256(json.dumps(listOfColumnAliases, sort_keys = True).encode("utf-8")).hexdigest()
+
+    # Make sure the table for an export holds its latest contents. Only rows that changed since the last export get written
+    def refresh(self, analytics, filePath:str, listOfColumnAliases:dict):
+        ######################
+        # analytics -> Analytics object whose loadCleanXCDFile cleans the export, so the table matches the reports. Its cache hashes the export
+        # filePath:str -> Path to the XCD export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        table_name = self.tableName(analytics, filePath, listOfColumnAliases)
+
+        # The table stands in for the export, so the stage memo still needs to know the stage depends on it
+        StageMemo.recordInput(filePath)
+
+        with self.lock:
+            if table_name in self.freshTables:
+                return table_name
+
+            # Same export as last time means the table is already right and the excel file never gets opened
+            digest = analytics.settings.cache.fileDigest(filePath)
+            source = self.connection.execute("SELECT version, digest, columns FROM _store_sources WHERE table_name = ?",
+                                             (table_name,)).fetchone()
+            if source is not None and source[0] == STORE_VERSION and source[1] == digest:
+                print("SQLiteStore::refresh - " + table_name + " is up to date")
+                self.freshTables.add(table_name)
+                return table_name
+
+            df_data = self.sqlReady(analytics.loadCleanXCDFile(filePath, listOfColumnAliases))
+            columns = [column for column in df_data.columns if column not in (ROW_HASH_COLUMN, ROW_ORDER_COLUMN)]
+
+            # A new set of columns or an old layout means the table can't be patched, so start it over
+            if source is None or source[0] != STORE_VERSION or json.loads(source[2]) != columns:
+                self.rebuild(table_name, df_data)
+            else:
+                self.update(table_name, df_data)
+
+            self.connection.execute("INSERT OR REPLACE INTO _store_sources VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (table_name, STORE_VERSION, os.path.abspath(filePath), digest,
+                                     self.aliasFingerprint(listOfColumnAliases), json.dumps(columns),
+                                     int(df_data.shape[0]), time.strftime("%Y-%m-%dT%H:%M:%S")))
+            self.connection.commit()
+            self.freshTables.add(table_name)
+
+        return table_name
+
+    # Get a cleaned frame into a shape SQLite will take, with the row hash and order columns added
+    def sqlReady(self, df_data:pd.DataFrame):
+        ######################
+        # df_data:pd.DataFrame -> Cleaned XCD data
+        ######################
+
+        # XCD sometimes repeats a header. The reports only ever see the first one, so that is the one we keep.
+        # SQLite column names don't care about case, so two names that only differ by case count as repeats too
+        df_data = df_data.loc[:, ~pd.Index([str(column).lower() for column in df_data.columns]).duplicated()]
+        df_data.columns = [str(column) for column in df_data.columns]
+
+        # SQLite has no categories, so those go back to their plain values
+        for position in range(df_data.shape[1]):
+            if isinstance(df_data.dtypes.iloc[position], pd.CategoricalDtype):
+                df_data.isetitem(position, df_data.iloc[:, position].astype(object))
+
+        # Rows that are exact copies of each other get numbered so every row still has its own hash
+        row_hashes = pd.Series(pd.util.hash_pandas_object(df_data, index = False).to_numpy(), index = df_data.index)
+        copy_numbers = row_hashes.groupby(row_hashes).cumcount()
+        df_data[ROW_HASH_COLUMN] = row_hashes.map("{:016x}".format) + "-" + copy_numbers.astype(str)
+        df_data[ROW_ORDER_COLUMN] = range(df_data.shape[0])
+
+        return df_data
+
+    # Write a table from scratch and index it
+    def rebuild(self, table_name:str, df_data:pd.DataFrame):
+        ######################
+        # table_name:str -> Table to write
+        # df_data:pd.DataFrame -> Rows from sqlReady
+        ######################
+
+        df_data.to_sql(table_name, self.connection, if_exists = "replace", index = False)
+
+        self.connection.execute("CREATE UNIQUE INDEX " + quoteName(table_name + "__row_hash") + " ON " +
+                                quoteName(table_name) + " (" + quoteName(ROW_HASH_COLUMN) + ")")
+        for column in INDEXED_COLUMNS:
+            if column in df_data.columns:
+                self.connection.execute("CREATE INDEX " + quoteName(table_name + "_" + column) + " ON " +
+                                        quoteName(table_name) + " (" + quoteName(column) + ")")
+
+        print("SQLiteStore::rebuild - Wrote", df_data.shape[0], "rows to", table_name)
+
+    # Patch a table to match a new export of the same file. Rows are matched on their hash
+    def update(self, table_name:str, df_data:pd.DataFrame):
+        ######################
+        # table_name:str -> Table to patch
+        # df_data:pd.DataFrame -> Rows from sqlReady for the new export
+        ######################
+
+        table = quoteName(table_name)
+        stored_orders = dict(self.connection.execute("SELECT " + quoteName(ROW_HASH_COLUMN) + ", " +
+                                                     quoteName(ROW_ORDER_COLUMN) + " FROM " + table))
+        new_orders = dict(zip(df_data[ROW_HASH_COLUMN], df_data[ROW_ORDER_COLUMN]))
+
+        # Rows that are no longer in the export
+        removed = [(row_hash,) for row_hash in stored_orders if row_hash not in new_orders]
+        self.connection.executemany("DELETE FROM " + table + " WHERE " + quoteName(ROW_HASH_COLUMN) + " = ?", removed)
+
+        # Rows we have already got but that moved in the file. The order decides which row counts as an ID's first
+        moved = [(int(order), row_hash) for row_hash, order in new_orders.items()
+                 if row_hash in stored_orders and stored_orders[row_hash] != order]
+        self.connection.executemany("UPDATE " + table + " SET " + quoteName(ROW_ORDER_COLUMN) + " = ? WHERE " +
+                                    quoteName(ROW_HASH_COLUMN) + " = ?", moved)
+
+        # Rows that are new in this export
+        df_added = df_data[~df_data[ROW_HASH_COLUMN].isin(stored_orders.keys())]
+        df_added.to_sql(table_name, self.connection, if_exists = "append", index = False)
+
+        print("SQLiteStore::update - " + table_name + ": " + str(len(df_added)) + " added, " + str(len(removed)) +
+              " removed, " + str(len(moved)) + " moved, " + str(len(new_orders) - len(df_added) - len(moved)) + " untouched")
+
+    # Count the rows and unique submissions for every combination of the given columns, shaped like CountCube.result
+    def countCube(self, analytics, filePath:str, listOfColumnAliases:dict, cubeColumns:list, idColumns:list):
+        ######################
+        # analytics -> Analytics object that cleans the export
+        # filePath:str -> Path to the XCD export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        # cubeColumns:list -> Columns we want to be able to slice the counts by
+        # idColumns:list -> Columns that identify a unique submission. Its first row in the export is the one that counts
+        ######################
+
+        table_name = self.refresh(analytics, filePath, listOfColumnAliases)
+
+        cube_names = ", ".join(quoteName(column) for column in cubeColumns)
+        id_names = ", ".join(quoteName(column) for column in idColumns)
+        id_present = " AND ".join(quoteName(column) + " IS NOT NULL" for column in idColumns)
+        order = quoteName(ROW_ORDER_COLUMN)
+
+        # A row is an ID's first when nothing earlier in the export has the same ID. Empty IDs never count
+        query = ("SELECT " + cube_names + ", COUNT(*) AS \"Rows\", SUM(First_ID) AS First_IDs FROM ("
+                 "SELECT " + cube_names + ", CASE WHEN " + id_present + " AND " + order + " = MIN(" + order + ") OVER "
+                 "(PARTITION BY " + id_names + ") THEN 1 ELSE 0 END AS First_ID FROM " + quoteName(table_name) + ") "
+                 "GROUP BY " + cube_names)
+
+        return self.query(query).set_index(cubeColumns)
+
+    # Run a query and hand the result back as a frame. This is the one the chairs' ad hoc questions go through
+    def query(self, sql:str, parameters:tuple = ()):
+        ######################
+        # sql:str -> The SELECT to run
+        # parameters:tuple -> Values for any ? placeholders in the query
+        ######################
+
+        with self.lock:
+            return pd.read_sql_query(sql, self.connection, params = parameters)
+
+    # Print the tables in the store and where they came from
+    def printTables(self):
+        print("SQLiteStore::printTables - Tables in", self.dbPath)
+        for table_name, source, rows, refreshed_at in self.connection.execute(
+                "SELECT table_name, source, rows, refreshed_at FROM _store_sources ORDER BY table_name"):
+            print("  {:<60} {:>8} rows  from {} at {}".format(table_name, rows, os.path.basename(source), refreshed_at))
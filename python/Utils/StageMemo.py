@@ -0,0 +1,237 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the stage memo that hands back a stage's reports from last time when its inputs and code have not changed
+
+# Include the goodies we are going to need
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+# Bump this when the layout of an entry changes so old entries get ignored
+MEMO_VERSION = 1
+
+# Where the saved reports live when nobody says otherwise
+DEFAULT_MEMO_DIR = os.path.join(os.path.expanduser("~"), ".cache", "iitsec_stages")
+
+# Recorder for the stage that is running right now. None when nothing is being recorded
+activeRecorder = None
+
+
+# Hash the contents of a file. Kept here instead of using XCDCache so writing a report never has to pull in pandas
+def fileDigest(filePath:str):
+    ######################
+    # filePath:str -> Path to the file we want to hash
+    ######################
+
+    digest = hashlib.sha256()
+    with open(filePath, "rb") as file_handle:
+        for block in iter(lambda: file_handle.read(1024 * 1024), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+# Note a file the running stage read. The loaders call this so a stage's inputs are whatever it actually opened
+def recordInput(filePath:str):
+    ######################
+    # filePath:str -> File the stage read
+    ######################
+
+    if activeRecorder is not None:
+        activeRecorder.addInput(filePath)
+
+
+# Note a report the running stage wrote
+def recordOutput(fileName:str):
+    ######################
+    # fileName:str -> Report the stage wrote, relative to the output directory
+    ######################
+
+    if activeRecorder is not None:
+        activeRecorder.addOutput(fileName)
+
+
+# Define the class and it's methods
+class StageRecorder:
+
+    # Define what it's constructor sets up
+    def __init__(self):
+        # Absolute paths of the files read, in the order they were first read
+        self.inputs = {}
+
+        # Reports written, relative to the output directory
+        self.outputs = {}
+
+        # The post paper review reports are written from worker threads
+        self.lock = threading.Lock()
+
+        # Recorder that was active when this one started. Everything recorded here gets passed up to it too
+        self.parent = None
+
+    def addInput(self, filePath:str):
+        with self.lock:
+            self.inputs.setdefault(os.path.abspath(filePath), None)
+        if self.parent is not None:
+            self.parent.addInput(filePath)
+
+    def addOutput(self, fileName:str):
+        with self.lock:
+            self.outputs.setdefault(os.path.relpath(os.path.abspath(fileName)), None)
+        if self.parent is not None:
+            self.parent.addOutput(fileName)
+
+    # Start recording into this recorder. Use it as a with block around the stage. Recorders can be nested
+    def __enter__(self):
+        global activeRecorder
+        self.parent = activeRecorder
+        activeRecorder = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        global activeRecorder
+        activeRecorder = self.parent
+        self.parent = None
+        return False
+
+
+# Define the class and it's methods
+class StageMemo:
+
+    # Define what it's constructor sets up
+    def __init__(self, memoDir:str = DEFAULT_MEMO_DIR, force:bool = False):
+        ######################
+        # memoDir:str -> Directory where each stage's reports and what they were built from get saved
+        # force:bool -> When True every stage runs, and what it writes replaces the saved copy
+        ######################
+
+        self.memoDir = memoDir
+        self.force = force
+
+        # One line per stage this run for the report at the end
+        self.outcomes = []
+
+    # Directory for a stage run against a given set of settings, like the data directory
+    def entryDir(self, stageName:str, context:dict):
+        ######################
+        # stageName:str -> Name of the stage
+        # context:dict -> Settings that change which files the stage reads
+        ######################
+
+        key = hashlib.sha256(json.dumps({"stage": stageName, "context": context}, sort_keys = True).encode("utf-8")).hexdigest()
+        return os.path.join(self.memoDir, stageName + "-" + key[:16])
+
+    # See whether the saved reports for a stage are still good. Hands back the saved entry, or None and why not
+    def lookup(self, stageName:str, context:dict, codeFingerprint:str):
+        ######################
+        # stageName:str -> Name of the stage
+        # context:dict -> Settings that change which files the stage reads
+        # codeFingerprint:str -> Hash of the stage's code and alias maps
+        ######################
+
+        if self.force:
+            return None, "forced"
+
+        manifest_path = os.path.join(self.entryDir(stageName, context), "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None, "never run"
+
+        with open(manifest_path) as manifest_file:
+            entry = json.load(manifest_file)
+
+        if entry.get("version") != MEMO_VERSION or entry["code"] != codeFingerprint:
+            return None, "code or alias map changed"
+
+        # Nothing to check against means nothing says the reports are still good
+        if not entry["inputs"]:
+            return None, "no inputs were recorded"
+
+        # Same inputs means the same bytes in every file the stage read last time
+        for filePath, digest in entry["inputs"].items():
+            if not os.path.exists(filePath):
+                return None, os.path.basename(filePath) + " is gone"
+            if fileDigest(filePath) != digest:
+                return None, os.path.basename(filePath) + " changed"
+
+        return entry, "inputs and code unchanged"
+
+    # Copy a stage's saved reports into the output directory
+    def restore(self, stageName:str, context:dict, entry:dict):
+        ######################
+        # stageName:str -> Name of the stage
+        # context:dict -> Settings that change which files the stage reads
+        # entry:dict -> Saved entry from lookup
+        ######################
+
+        files_dir = os.path.join(self.entryDir(stageName, context), "files")
+        for fileName in entry["outputs"]:
+            if os.path.dirname(fileName):
+                os.makedirs(os.path.dirname(fileName), exist_ok = True)
+            shutil.copyfile(os.path.join(files_dir, fileName), fileName)
+            recordOutput(fileName)
+
+        # The restored reports stand for reading the same inputs again
+        for filePath in entry["inputs"]:
+            recordInput(filePath)
+
+        self.outcomes.append((stageName, "reused", str(len(entry["outputs"])) + " reports, saved " +
+                              str(round(entry["seconds"], 2)) + "s"))
+
+    # Save what a stage read and wrote so the next run can reuse it
+    def store(self, stageName:str, context:dict, codeFingerprint:str, recorder:StageRecorder, seconds:float, reason:str):
+        ######################
+        # stageName:str -> Name of the stage
+        # context:dict -> Settings that change which files the stage reads
+        # codeFingerprint:str -> Hash of the stage's code and alias maps
+        # recorder:StageRecorder -> What the stage read and wrote while it ran
+        # seconds:float -> How long the stage took, so the report can say what reusing it saves
+        # reason:str -> Why the saved copy could not be used, for the report
+        ######################
+
+        entry_dir = self.entryDir(stageName, context)
+
+        # An entry with no inputs would be reused no matter what changed, so don't keep one. Any old entry goes too
+        if not recorder.inputs:
+            if os.path.exists(entry_dir):
+                shutil.rmtree(entry_dir)
+            print("StageMemo::store - Warning: " + stageName + " did not record reading anything, so its reports were not saved")
+            self.outcomes.append((stageName, "ran", reason + ", nothing recorded as read so not saved"))
+            return
+
+        # Build the entry next to the old one and swap it in, so a crash never leaves half an entry behind
+        building_dir = entry_dir + ".tmp"
+        if os.path.exists(building_dir):
+            shutil.rmtree(building_dir)
+        os.makedirs(os.path.join(building_dir, "files"))
+
+        for fileName in recorder.outputs:
+            saved_path = os.path.join(building_dir, "files", fileName)
+            if os.path.dirname(saved_path):
+                os.makedirs(os.path.dirname(saved_path), exist_ok = True)
+            shutil.copyfile(fileName, saved_path)
+
+        entry = {"version": MEMO_VERSION,
+                 "stage": stageName,
+                 "context": context,
+                 "code": codeFingerprint,
+                 "inputs": {filePath: fileDigest(filePath) for filePath in recorder.inputs},
+                 "outputs": list(recorder.outputs),
+                 "seconds": seconds,
+                 "storedAt": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with open(os.path.join(building_dir, "manifest.json"), "w") as manifest_file:
+            json.dump(entry, manifest_file, indent = 2)
+
+        if os.path.exists(entry_dir):
+            shutil.rmtree(entry_dir)
+        os.replace(building_dir, entry_dir)
+
+        self.outcomes.append((stageName, "ran", reason + ", saved " + str(len(recorder.outputs)) + " reports from " +
+                              str(len(recorder.inputs)) + " inputs"))
+
+    # Print which stages were reused and which had to run
+    def printReport(self):
+        print("StageMemo::printReport - Stage reuse")
+        for stageName, outcome, detail in self.outcomes:
+            print("  {:<34} {:<7} {}".format(stageName, outcome, detail))
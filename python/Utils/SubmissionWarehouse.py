@@ -0,0 +1,223 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the multi-year submission warehouse. Each year's XCD export is cleaned once and kept as a year partitioned parquet dataset
+
+# Include the goodies we are going to need
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+import pandas as pd
+
+# Import our shared helpers
+import Utils.Tracer as Tracer
+import Utils.StageMemo as StageMemo
+import Utils.ValueMapper as ValueMapper
+import Utils.DtypeSchema as DtypeSchema
+
+# Bump this when the layout of the warehouse changes so an old manifest gets rebuilt instead of misread
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Where the warehouse lives when nobody says otherwise
+DEFAULT_WAREHOUSE_DIR = os.path.join("..", "Warehouse")
+
+# Column the partition year comes back in when the warehouse is read
+YEAR_COLUMN = "Submission_Year"
+
+# Define the class and it's methods
+class SubmissionWarehouse:
+
+    # Define what it's constructor sets up
+    def __init__(self, rootDir:str = DEFAULT_WAREHOUSE_DIR, firstYear:int = None, lastYear:int = None, tracer:Tracer.Tracer = None):
+        ######################
+        # rootDir:str -> Directory holding the partitions and the manifest
+        # firstYear:int -> Earliest year a read returns when the caller doesn't say. None starts at the first year ingested
+        # lastYear:int -> Latest year a read returns when the caller doesn't say. None runs to the last year ingested
+        # tracer:Tracer.Tracer -> Tracer the read spans record into. None turns tracing off
+        ######################
+
+        self.rootDir = rootDir
+        self.firstYear = firstYear
+        self.lastYear = lastYear
+        self.tracer = tracer
+        self.manifestPath = os.path.join(rootDir, MANIFEST_NAME)
+
+        # Program -> year -> what is in that partition. Years are strings since that is what json hands back
+        self.manifest = self.loadManifest()
+
+    # Read the manifest, or start an empty one if there is no warehouse yet
+    def loadManifest(self):
+        if os.path.exists(self.manifestPath):
+            with open(self.manifestPath) as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+
+            print("SubmissionWarehouse::loadManifest - Manifest version is out of date, starting a new one")
+
+        return {"version": MANIFEST_VERSION, "programs": {}}
+
+    # Write the manifest out. Goes to a temp name first so a crash never leaves a half written manifest behind
+    def saveManifest(self):
+        os.makedirs(self.rootDir, exist_ok = True)
+        with open(self.manifestPath + ".tmp", "w") as manifest_file:
+            json.dump(self.manifest, manifest_file, indent = 2, sort_keys = True)
+        os.replace(self.manifestPath + ".tmp", self.manifestPath)
+
+    # Years a program has partitions for, oldest first, limited to the range asked for
+    def years(self, program:str, firstYear:int = None, lastYear:int = None):
+        ######################
+        # program:str -> Program the partitions belong to, like papers or tutorials
+        # firstYear:int -> Earliest year to include. None uses the warehouse default
+        # lastYear:int -> Latest year to include. None uses the warehouse default
+        ######################
+
+        first_year = self.firstYear if firstYear is None else firstYear
+        last_year = self.lastYear if lastYear is None else lastYear
+
+        years = sorted(int(year) for year in self.manifest["programs"].get(program, {}))
+        return [year for year in years
+                if (first_year is None or year >= first_year) and (last_year is None or year <= last_year)]
+
+    # Fingerprint an alias map so a partition cleaned with a different one gets cleaned again
+    def aliasFingerprint(self, listOfColumnAliases:dict):
+        ######################
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        encoded = json.dumps(sorted(listOfColumnAliases.items(), key = str), default = str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    # Fingerprint the code that shapes a partition: the program's analytics module with its cleanData and dtype schema,
+    # the shared value and dtype helpers, this module, and the pandas version that writes the parquet
+    def cleanerFingerprint(self, analytics):
+        ######################
+        # analytics -> Analytics object for the program
+        ######################
+
+        digest = hashlib.sha256()
+        for module in (sys.modules[type(analytics).__module__], ValueMapper, DtypeSchema, sys.modules[__name__]):
+            with open(inspect.getsourcefile(module), "rb") as source_file:
+                digest.update(source_file.read())
+        digest.update(pd.__version__.encode("utf-8"))
+
+        return digest.hexdigest()[:16]
+
+    # Clean a year's XCD export with the program's own cleaning and store it as that year's partition.
+    # An export is a full snapshot of the year, so a new one replaces whatever the year held before
+    def ingest(self, program:str, year:int, filePath:str, analytics, listOfColumnAliases:dict):
+        ######################
+        # program:str -> Program the export belongs to, like papers or tutorials
+        # year:int -> Conference year the export is for
+        # filePath:str -> Path to the XCD export
+        # analytics -> Analytics object for the program. Its cleanData does the normalizing so the warehouse matches the reports, and its cache reads the export
+        # listOfColumnAliases:dict -> Dictionary contianing the mapping from crazy XCD names to our better names
+        ######################
+
+        year_key = str(int(year))
+        partitions = self.manifest["programs"].setdefault(program, {})
+
+        # Same file cleaned the same way as last time means there is nothing to do
+        digest = analytics.settings.cache.fileDigest(filePath)
+        alias_fingerprint = self.aliasFingerprint(listOfColumnAliases)
+        cleaner_fingerprint = self.cleanerFingerprint(analytics)
+        previous = partitions.get(year_key)
+        if previous is not None and os.path.exists(os.path.join(self.rootDir, previous["file"])):
+            if previous["digest"] != digest:
+                print("SubmissionWarehouse::ingest - " + program + " " + year_key + " export changed, ingesting it again")
+            elif previous.get("aliases") != alias_fingerprint:
+                print("SubmissionWarehouse::ingest - " + program + " " + year_key + " alias map changed, ingesting it again")
+            elif previous.get("cleaner") != cleaner_fingerprint:
+                print("SubmissionWarehouse::ingest - " + program + " " + year_key + " cleaning code changed, ingesting it again")
+            else:
+                print("SubmissionWarehouse::ingest - " + program + " " + year_key + " is already up to date")
+                return previous
+
+        df_data = analytics.cleanData(analytics.settings.cache.readExcel(filePath), listOfColumnAliases)
+        df_data = self.parquetReady(df_data)
+
+        # One file per year partition. The fingerprints in the name keep a replacement from clobbering the file being read
+        partition_name = hashlib.sha256((digest + alias_fingerprint + cleaner_fingerprint).encode("utf-8")).hexdigest()[:16]
+        relative_path = os.path.join(program, "year=" + year_key, "part-" + partition_name + ".parquet")
+        partition_path = os.path.join(self.rootDir, relative_path)
+        os.makedirs(os.path.dirname(partition_path), exist_ok = True)
+        df_data.to_parquet(partition_path + ".tmp", index = False)
+        os.replace(partition_path + ".tmp", partition_path)
+
+        partitions[year_key] = {"file": relative_path,
+                                "source": os.path.abspath(filePath),
+                                "digest": digest,
+                                "aliases": alias_fingerprint,
+                                "cleaner": cleaner_fingerprint,
+                                "rows": int(df_data.shape[0]),
+                                "columns": [str(column) for column in df_data.columns],
+                                "ingestedAt": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self.saveManifest()
+
+        # Only clean up the old file once the manifest points at the new one
+        if previous is not None and previous["file"] != relative_path:
+            old_path = os.path.join(self.rootDir, previous["file"])
+            if os.path.exists(old_path):
+                os.remove(old_path)
+
+        print("SubmissionWarehouse::ingest - Stored", df_data.shape[0], "rows of", program, year_key, "in", partition_path)
+        return partitions[year_key]
+
+    # Get a cleaned frame into a shape parquet will take
+    def parquetReady(self, df_data:pd.DataFrame):
+        ######################
+        # df_data:pd.DataFrame -> Cleaned XCD data
+        ######################
+
+        # XCD sometimes repeats a header. The reports only ever see the first one, so that is the one we keep
+        df_data = df_data.loc[:, ~df_data.columns.duplicated()]
+        df_data.columns = [str(column) for column in df_data.columns]
+
+        # XCD likes to mix numbers and text in the same column which parquet won't take, so those columns become text
+        for position in range(df_data.shape[1]):
+            values = df_data.iloc[:, position]
+            if pd.api.types.is_object_dtype(values.dtype):
+                df_data.isetitem(position, values.where(values.isna(), values.astype(str)))
+
+        return df_data
+
+    # Read a program's partitions for a range of years. Only the partitions in the range and the columns asked for come off disk
+    @Tracer.traced("load")
+    def read(self, program:str, columns:list = None, firstYear:int = None, lastYear:int = None):
+        ######################
+        # program:str -> Program the partitions belong to, like papers or tutorials
+        # columns:list -> Standard column names to read. None reads every column
+        # firstYear:int -> Earliest year to read. None uses the warehouse default
+        # lastYear:int -> Latest year to read. None uses the warehouse default
+        ######################
+
+        years = self.years(program, firstYear, lastYear)
+        if len(years) == 0:
+            raise ValueError("SubmissionWarehouse::read - No " + program + " partitions in " + self.rootDir + " for the years asked for")
+
+        yearly_frames = []
+        for year in years:
+            entry = self.manifest["programs"][program][str(year)]
+
+            # The manifest knows each partition's columns, so a year missing one of them just doesn't ask for it
+            use_columns = None if columns is None else [column for column in entry["columns"] if column in columns]
+            partition_path = os.path.join(self.rootDir, entry["file"])
+            StageMemo.recordInput(partition_path)
+            df_year = pd.read_parquet(partition_path, columns = use_columns)
+            df_year.insert(0, YEAR_COLUMN, pd.Series(year, index = df_year.index, dtype = "int16"))
+            yearly_frames.append(df_year)
+
+        print("SubmissionWarehouse::read - Read", program, "for", ", ".join(str(year) for year in years))
+        return pd.concat(yearly_frames, axis = 0, ignore_index = True)
+
+    # Print what the warehouse holds
+    def printContents(self):
+        print("SubmissionWarehouse::printContents - Warehouse at", self.rootDir)
+        for program, partitions in sorted(self.manifest["programs"].items()):
+            for year_key in sorted(partitions):
+                entry = partitions[year_key]
+                print("  {:<10} {} {:>8} rows {:>4} columns  from {}".format(
+                      program, year_key, entry["rows"], len(entry["columns"]), os.path.basename(entry["source"])))
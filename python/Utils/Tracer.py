@@ -0,0 +1,230 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the tracing spans that show where a report spends its time, exported as a Chrome trace
+
+# Include the goodies we are going to need
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+# Peak RSS comes from the resource module, which is not on Windows. Spans just leave it out there
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Import our shared helpers
+import Utils.StageMemo as StageMemo
+
+# Number of rows in whatever a traced call handed back, if it is a frame or series
+def rowCount(result):
+    ######################
+    # result -> Whatever the traced call returned
+    ######################
+
+    if hasattr(result, "index") and hasattr(result, "shape"):
+        return int(result.shape[0])
+
+    return None
+
+
+# Largest resident set the process has had so far in KB. Linux reports KB, macOS reports bytes
+def peakRSSKB():
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak = peak // 1024
+
+    return peak
+
+
+# Define the class and it's methods
+class Span:
+
+    # Define what it's constructor sets up
+    def __init__(self, tracer, name:str, category:str):
+        ######################
+        # tracer -> Tracer the finished span gets recorded into
+        # name:str -> What is being timed, shows up as the bar label in the trace viewer
+        # category:str -> Kind of work. One of load, clean, summarize, analytics, write, or stage
+        ######################
+
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+        # Set by whoever is inside the span when they know how many rows they handled
+        self.rows = None
+
+    def __enter__(self):
+        self.startRSS = peakRSSKB()
+        self.startCPU = time.thread_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        wall = time.perf_counter() - self.start
+        cpu = time.thread_time() - self.startCPU
+        end_rss = peakRSSKB()
+
+        self.tracer.record(self.name, self.category, self.start, wall, cpu, self.rows,
+                           None if end_rss is None else end_rss - self.startRSS,
+                           None if exc_type is None else exc_type.__name__)
+        return False
+
+
+# Define the class and it's methods
+class Tracer:
+
+    # Define what it's constructor sets up
+    def __init__(self):
+        # Finished spans in the order they closed
+        self.events = []
+
+        # Spans close on the post paper review worker threads too
+        self.lock = threading.Lock()
+
+        # Trace timestamps are relative to when tracing started
+        self.origin = time.perf_counter()
+
+    # Start a span. Use it as a with block around the work
+    def span(self, name:str, category:str):
+        ######################
+        # name:str -> What is being timed
+        # category:str -> Kind of work. One of load, clean, summarize, analytics, write, or stage
+        ######################
+
+        return Span(self, name, category)
+
+    # Keep a finished span
+    def record(self, name:str, category:str, start:float, wall:float, cpu:float, rows:int, rssDeltaKB:int, error:str):
+        ######################
+        # name:str -> What was timed
+        # category:str -> Kind of work
+        # start:float -> perf_counter when the span opened
+        # wall:float -> Seconds the span was open
+        # cpu:float -> CPU seconds the thread spent inside the span
+        # rows:int -> Rows the span handled, or None if nobody said
+        # rssDeltaKB:int -> How much the peak resident set grew while the span was open, or None if we can't tell
+        # error:str -> Exception type that escaped the span, or None
+        ######################
+
+        event = {"name": name, "category": category, "start": start - self.origin, "wall": wall, "cpu": cpu,
+                 "rows": rows, "rssDeltaKB": rssDeltaKB, "error": error,
+                 "thread": threading.get_ident(), "threadName": threading.current_thread().name}
+
+        with self.lock:
+            self.events.append(event)
+
+    # Write the spans out in Chrome trace event format. Open it in chrome://tracing or https://ui.perfetto.dev
+    def exportChromeTrace(self, filePath:str):
+        ######################
+        # filePath:str -> Where to write the trace
+        ######################
+
+        pid = os.getpid()
+        trace_events = []
+        thread_names = {}
+        for event in self.events:
+            thread_names[event["thread"]] = event["threadName"]
+
+            args = {"cpu_ms": round(event["cpu"] * 1000, 3)}
+            for key in ("rows", "rssDeltaKB", "error"):
+                if event[key] is not None:
+                    args[key] = event[key]
+
+            # Complete events carry their own duration. Times are in microseconds
+            trace_events.append({"name": event["name"], "cat": event["category"], "ph": "X", "pid": pid,
+                                 "tid": event["thread"], "ts": round(event["start"] * 1e6, 3),
+                                 "dur": round(event["wall"] * 1e6, 3), "args": args})
+
+        # Name the threads so the worker lanes are easy to tell apart
+        for thread, thread_name in thread_names.items():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": thread_name}})
+
+        with open(filePath, "w") as trace_file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, trace_file)
+
+        print("Tracer::exportChromeTrace - Wrote", len(self.events), "spans to", filePath)
+
+    # Print the time spent in each kind of span, slowest first
+    def printSummary(self):
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault((event["category"], event["name"]), {"calls": 0, "wall": 0.0, "cpu": 0.0, "rows": 0})
+            total["calls"] += 1
+            total["wall"] += event["wall"]
+            total["cpu"] += event["cpu"]
+            total["rows"] += event["rows"] or 0
+
+        print("Tracer::printSummary - Time by span")
+        for (category, name), total in sorted(totals.items(), key = lambda item: item[1]["wall"], reverse = True):
+            print("  {:<10} {:<65} {:>5} calls {:>9.3f}s wall {:>9.3f}s cpu {:>9} rows".format(
+                  category, name, total["calls"], total["wall"], total["cpu"], total["rows"]))
+
+
+# Span around a block of work. When tracing is off it hands back a context that does nothing
+def span(name:str, category:str, tracer:Tracer = None):
+    ######################
+    # name:str -> What is being timed
+    # category:str -> Kind of work. One of load, clean, summarize, analytics, write, or stage
+    # tracer:Tracer -> Tracer the span records into. None turns tracing off
+    ######################
+
+    if tracer is None:
+        return contextlib.nullcontext()
+
+    return tracer.span(name, category)
+
+
+# Decorator that wraps a method in a span. The span goes to the tracer attribute of the object the method is called on.
+# When tracing is off it is a single check and a plain call
+def traced(category:str):
+    ######################
+    # category:str -> Kind of work the method does. One of load, clean, summarize, or analytics
+    ######################
+
+    def decorate(method):
+        name = method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            tracer = args[0].tracer
+            if tracer is None:
+                return method(*args, **kwargs)
+
+            with tracer.span(name, category) as current:
+                result = method(*args, **kwargs)
+                current.rows = rowCount(result)
+
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+# Write a report out to csv inside a write span, and note it as an output of the running stage
+def writeCSV(df_data, fileName:str, tracer:Tracer = None):
+    ######################
+    # df_data -> Frame or series to write
+    # fileName:str -> Name of the csv file
+    # tracer:Tracer -> Tracer the write span records into. None turns tracing off
+    ######################
+
+    # Let the stage memo know this report belongs to the stage that is running
+    StageMemo.recordOutput(fileName)
+
+    if tracer is None:
+        df_data.to_csv(fileName)
+        return
+
+    with tracer.span("write " + os.path.basename(fileName), "write") as current:
+        current.rows = rowCount(df_data)
+        df_data.to_csv(fileName)
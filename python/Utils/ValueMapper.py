@@ -0,0 +1,62 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the value mapper that standardizes XCD values in the handful of columns that actually need it
+
+# Include the goodies we are going to need
+import numpy as np
+import pandas as pd
+
+# Raw XCD columns (after spaces become underscores) whose values get standardized.
+# Everything else, like comments, bios and titles, is left alone
+CATEGORICAL_XCD_COLUMNS = ["Review_Status",
+                           "Paper_Review_Status",
+                           "Main_Subcommittee_Category",
+                           "Subcommittee_Category"]
+
+# Define the class and it's methods
+class ValueMapper:
+
+    # Define what it's constructor sets up
+    def __init__(self, standard_variables_list:dict, columns:list = CATEGORICAL_XCD_COLUMNS):
+        ######################
+        # standard_variables_list:dict -> Dictionary mapping the XCD names to our standard ones. Used for both the column and value names
+        # columns:list -> Raw XCD column names whose values should be mapped
+        ######################
+
+        self.aliases = standard_variables_list
+
+        # The frame we get has already been renamed, so look the columns up by their standard names
+        self.columns = list(dict.fromkeys(standard_variables_list.get(column, column) for column in columns))
+
+        # Alias -> number of cells it replaced
+        self.firedAliases = {}
+
+    # Replace the aliased values in the declared columns
+    def apply(self, df_data:pd.DataFrame):
+        ######################
+        # df_data:pd.DataFrame -> Renamed XCD data. The mapped columns are replaced in place
+        ######################
+
+        for position, column in enumerate(df_data.columns):
+            if column not in self.columns:
+                continue
+
+            # Dictionary encode the column so each distinct value only gets looked up once
+            codes, uniques = pd.factorize(df_data.iloc[:, position])
+            mapped = np.array([self.aliases.get(value, value) for value in uniques], dtype = object)
+
+            # Skip the column if none of its values have an alias
+            changed = np.flatnonzero(mapped != np.asarray(uniques, dtype = object))
+            if len(changed) == 0:
+                continue
+
+            # Keep track of which aliases actually did something
+            counts = np.bincount(codes[codes >= 0], minlength = len(uniques))
+            for index in changed:
+                self.firedAliases[uniques[index]] = self.firedAliases.get(uniques[index], 0) + int(counts[index])
+
+            # Decode back to values. Empty cells (code -1) stay empty
+            values = np.where(codes >= 0, mapped[codes], np.nan)
+            df_data.isetitem(position, pd.Series(values, index = df_data.index, dtype = object))
+
+        return df_data
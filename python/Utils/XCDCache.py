@@ -0,0 +1,233 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains an on-disk cache for parsed XCD exports so we only pay the excel parsing cost once per file
+
+# Include the goodies we are going to need
+import hashlib
+import importlib.util
+import os
+import pandas as pd
+
+# Import our shared helpers
+import Utils.ColumnProjection as ColumnProjection
+import Utils.StageMemo as StageMemo
+
+# Where the cache lives and how big it is allowed to get before we start throwing out old entries
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "iitsec_xcd")
+DEFAULT_MAX_SIZE_MB = 512
+
+# Define the class and it's methods
+class XCDCache:
+
+    # Define what it's constructor sets up
+    def __init__(self, cacheDir:str = DEFAULT_CACHE_DIR, maxSizeMB:int = DEFAULT_MAX_SIZE_MB, enabled:bool = True,
+                 keepInMemory:bool = False):
+        ######################
+        # cacheDir:str -> Directory where the parsed files get stored
+        # maxSizeMB:int -> Size limit for the whole cache directory. Least recently used entries get evicted past this
+        # enabled:bool -> When False every read goes straight to excel and nothing gets stored on disk
+        # keepInMemory:bool -> When True parsed files are also kept in memory so later reads in the same run skip the disk too
+        ######################
+
+        self.cacheDir = cacheDir
+        self.maxSizeBytes = int(maxSizeMB) * 1024 * 1024
+        self.enabled = enabled
+        self.keepInMemory = keepInMemory
+
+        # Cache key -> (parsed frame, every raw header in the file) for files already read in this run. The frame only
+        # holds the columns some report has asked for so far
+        self.memoryFrames = {}
+
+        # Keep track of how well the cache is doing
+        self.hits = 0
+        self.misses = 0
+
+        # Parquet needs pyarrow. If it's not around we fall back to pickle files
+        self.parquetAvailable = importlib.util.find_spec("pyarrow") is not None
+
+    # Settings to build an on-disk cache like this one somewhere else, like in a worker process. Memory is never shared
+    def settings(self):
+        return {"cacheDir": self.cacheDir, "maxSizeMB": self.maxSizeBytes // (1024 * 1024), "enabled": self.enabled}
+
+    # Hash the contents of the file so a re-downloaded but unchanged export still hits
+    def fileDigest(self, filePath:str):
+        ######################
+        # filePath:str -> Path to the file we want to hash
+        ######################
+
+        digest = hashlib.sha256()
+        with open(filePath, "rb") as file_handle:
+            for block in iter(lambda: file_handle.read(1024 * 1024), b""):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+    # Build the key for a file and sheet
+    def cacheKey(self, filePath:str, sheetName):
+        ######################
+        # filePath:str -> Path to the excel file
+        # sheetName -> Sheet name or index we are reading from the workbook
+        ######################
+
+        return self.fileDigest(filePath) + "_" + hashlib.sha256(str(sheetName).encode("utf-8")).hexdigest()[:16]
+
+    # Read an excel file, using the cached copy if we have already parsed this exact file
+    def readExcel(self, filePath:str, sheetName = 0, usecols = None):
+        ######################
+        # filePath:str -> Path to the excel file
+        # sheetName -> Sheet name or index to read. Defaults to the first sheet like pd.read_excel does
+        # usecols -> Test on the raw header names, like pd.read_excel's callable usecols. None reads every column
+        ######################
+
+        StageMemo.recordInput(filePath)
+
+        # If both caches are turned off just read the file
+        if not self.enabled and not self.keepInMemory:
+            self.misses += 1
+            return pd.read_excel(filePath, sheet_name = sheetName, usecols = usecols)
+
+        # Entries on disk always hold every column so one parse serves every report, whatever columns it needs
+        key = self.cacheKey(filePath, sheetName)
+
+        if not self.keepInMemory:
+            return self.readEntry(key, filePath, sheetName, usecols)[0]
+
+        # Another stage in this run already loaded it. Only the columns nobody asked for yet have to be read
+        if key in self.memoryFrames:
+            df_kept, headers = self.memoryFrames[key]
+            missing = [name for name in headers if (usecols is None or usecols(name)) and name not in df_kept.columns]
+            if not missing:
+                self.hits += 1
+                # Hand back a copy since cleanData renames the columns in place
+                return ColumnProjection.selectRawColumns(df_kept, usecols)
+
+            df_more = self.readEntry(key, filePath, sheetName, lambda name: name in missing)[0]
+            df_kept = pd.concat([df_kept, df_more], axis = 1)
+            df_kept = df_kept[[name for name in headers if name in df_kept.columns]]
+        else:
+            df_kept, headers = self.readEntry(key, filePath, sheetName, usecols)
+
+        # Memory only keeps the columns asked for, so a wide export doesn't sit in memory whole for a report reading a few
+        self.memoryFrames[key] = (df_kept, headers)
+        return ColumnProjection.selectRawColumns(df_kept, usecols)
+
+    # Read a file through the on-disk cache. Hands back the frame and every raw header in the file
+    def readEntry(self, key:str, filePath:str, sheetName, usecols = None):
+        ######################
+        # key:str -> Cache key for the file and sheet
+        # filePath:str -> Path to the excel file
+        # sheetName -> Sheet name or index to read
+        # usecols -> Test on the raw header names. None reads every column
+        ######################
+
+        if not self.enabled:
+            self.misses += 1
+            df_data = pd.read_excel(filePath, sheet_name = sheetName)
+            return ColumnProjection.selectRawColumns(df_data, usecols), list(df_data.columns)
+
+        # Check for a stored copy
+        entry_path = self.findEntry(key)
+        if entry_path is not None:
+            self.hits += 1
+
+            # Touch the entry so eviction knows it was used recently
+            os.utime(entry_path)
+
+            # Parquet is stored by column, so a projected read only pulls the columns we asked for off disk
+            if entry_path.endswith(".parquet"):
+                # Only here when pyarrow wrote the entry, so it is safe to pull in for the schema
+                import pyarrow.parquet
+                column_names = [name for name in pyarrow.parquet.read_schema(entry_path).names if name != "__index_level_0__"]
+                if usecols is None:
+                    return pd.read_parquet(entry_path), column_names
+                return pd.read_parquet(entry_path, columns = [name for name in column_names if usecols(name)]), column_names
+            df_data = pd.read_pickle(entry_path)
+            return ColumnProjection.selectRawColumns(df_data, usecols), list(df_data.columns)
+
+        # Not there so parse the file and keep a copy for next time. The parser reads every cell anyway so keep them all
+        self.misses += 1
+        df_data = pd.read_excel(filePath, sheet_name = sheetName)
+        self.store(key, df_data)
+        self.evict()
+
+        return ColumnProjection.selectRawColumns(df_data, usecols), list(df_data.columns)
+
+    # Find the stored file for a key if there is one
+    def findEntry(self, key:str):
+        ######################
+        # key:str -> Cache key for the file and sheet
+        ######################
+
+        for extension in (".parquet", ".pkl"):
+            entry_path = os.path.join(self.cacheDir, key + extension)
+            if os.path.exists(entry_path):
+                return entry_path
+
+        return None
+
+    # Write a parsed frame into the cache
+    def store(self, key:str, df_data:pd.DataFrame):
+        ######################
+        # key:str -> Cache key for the file and sheet
+        # df_data:pd.DataFrame -> The parsed data we want to keep
+        ######################
+
+        os.makedirs(self.cacheDir, exist_ok = True)
+
+        # Write to a temp name first so a crash never leaves a half written entry behind
+        if self.parquetAvailable:
+            entry_path = os.path.join(self.cacheDir, key + ".parquet")
+            try:
+                df_data.to_parquet(entry_path + ".tmp")
+                os.replace(entry_path + ".tmp", entry_path)
+                return
+            except (ValueError, TypeError):
+                # XCD likes to mix numbers and text in the same column which parquet won't take
+                if os.path.exists(entry_path + ".tmp"):
+                    os.remove(entry_path + ".tmp")
+
+        entry_path = os.path.join(self.cacheDir, key + ".pkl")
+        df_data.to_pickle(entry_path + ".tmp")
+        os.replace(entry_path + ".tmp", entry_path)
+
+    # Throw out the least recently used entries until we are under the size limit
+    def evict(self):
+        entries = self.listEntries()
+        total_size = sum(entry[2] for entry in entries)
+
+        # Oldest access time first
+        for entry_path, _, entry_size in sorted(entries, key = lambda entry: entry[1]):
+            if total_size <= self.maxSizeBytes:
+                break
+            os.remove(entry_path)
+            total_size -= entry_size
+
+    # List everything in the cache as (path, last used time, size)
+    def listEntries(self):
+        if not os.path.isdir(self.cacheDir):
+            return []
+
+        entries = []
+        for entry_name in os.listdir(self.cacheDir):
+            if entry_name.endswith(".parquet") or entry_name.endswith(".pkl"):
+                entry_path = os.path.join(self.cacheDir, entry_name)
+                entry_stat = os.stat(entry_path)
+                entries.append((entry_path, entry_stat.st_mtime, entry_stat.st_size))
+
+        return entries
+
+    # Remove every entry from the cache
+    def purge(self):
+        entries = self.listEntries()
+        for entry_path, _, _ in entries:
+            os.remove(entry_path)
+
+        print("XCDCache::purge - Removed", len(entries), "cached files from", self.cacheDir)
+
+    # Forget the files kept in memory. The watcher calls this between refreshes so old exports don't pile up
+    def clearMemory(self):
+        self.memoryFrames.clear()
+
+    # Let the user know how the cache did
+    def printStats(self):
+        print("XCDCache::printStats - Cache hits:", self.hits, "Cache misses:", self.misses)
@@ -0,0 +1,83 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the streaming reader that walks big XCD exports in fixed size chunks instead of loading them whole
+
+# Include the goodies we are going to need
+import openpyxl
+import pandas as pd
+
+# Import our shared helpers
+import Utils.StageMemo as StageMemo
+
+# How many rows go in a chunk when nobody says otherwise
+DEFAULT_CHUNK_ROWS = 5000
+
+
+# Turn the header row into column names the same way pd.read_excel would
+def headerNames(header_row:tuple):
+    ######################
+    # header_row:tuple -> The raw values from the first row of the sheet
+    ######################
+
+    names = []
+    seen = {}
+    for position, value in enumerate(header_row):
+        name = "Unnamed: " + str(position) if value is None else str(value)
+
+        # XCD sometimes repeats a column name. pandas tacks on .1, .2, ... so we do too
+        if name in seen:
+            seen[name] += 1
+            name = name + "." + str(seen[name])
+        else:
+            seen[name] = 0
+
+        names.append(name)
+
+    return names
+
+
+# Read an excel file a chunk of rows at a time. Only one chunk is ever held in memory
+def readChunks(filePath:str, chunkSize:int = DEFAULT_CHUNK_ROWS, sheetName = 0, usecols = None):
+    ######################
+    # filePath:str -> Path to the excel file
+    # chunkSize:int -> Number of rows in each chunk
+    # sheetName -> Sheet name or index to read. Defaults to the first sheet like pd.read_excel does
+    # usecols -> Test on the raw header names, like pd.read_excel's callable usecols. None keeps every column
+    ######################
+
+    print("XLSXStream::readChunks - Streaming file from XCD: ", filePath, "in chunks of", chunkSize, "rows")
+    StageMemo.recordInput(filePath)
+
+    # Read only mode parses the rows as we go rather than building the whole workbook up front
+    workbook = openpyxl.load_workbook(filePath, read_only = True, data_only = True)
+    try:
+        worksheet = workbook.worksheets[sheetName] if isinstance(sheetName, int) else workbook[sheetName]
+        rows = worksheet.iter_rows(values_only = True)
+
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        columns = headerNames(header_row)
+        width = len(columns)
+
+        # Only hang on to the cells of the columns we were asked for
+        positions = [position for position, column in enumerate(columns) if usecols is None or usecols(column)]
+        columns = [columns[position] for position in positions]
+
+        chunk = []
+        for row in rows:
+            # Read only rows can come back short when the trailing cells are empty
+            if len(row) != width:
+                row = (tuple(row) + (None,) * width)[:width]
+            if usecols is not None:
+                row = tuple(row[position] for position in positions)
+            chunk.append(row)
+
+            if len(chunk) == chunkSize:
+                yield pd.DataFrame.from_records(chunk, columns = columns)
+                chunk = []
+
+        if chunk:
+            yield pd.DataFrame.from_records(chunk, columns = columns)
+    finally:
+        workbook.close()
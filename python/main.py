@@ -3,13 +3,90 @@
 # Description: This program cleans, formats, and analyzes I/ITSEC data
 
 # Import all the external goodies we need for our analysis
-import pandas as pd
+import time
+STARTUP_BEGAN = time.perf_counter()
 
-# Import out custom defined classes
-import Papers.PaperAnalytics as PaperAnalytics
-import TUT.TutorialAnalytics as TutorialAnalytics
-import PDW.PDWAnalytics as PDWAnalytics
-import Scholarships.ScholarAnalytics as ScholarAnalytics
+import argparse
+import fnmatch
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+import traceback
+
+# Import out custom defined classes. Tracer and StageMemo are light so they come in right away
+import Utils.Tracer as Tracer
+import Utils.StageMemo as StageMemo
+
+
+def lazy_import(module_name):
+    """
+    Registers a module that only gets imported the first time something on it is used. Keeps --help and single
+    program stages from paying for pandas and every analytics module up front.
+
+    Args:
+        module_name (str): Full name of the module, like "Papers.PaperAnalytics"
+
+    Returns:
+        module: The module. It runs on first attribute access
+    """
+
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.find_spec(module_name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    # Hang it off the parent package like a normal import would
+    parent_name, _, child_name = module_name.rpartition(".")
+    if parent_name:
+        setattr(importlib.import_module(parent_name), child_name, module)
+
+    return module
+
+
+def load_modules(module_names):
+    """
+    Finishes importing lazy modules now rather than on first use. Stages call this up front so the import cost is
+    reported on its own and never lands on a worker thread.
+
+    Args:
+        module_names (list): Full names of the modules to load
+
+    Returns:
+        float: Seconds it took
+    """
+
+    start = time.perf_counter()
+    for module_name in module_names:
+        # Touching any attribute of a lazy module runs it
+        getattr(lazy_import(module_name), "__name__")
+
+    return time.perf_counter() - start
+
+
+pd = lazy_import("pandas")
+PaperAnalytics = lazy_import("Papers.PaperAnalytics")
+TutorialAnalytics = lazy_import("TUT.TutorialAnalytics")
+PDWAnalytics = lazy_import("PDW.PDWAnalytics")
+ScholarAnalytics = lazy_import("Scholarships.ScholarAnalytics")
+XCDCache = lazy_import("Utils.XCDCache")
+RunSettings = lazy_import("Utils.RunSettings")
+AnalysisSession = lazy_import("Utils.AnalysisSession")
+XLSXStream = lazy_import("Utils.XLSXStream")
+SubmissionWarehouse = lazy_import("Utils.SubmissionWarehouse")
+SQLiteStore = lazy_import("Utils.SQLiteStore")
+ExportWatcher = lazy_import("Utils.ExportWatcher")
+ReportService = lazy_import("Utils.ReportService")
+
+# Shared modules every run needs once the flags are read
+CORE_MODULES = ["pandas", "Utils.XCDCache", "Utils.RunSettings", "Utils.AnalysisSession", "Utils.XLSXStream",
+                "Utils.SubmissionWarehouse", "Utils.SQLiteStore"]
 
 # Define and entry point for the program and start letting the user choose their own adventrue
 column_mappings = {'_Does_the_primary_or_secondary_author_(first_second_or_both)_reside_outside_the_US?_': 'International(Y/N)',
@@ -88,64 +165,615 @@ column_mappings = {'_Does_the_primary_or_secondary_author_(first_second_or_both)
 
 def main():
     """
-    Starts the program by providing user with options menu.
+    Starts the program. Runs the stages given on the command line, or provides the user with the options menu.
+
+    Args:
+        None
+
+    Returns:
+        int: Exit status for the process. 0 when every stage ran, 1 when one failed
+    """
+
+    # Read the command line flags
+    args = parse_arguments()
+
+    # Now that we know we are running something, pull in the shared modules and let the user know how long startup took
+    import_seconds = load_modules(CORE_MODULES)
+    print("Startup took", round((time.perf_counter() - STARTUP_BEGAN) * 1000, 1), "ms, of which",
+          round(import_seconds * 1000, 1), "ms was importing pandas and the shared modules")
+
+    # Fill in the defaults that live in the modules we just loaded
+    if args.cache_dir is None:
+        args.cache_dir = XCDCache.DEFAULT_CACHE_DIR
+    if args.cache_size_mb is None:
+        args.cache_size_mb = XCDCache.DEFAULT_MAX_SIZE_MB
+    if args.stream_chunk_rows is None:
+        args.stream_chunk_rows = XLSXStream.DEFAULT_CHUNK_ROWS
+    if args.session_memory_mb is None:
+        args.session_memory_mb = AnalysisSession.DEFAULT_MAX_MEMORY_MB
+    if args.watch_poll_seconds is None:
+        args.watch_poll_seconds = ExportWatcher.DEFAULT_POLL_SECONDS
+    if args.watch_settle_seconds is None:
+        args.watch_settle_seconds = ExportWatcher.DEFAULT_SETTLE_SECONDS
+    if args.serve_host is None:
+        args.serve_host = ReportService.DEFAULT_HOST
+    if args.serve_port is None:
+        args.serve_port = ReportService.DEFAULT_PORT
+    if args.serve_origin is None:
+        args.serve_origin = ReportService.DEFAULT_ALLOWED_ORIGIN
+
+    # Set up the cache every analytics loader reads through. Parsed files stay in memory so stages can share them, except
+    # in session mode where the session already shares the cleaned frames and its memory limit has to cover everything held.
+    # The settings get handed to every stage and analytics object, so nothing reads the flags from module state
+    settings = RunSettings.RunSettings(XCDCache.XCDCache(
+        args.cache_dir, args.cache_size_mb, not args.no_cache, keepInMemory=not (args.session or args.serve)))
+    if args.purge_cache:
+        settings.cache.purge()
+
+    # Streaming mode reads the count reports a chunk at a time so big exports never sit in memory whole
+    if args.stream:
+        settings.chunkRows = args.stream_chunk_rows
+
+    # Delta mode keeps the paper review summary state between pulls so only papers with new reviews get redone
+    if args.delta_state is not None:
+        settings.deltaStatePath = os.path.abspath(args.delta_state)
+
+    # How the review summaries lay out the comments and biographies they gather
+    if args.text_shape is not None:
+        settings.collectShape = args.text_shape
+
+    # Tracing records a span around every load, clean, analytics method, and report write
+    if args.trace is not None:
+        settings.tracer = Tracer.Tracer()
+        trace_path = os.path.abspath(args.trace)
+
+    # In session mode the cleaned frames stay in memory so later reports skip the load and clean steps.
+    # The service serves those frames, so it needs the session too
+    if args.session or args.serve:
+        settings.session = AnalysisSession.AnalysisSession(args.session_memory_mb)
+    if args.serve and not args.stage:
+        args.stage = list(SERVE_STAGES)
+
+    # Stages whose inputs, alias maps and code have not changed since last time get their reports restored instead of rerun
+    # The service needs the stages to really load their data, so it never restores saved reports
+    if not args.no_memo and not args.serve:
+        settings.memo = StageMemo.StageMemo(os.path.abspath(args.memo_dir), args.force)
+
+    # Resolve the data directory before we move into the output directory so relative paths still work
+    data_dir = os.path.abspath(args.data_dir)
+
+    # Ingest the new exports into the warehouse first so the stages below can read them
+    status = 0
+    warehouse_dir = os.path.abspath(SubmissionWarehouse.DEFAULT_WAREHOUSE_DIR if args.warehouse is None else args.warehouse)
+    if args.ingest:
+        status = ingest_warehouse(args.ingest, warehouse_dir, settings)
+
+    # With a warehouse the multi-year analytics read the cleaned partitions instead of every yearly excel file
+    if args.warehouse is not None:
+        first_year, last_year = args.years if args.years is not None else (None, None)
+        settings.warehouse = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir, first_year, last_year, settings.tracer)
+
+    # The SQLite store keeps the cleaned exports in indexed tables between runs
+    if args.sqlite is not None:
+        settings.store = SQLiteStore.SQLiteStore(os.path.abspath(args.sqlite))
+    elif args.sql:
+        print("Error: --sql needs a --sqlite database to run against")
+        return 1
+
+    if args.out_dir is not None:
+        os.makedirs(args.out_dir, exist_ok=True)
+        os.chdir(args.out_dir)
+
+    # Run the requested stages back to back, or fall back to the menu when there was nothing to ingest, query or watch either
+    if args.stage:
+        if status == 0:
+            status = run_stages(args.stage, data_dir, args.workers, settings)
+    elif not args.ingest and not args.sql and not args.watch:
+        status = run_menu(data_dir, args.workers, args.session, settings)
+
+    # Answer the ad hoc questions once the stages have filled the store
+    if args.sql and status == 0:
+        status = run_queries(args.sql, settings.store)
+
+    # Serve the cleaned data the stages loaded until the user stops us
+    if args.serve and status == 0:
+        ReportService.ReportService(settings.session, args.serve_origin).serve(args.serve_host, args.serve_port)
+
+    # Keep the reports fresh as new exports land until the user stops us
+    if args.watch and status == 0:
+        watch_log = None if args.watch_log is None else os.path.abspath(args.watch_log)
+        run_watcher(data_dir, args.workers, args.watch_poll_seconds, args.watch_settle_seconds, watch_log, settings)
+
+    # Let the user know which stages were reused and how much parsing the cache saved
+    if settings.memo is not None and settings.memo.outcomes:
+        settings.memo.printReport()
+    settings.cache.printStats()
+
+    # Write the trace out so it can be opened in chrome://tracing or Perfetto
+    if settings.tracer is not None:
+        settings.tracer.printSummary()
+        settings.tracer.exportChromeTrace(trace_path)
+
+    return status
+
+
+def parse_arguments():
+    """
+    Reads the command line flags.
 
     Args:
         None
 
+    Returns:
+        argparse.Namespace: The parsed flags
+    """
+
+    parser = argparse.ArgumentParser(description="I/ITSEC KM data analysis program. Runs the interactive menu when no --stage is given")
+    parser.add_argument("--stage", action="append", choices=list(STAGES),
+                        help="Report stage to run. Repeat to run several stages in one process")
+    parser.add_argument("--data-dir", default="../Data",
+                        help="Directory holding the XCD exports")
+    parser.add_argument("--out-dir", default=None,
+                        help="Directory the reports are written to. Defaults to the current directory")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always parse the excel files and skip the parsed file cache")
+    parser.add_argument("--purge-cache", action="store_true",
+                        help="Remove every cached file before running")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory where parsed files are cached. Defaults to ~/.cache/iitsec_xcd")
+    parser.add_argument("--cache-size-mb", type=int, default=None,
+                        help="Size limit for the cache. Least recently used files are removed past this. Defaults to 512")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of processes used to load the yearly scholarship files and threads used for the post paper review subcommittee reports. "
+                             "When not given the scholarship files load on every core and the subcommittee reports run one after another")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream the excel files in chunks for the crosstab and count reports. Only one chunk of rows is held at a time, plus the IDs already counted")
+    parser.add_argument("--stream-chunk-rows", type=int, default=None,
+                        help="Rows per chunk when --stream is on. Defaults to 5000")
+    parser.add_argument("--delta-state", default=None,
+                        help="State file for the pre paper review summary. Only papers whose reviews changed since the last run are re-summarized")
+    parser.add_argument("--text-shape", choices=["list", "joined", "json", "long"], default=None,
+                        help="How the review summaries lay out the comments and biographies they gather: a list per cell, one string with a value per line, "
+                             "a JSON array, or a separate <report>_Text.csv with one row per value. Defaults to list")
+    parser.add_argument("--session", action="store_true",
+                        help="Keep cleaned data in memory and keep showing the menu until exit is picked")
+    parser.add_argument("--session-memory-mb", type=int, default=None,
+                        help="Memory limit for the data held by --session. Parsed excel files are not kept in memory in session mode, so this covers everything. Defaults to 1024")
+    parser.add_argument("--ingest", action="append", nargs=3, metavar=("PROGRAM", "YEAR", "FILE"),
+                        help="Clean a year's XCD export and store it in the submission warehouse. PROGRAM is one of "
+                             + ", ".join(WAREHOUSE_PROGRAMS) + ". Repeat to ingest several years")
+    parser.add_argument("--warehouse", default=None,
+                        help="Submission warehouse directory. When given, the scholarship analysis reads the past years from it instead of the yearly excel files. Defaults to ../Warehouse for --ingest")
+    parser.add_argument("--years", type=year_range, default=None,
+                        help="Year range read from the warehouse, like 2019-2024 or 2022. Defaults to every year ingested")
+    parser.add_argument("--sqlite", default=None,
+                        help="SQLite database the cleaned exports are kept in. The crosstab and count reports run as indexed queries against it and an export is only re-read when it changed")
+    parser.add_argument("--sql", action="append", default=None,
+                        help="Query to run against the --sqlite database once the stages are done. Repeat to run several")
+    parser.add_argument("--force", action="store_true",
+                        help="Run every stage even when its inputs and code are the same as last time. The saved reports get replaced")
+    parser.add_argument("--no-memo", action="store_true",
+                        help="Don't reuse or save stage reports at all")
+    parser.add_argument("--memo-dir", default=StageMemo.DEFAULT_MEMO_DIR,
+                        help="Directory where each stage's reports are saved for reuse. Defaults to ~/.cache/iitsec_stages")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and rerun the stages that read an export whenever a new one lands in --data-dir")
+    parser.add_argument("--watch-poll-seconds", type=float, default=None,
+                        help="Seconds between looks at the data directory in --watch mode. Defaults to 2")
+    parser.add_argument("--watch-settle-seconds", type=float, default=None,
+                        help="Seconds a new export has to stop changing before --watch trusts it is fully written. Defaults to 5")
+    parser.add_argument("--watch-log", default=None,
+                        help="File --watch appends a json line to for every refresh, with the time from the export landing to the report being refreshed")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the stages (by default " + " and ".join(SERVE_STAGES) + ") and then serve their cleaned data as JSON crosstabs and counts for the dashboard")
+    parser.add_argument("--serve-host", default=None,
+                        help="Address the --serve service listens on. Defaults to 127.0.0.1")
+    parser.add_argument("--serve-port", type=int, default=None,
+                        help="Port the --serve service listens on. Defaults to 8765")
+    parser.add_argument("--serve-origin", default=None,
+                        help="Origin of the dashboard page allowed to read from the --serve service. Requests from other pages are refused. Defaults to http://localhost:3000")
+    parser.add_argument("--trace", default=None,
+                        help="Write a Chrome trace of where the time went to this file. Open it in chrome://tracing or https://ui.perfetto.dev")
+
+    return parser.parse_args()
+
+
+def year_range(text):
+    """
+    Reads a --years value.
+
+    Args:
+        text (str): A single year like 2022, or a range like 2019-2024
+
+    Returns:
+        tuple: First and last year, inclusive
+    """
+    first_text, _, last_text = text.partition("-")
+    try:
+        first_year = int(first_text)
+        last_year = int(last_text) if last_text else first_year
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected a year like 2022 or a range like 2019-2024, got " + repr(text))
+
+    if first_year > last_year:
+        raise argparse.ArgumentTypeError("the first year comes after the last year in " + repr(text))
+
+    return first_year, last_year
+
+
+def ingest_warehouse(ingest_requests, warehouse_dir, settings=None):
+    """
+    Cleans each requested XCD export with its program's analytics and stores it in the submission warehouse.
+
+    Args:
+        ingest_requests (list): [program, year, file] for each export, see WAREHOUSE_PROGRAMS
+        warehouse_dir (str): Directory holding the warehouse
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
+
+    Returns:
+        int: 0 when every export was stored, 1 when one failed
+    """
+    if settings is None:
+        settings = RunSettings.RunSettings()
+
+    warehouse = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir)
+
+    for program, year, file_path in ingest_requests:
+        if program not in WAREHOUSE_PROGRAMS:
+            print("Error: Unknown warehouse program", program, "- pick one of", ", ".join(WAREHOUSE_PROGRAMS))
+            return 1
+
+        module_name, class_name, aliases = WAREHOUSE_PROGRAMS[program]
+        load_modules([module_name])
+        analytics = getattr(sys.modules[module_name], class_name)(settings)
+
+        try:
+            with Tracer.span("ingest " + program + " " + year, "stage", settings.tracer):
+                warehouse.ingest(program, int(year), file_path, analytics, aliases)
+        except Exception:
+            print("Error: Could not ingest", file_path, "into the warehouse")
+            traceback.print_exc()
+            return 1
+
+    warehouse.printContents()
+    return 0
+
+
+def run_queries(queries, store):
+    """
+    Runs ad hoc queries against the SQLite store and prints the results.
+
+    Args:
+        queries (list): SQL queries to run
+        store (SQLiteStore.SQLiteStore): Store the stages filled
+
+    Returns:
+        int: 0 when every query ran, 1 when one failed
+    """
+    store.printTables()
+
+    for query in queries:
+        print("Running query", query)
+        start = time.perf_counter()
+        try:
+            df_result = store.query(query)
+        except Exception:
+            print("Error: Query failed")
+            traceback.print_exc()
+            return 1
+
+        print(df_result.to_string(index=False))
+        print(len(df_result), "rows in", round((time.perf_counter() - start) * 1000, 1), "ms")
+
+    return 0
+
+
+def run_watcher(data_dir, workers=None, poll_seconds=None, settle_seconds=None, log_path=None, settings=None):
+    """
+    Watches the data directory and reruns the stages that read each export that lands, one stage at a time.
+
+    Args:
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        poll_seconds (float): Seconds between looks at the data directory. None uses the watcher's default
+        settle_seconds (float): Seconds a new export has to stop changing before it counts as landed. None uses the watcher's default
+        log_path (str): File to append a json line per refresh to, or None
+        settings (RunSettings.RunSettings): Cache and report options handed to the stages. None uses the defaults
+
     Returns:
         None
     """
 
+    if settings is None:
+        settings = RunSettings.RunSettings()
+
+    def refresh_stage(stage_name, trigger_files):
+        # Read the exports that set the stage off in place of the usual names. Picks stay for later refreshes, so a stage
+        # set off by one program's export still reads the newest export of the others
+        for file_name, pattern in STAGE_EXPORTS[stage_name].items():
+            for trigger_file in trigger_files:
+                if fnmatch.fnmatchcase(trigger_file.lower(), pattern.lower()):
+                    settings.exports[file_name] = os.path.join(data_dir, trigger_file)
+
+        # Files kept from earlier refreshes are old versions by now, so only keep what this run reads
+        settings.cache.clearMemory()
+        if settings.store is not None:
+            settings.store.clearChecks()
+
+        # The watcher only counts a refresh when the stage actually read the export that set it off
+        with StageMemo.StageRecorder() as recorder:
+            status = run_stages([stage_name], data_dir, workers, settings)
+
+        return status, list(recorder.inputs)
+
+    if poll_seconds is None:
+        poll_seconds = ExportWatcher.DEFAULT_POLL_SECONDS
+    if settle_seconds is None:
+        settle_seconds = ExportWatcher.DEFAULT_SETTLE_SECONDS
+
+    ExportWatcher.ExportWatcher(data_dir, WATCH_PATTERNS, refresh_stage, poll_seconds, settle_seconds,
+                                len(STAGES), log_path).run()
+
+
+def run_stages(stage_names, data_dir, workers=None, settings=None):
+    """
+    Runs the given stages one after another, stopping at the first one that fails. With the stage memo on, a stage
+    whose inputs and code are the same as last time gets its reports restored instead.
+
+    Args:
+        stage_names (list): Names of the stages to run, see STAGES
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        settings (RunSettings.RunSettings): Cache and report options handed to the stages. None uses the defaults
+
+    Returns:
+        int: 0 when every stage ran, 1 when one failed
+    """
+
+    if settings is None:
+        settings = RunSettings.RunSettings()
+
+    for stage_name in stage_names:
+        print("Running stage", stage_name, "......")
+
+        try:
+            with Tracer.span(stage_name, "stage", settings.tracer):
+                if settings.memo is None:
+                    run_stage(stage_name, data_dir, workers, settings)
+                else:
+                    run_memoized_stage(stage_name, data_dir, workers, settings)
+        except Exception:
+            print("Error: Stage", stage_name, "failed")
+            traceback.print_exc()
+            return 1
+
+    return 0
+
+
+def export_path(data_dir, file_name, settings=None):
+    """
+    Finds the export a stage should read. That is the usual name, unless the watcher saw a newer download of the same
+    export land under a new name, see STAGE_EXPORTS.
+
+    Args:
+        data_dir (str): Directory holding the XCD exports
+        file_name (str): Usual name of the export, a key in STAGE_EXPORTS
+        settings (RunSettings.RunSettings): Settings holding the exports the watcher picked. None reads the usual name
+
+    Returns:
+        str: Path to the export to read
+    """
+    if settings is None or file_name not in settings.exports:
+        return os.path.join(data_dir, file_name)
+
+    print("Reading", os.path.basename(settings.exports[file_name]), "as the newest", file_name, "export")
+    return settings.exports[file_name]
+
+
+def run_stage(stage_name, data_dir, workers=None, settings=None):
+    """
+    Imports the analytics modules a stage needs and runs it.
+
+    Args:
+        stage_name (str): Name of the stage to run, see STAGES
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        settings (RunSettings.RunSettings): Cache and report options handed to the stages. None uses the defaults
+
+    Returns:
+        None
+    """
+
+    # Only the analytics modules this stage uses get imported
+    import_seconds = load_modules(STAGE_MODULES[stage_name])
+    if import_seconds >= 0.001:
+        print("Imported", ", ".join(STAGE_MODULES[stage_name]), "in", round(import_seconds * 1000, 1), "ms")
+
+    if stage_name in ("post-paper-review", "scholarship"):
+        STAGES[stage_name](data_dir, workers, settings)
+    else:
+        STAGES[stage_name](data_dir, settings)
+
+
+def run_memoized_stage(stage_name, data_dir, workers, settings):
+    """
+    Restores a stage's reports from the stage memo when nothing it depends on changed, otherwise runs it and saves
+    what it read and wrote for next time.
+
+    Args:
+        stage_name (str): Name of the stage to run, see STAGES
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        settings (RunSettings.RunSettings): Cache and report options handed to the stage, with the stage memo to use
+
+    Returns:
+        None
+    """
+    memo = settings.memo
+
+    # The warehouse changes which files the scholarship stage reads, so it is part of what the entry is for
+    context = {"data_dir": data_dir}
+    if settings.warehouse is not None:
+        context["warehouse"] = [settings.warehouse.rootDir, settings.warehouse.firstYear, settings.warehouse.lastYear]
+
+    # A newer export under a new name leaves the old one untouched, so which file the stage picks is part of it too
+    exports = {file_name: os.path.basename(settings.exports[file_name]) for file_name in STAGE_EXPORTS[stage_name]
+               if file_name in settings.exports}
+    if exports:
+        context["exports"] = exports
+
+    # So does the text shape for the review summaries, which changes what they write
+    if settings.collectShape != "list":
+        context["text_shape"] = settings.collectShape
+
+    code_fingerprint = stage_fingerprint(stage_name)
+    entry, reason = memo.lookup(stage_name, context, code_fingerprint)
+    if entry is not None:
+        print("Reusing the", stage_name, "reports from the last run since its", reason)
+        memo.restore(stage_name, context, entry)
+        return
+
+    start = time.perf_counter()
+    with StageMemo.StageRecorder() as recorder:
+        run_stage(stage_name, data_dir, workers, settings)
+    memo.store(stage_name, context, code_fingerprint, recorder, time.perf_counter() - start, reason)
+
+
+def stage_fingerprint(stage_name):
+    """
+    Hashes everything about a stage that can change its reports other than the data: the stage function with its
+    alias maps, any module level alias maps it uses, the analytics and helper module sources, and the pandas version.
+
+    Args:
+        stage_name (str): Name of the stage, see STAGES
+
+    Returns:
+        str: The fingerprint
+    """
+    digest = hashlib.sha256()
+
+    # The alias maps mostly live right inside the stage function, so its source covers them
+    stage_function = STAGES[stage_name]
+    digest.update(inspect.getsource(stage_function).encode("utf-8"))
+
+    # Some, like SCHOLARSHIP_ALIASES, live at module level
+    for name in sorted(stage_function.__code__.co_names):
+        if isinstance(globals().get(name), (dict, list, tuple, str)):
+            digest.update(repr((name, globals()[name])).encode("utf-8"))
+
+    # Analytics and shared helper code. Found through the import system so nothing has to be imported to hash it
+    module_names = STAGE_MODULES[stage_name] + ["Utils." + os.path.splitext(file_name)[0]
+                                                for file_name in sorted(os.listdir(os.path.dirname(Tracer.__file__)))
+                                                if file_name.endswith(".py")]
+    for module_name in module_names:
+        with open(importlib.util.find_spec(module_name).origin, "rb") as source_file:
+            digest.update(source_file.read())
+
+    digest.update(pd.__version__.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def run_menu(data_dir, workers=None, session=False, settings=None):
+    """
+    Provides the user with the options menu and runs the stage they pick. In session mode the menu keeps coming back
+    so the cleaned data stays in memory between reports.
+
+    Args:
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        session (bool): Keep looping until the user picks exit
+        settings (RunSettings.RunSettings): Cache and report options handed to the stages. None uses the defaults
+
+    Returns:
+        int: 0 when the stage ran, 1 when it failed or the choice was not supported
+    """
+
     # Print out a welcome message to the user
     print("Hello and welcome to the I/ITSEC KM data analysis program. Please select which report stage to run to continue........")
 
-    # Print out the analytics options for the user to select
-    print("1. Post Abstract Submission Closure \n"
-          "2. Pre Abstract Review \n"
-          "3. Post Abstract Review Acceptance Numbers \n"
-          "4. Pre Paper Review \n"
-          "5. Post Paper Review Acceptance Numbers\n"
-          "6. Post Conference Attendance Metrics\n"
-          "7. Scholarship Analysis")
+    status = 0
+    while True:
+        # Print out the analytics options for the user to select
+        print("1. Post Abstract Submission Closure \n"
+              "2. Pre Abstract Review \n"
+              "3. Post Abstract Review Acceptance Numbers \n"
+              "4. Pre Paper Review \n"
+              "5. Post Paper Review Acceptance Numbers\n"
+              "6. Post Conference Attendance Metrics\n"
+              "7. Scholarship Analysis")
+        if session:
+            print("0. Exit")
+
+        # Prompt for choice
+        print("Input integer choice and hit enter: ")
+        try:
+            analysis_choice = int(input())
+        except EOFError:
+            return status
+        except ValueError:
+            if not session:
+                raise
+            print("Error: Please enter one of the numbers above.")
+            continue
+
+        if session and analysis_choice == int(0):
+            return status
+
+        status = run_menu_choice(analysis_choice, data_dir, workers, settings)
+        if not session:
+            return status
+
+        # Let the user know what is still loaded for the next report
+        settings.session.printResident()
+
+
+def run_menu_choice(analysis_choice, data_dir, workers=None, settings=None):
+    """
+    Runs the stage for a menu choice.
 
-    # Prompt for choice
-    print("Input integer choice and hit enter: ")
-    analysis_choice = int(input())
+    Args:
+        analysis_choice (int): Number the user picked from the menu
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly scholarship files and threads used for the post paper review reports
+        settings (RunSettings.RunSettings): Cache and report options handed to the stages. None uses the defaults
+
+    Returns:
+        int: 0 when the stage ran, 1 when it failed or the choice was not supported
+    """
 
     # Run analysis based on the choice they input
     if analysis_choice == int(1):
-
         print("You selected post abstract submission closure analysis. Starting analysis......")
-        post_abstract_submission_closure()
+        return run_stages(["post-abstract-submission-closure"], data_dir, settings=settings)
     elif analysis_choice == int(2):
         print("You selcted pre abstract review analysis. Starting the report......")
-        pre_absract_review()
+        return run_stages(["pre-abstract-review"], data_dir, settings=settings)
     elif analysis_choice == int(3):
         print("You selcted post abstract review analysis. Starting the report......")
-        post_abstract_review_acceptance_numbers()
+        return run_stages(["post-abstract-review"], data_dir, settings=settings)
     elif analysis_choice == int(4):
         print("You selcted pre paper review analysis. Starting the report......")
-        pre_paper_review_acceptance_numbers()
+        return run_stages(["pre-paper-review"], data_dir, settings=settings)
     elif analysis_choice == int(5):
         print("You selcted post paper review analysis. Starting the report......")
-        post_paper_review_acceptance_numbers()
+        return run_stages(["post-paper-review"], data_dir, workers, settings)
     elif analysis_choice == int(7):
         print("You selcted scholarship analysis. Starting the report......")
-        scholarship_analysis()
+        return run_stages(["scholarship"], data_dir, workers, settings)
     else:
         print("Error: Analysis type is not supported. Please try again. Selected type: ", analysis_choice)
-        exit()
+        return 1
 
 # Function to run post abstract review accept/reject numbers
 
 
-def post_abstract_review_acceptance_numbers():
+def post_abstract_review_acceptance_numbers(data_dir="../Data", settings=None):
     """
     Function runs post abstract review accept/reject numbers.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
@@ -169,10 +797,10 @@ def post_abstract_review_acceptance_numbers():
                                       "Policy, Standards, Management, and Acquisition": "PSMA"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_papers = "../Data/paper_final_rev.xlsx"
+    path_to_papers = export_path(data_dir, "paper_final_rev.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PaperAnalytics.PaperAnalytics().postAbstractReviewAcceptanceAnalytics(
+    PaperAnalytics.PaperAnalytics(settings).postAbstractReviewAcceptanceAnalytics(
         path_to_papers, standard_variables_list_papers)
 
     # Analyze the tutorials
@@ -185,10 +813,10 @@ def post_abstract_review_acceptance_numbers():
                                    "Provisional Acceptance of Tutorial Proposal": "Proposal_Accepted"}
 
     # This variable points to where the program can find the tut submission file downloaded from XCD
-    path_to_tut = "../Data/tut_final_rev.xlsx"
+    path_to_tut = export_path(data_dir, "tut_final_rev.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the TUTAnalytics object to do the number crunching magic
-    TutorialAnalytics.TutorialAnalytics().postAbstractReviewAcceptanceAnalytics(
+    TutorialAnalytics.TutorialAnalytics(settings).postAbstractReviewAcceptanceAnalytics(
         path_to_tut, standard_variables_list_tut)
 
     # No need for PDW right now. It does not have the fields to support the traditional data anlaysis
@@ -202,21 +830,23 @@ def post_abstract_review_acceptance_numbers():
                                    "Initial Acceptance of Professional Development Workshop" : "Proposal_Accepted"}
 
     # This variable points to where the program can find the pdw submission file downloaded from XCD 
-    path_to_pdw = "../Data/pdw_post_rev.xlsx"
+    path_to_pdw = export_path(data_dir, "pdw_post_rev.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PDWAnalytics object to do the number crunching magic
-    PDWAnalytics.PDWAnalytics().postAbstractReviewAcceptanceAnalytics(path_to_pdw, standard_variables_list_pdw)
+    PDWAnalytics.PDWAnalytics(settings).postAbstractReviewAcceptanceAnalytics(path_to_pdw, standard_variables_list_pdw)
     """
 
 # Function to run post paper review accept/reject numbers
 
 
-def post_paper_review_acceptance_numbers():
+def post_paper_review_acceptance_numbers(data_dir="../Data", workers=None, settings=None):
     """
     Function runs post paper review accept/reject numbers.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of threads used to build the per-subcommittee reports. None runs them one after another
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
@@ -247,11 +877,11 @@ def post_paper_review_acceptance_numbers():
                                       "2023 Best Paper Nominee": "Paper_Accepted"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_papers = "Data/2024_paper_Review_all_done.xlsx"
+    path_to_papers = export_path(data_dir, "2024_paper_Review_all_done.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
     df_final_paper_numbers_summary = PaperAnalytics.PaperAnalytics(
-    ).postPaperReviewAcceptanceAnalytics(path_to_papers, standard_variables_list_papers)
+        settings).postPaperReviewAcceptanceAnalytics(path_to_papers, standard_variables_list_papers, workers)
 
     return
 
@@ -267,11 +897,11 @@ def post_paper_review_acceptance_numbers():
                                    "Final Acceptance of Tutorial": "TUT_Accepted"}
 
     # This variable points to where the program can find the tut submission file downloaded from XCD
-    path_to_tut = "../Data/TUT_done.xlsx"
+    path_to_tut = export_path(data_dir, "TUT_done.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the TUTAnalytics object to do the number crunching magic
     df_final_tutorial_numbers_summary = TutorialAnalytics.TutorialAnalytics(
-    ).postPaperReviewAcceptanceAnalytics(path_to_tut, standard_variables_list_tut)
+        settings).postPaperReviewAcceptanceAnalytics(path_to_tut, standard_variables_list_tut)
 
     # No need for PDW right now. It does not have the fields to support the traditional data anlaysis
     # Analyze the PDWs
@@ -289,11 +919,11 @@ def post_paper_review_acceptance_numbers():
                                    "Final_Reject": "PDW_Rejected"}
 
     # This variable points to where the program can find the pdw submission file downloaded from XCD
-    path_to_pdw = "../Data/PDW_Final_Acceptance_Numbers.xlsx"
+    path_to_pdw = export_path(data_dir, "PDW_Final_Acceptance_Numbers.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PDWAnalytics object to do the number crunching magic
     df_final_PDW_numbers_summary = PDWAnalytics.PDWAnalytics(
-    ).postPaperReviewAcceptanceAnalytics(path_to_pdw, standard_variables_list_pdw)
+        settings).postPaperReviewAcceptanceAnalytics(path_to_pdw, standard_variables_list_pdw)
 
     # Put all the dataframes together
     combined = pd.concat([df_final_paper_numbers_summary,
@@ -312,17 +942,18 @@ def post_paper_review_acceptance_numbers():
     # Remove the intermediate columns
     combined = combined.drop(
         ["Paper_Accepted", "Paper_Rejected", "TUT_Rejected"], axis=1)
-    combined.to_csv("Total_Accepts_By_Country.csv")
+    Tracer.writeCSV(combined, "Total_Accepts_By_Country.csv")
 
 # Function to specify how we run pre abstract analytics
 
 
-def post_abstract_submission_closure():
+def post_abstract_submission_closure(data_dir="../Data", settings=None):
     """
     Function to specify how we run pre abstract analytics.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
@@ -344,10 +975,10 @@ def post_abstract_submission_closure():
                                       "Policy, Standards, Management, and Acquisition": "PSMA"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_papers = "../Data/papers_post_transfer.xlsx"
+    path_to_papers = export_path(data_dir, "papers_post_transfer.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PaperAnalytics.PaperAnalytics().postAbstractSubmissionClosureAnalytics(
+    PaperAnalytics.PaperAnalytics(settings).postAbstractSubmissionClosureAnalytics(
         path_to_papers, standard_variables_list_papers)
 
     # Analyze the tutorials
@@ -356,10 +987,10 @@ def post_abstract_submission_closure():
         "Primary_Contact_-_Country": "Origin_Country"}
 
     # This variable points to where the program can find the tut submission file downloaded from XCD
-    path_to_tut = "../Data/tut.xlsx"
+    path_to_tut = export_path(data_dir, "tut.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the TUTAnalytics object to do the number crunching magic
-    TutorialAnalytics.TutorialAnalytics().postAbstractSubmissionClosureAnalytics(
+    TutorialAnalytics.TutorialAnalytics(settings).postAbstractSubmissionClosureAnalytics(
         path_to_tut, standard_variables_list_tut)
 
     # Analyze the PDWs
@@ -368,21 +999,22 @@ def post_abstract_submission_closure():
         "Primary_Contact_-_Country": "Origin_Country"}
 
     # This variable points to where the program can find the pdw submission file downloaded from XCD
-    path_to_pdw = "../Data/pdw.xlsx"
+    path_to_pdw = export_path(data_dir, "pdw.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PDWAnalytics object to do the number crunching magic
-    PDWAnalytics.PDWAnalytics().postAbstractSubmissionClosureAnalytics(
+    PDWAnalytics.PDWAnalytics(settings).postAbstractSubmissionClosureAnalytics(
         path_to_pdw, standard_variables_list_pdw)
 
 # Run the preabstract review anaysis to give the chairs their reports
 
 
-def pre_absract_review():
+def pre_absract_review(data_dir="../Data", settings=None):
     """
     Run preabstract review anaysis for chair's reports.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
@@ -405,10 +1037,10 @@ def pre_absract_review():
                                       "Comments_for_the_Subcommittee_(reviewers)": "Comments_for_Subcommittee"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_papers = "../Data/papers_review_iitsec_102934.xlsx"
+    path_to_papers = export_path(data_dir, "papers_review_iitsec_102934.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PaperAnalytics.PaperAnalytics().preAbstractReviewAnalytics(
+    PaperAnalytics.PaperAnalytics(settings).preAbstractReviewAnalytics(
         path_to_papers, standard_variables_list_papers)
 
     # Analyze the tutorials
@@ -427,10 +1059,10 @@ def pre_absract_review():
                                    "Comments": "Comments"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_tut = "../Data/tut_review_iitsec_102725.xlsx"
+    path_to_tut = export_path(data_dir, "tut_review_iitsec_102725.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    TutorialAnalytics.TutorialAnalytics().preAbstractReviewAnalytics(
+    TutorialAnalytics.TutorialAnalytics(settings).preAbstractReviewAnalytics(
         path_to_tut, standard_variables_list_tut)
 
     # Analyze PDWs
@@ -445,21 +1077,22 @@ def pre_absract_review():
                                    }
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_pdw = "../Data/PDW_review_iitsec_063607.xlsx"
+    path_to_pdw = export_path(data_dir, "PDW_review_iitsec_063607.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PDWAnalytics.PDWAnalytics().preAbstractReviewAnalytics(
+    PDWAnalytics.PDWAnalytics(settings).preAbstractReviewAnalytics(
         path_to_pdw, standard_variables_list_pdw)
 
 # Run the pre paper review analysis to give the chairs their reports
 
 
-def pre_paper_review_acceptance_numbers():
+def pre_paper_review_acceptance_numbers(data_dir="../Data", settings=None):
     """
     Run prepaper review anaysis for chair's reports.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
@@ -485,10 +1118,10 @@ def pre_paper_review_acceptance_numbers():
                                       "Comments_for_the_Subcommittee": "Comments_for_Subcommittee"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_papers = "../Data/paper_review_iitsec_2024.xlsx"
+    path_to_papers = export_path(data_dir, "paper_review_iitsec_2024.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PaperAnalytics.PaperAnalytics().prePaperReviewAnalytics(
+    PaperAnalytics.PaperAnalytics(settings).prePaperReviewAnalytics(
         path_to_papers, standard_variables_list_papers)
 
     # Analyze the tutorials
@@ -513,10 +1146,10 @@ def pre_paper_review_acceptance_numbers():
                                    "Comments": "Comments"}
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_tut = "../Data/tut_review_iitsec_2024.xlsx"
+    path_to_tut = export_path(data_dir, "tut_review_iitsec_2024.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    TutorialAnalytics.TutorialAnalytics().prePaperReviewAnalytics(
+    TutorialAnalytics.TutorialAnalytics(settings).prePaperReviewAnalytics(
         path_to_tut, standard_variables_list_tut)
 
     # Analyze PDWs
@@ -531,55 +1164,115 @@ def pre_paper_review_acceptance_numbers():
                                    }
 
     # This variable points to where the program can find the abstract submission file downloaded from XCD
-    path_to_pdw = "../Data/PDW_review_iitsec_2024.xlsx"
+    path_to_pdw = export_path(data_dir, "PDW_review_iitsec_2024.xlsx", settings)
 
     # Pass these configuration parameters into the post abstraction submission closure analytics function inside the PaperAnalytics object to do the number crunching magic
-    PDWAnalytics.PDWAnalytics().prePaperReviewAnalytics(
+    PDWAnalytics.PDWAnalytics(settings).prePaperReviewAnalytics(
         path_to_pdw, standard_variables_list_pdw)
 
 # Run Scholarship Analysis on request
 
 
-def scholarship_analysis():
+def scholarship_analysis(data_dir="../Data", workers=None, settings=None):
     """
     Run Scholarship Analysis on request.
 
     Args:
-        None
+        data_dir (str): Directory holding the XCD exports
+        workers (int): Number of processes used to load the yearly paper files. None uses every core
+        settings (RunSettings.RunSettings): Cache and report options handed to the analytics. None uses the defaults
 
     Returns:
         None
     """
     # Define List of submission file paths *need actual paths* - should be a config file
-    path_to_papers = ["../Data/2019_Paper_Submissions.xlsx",
-                      "../Data/2020_Paper_Submissions.xlsx",
-                      "../Data/2021_Paper_Submissions.xlsx",
-                      "../Data/2022_Paper_Submissions.xlsx",
-                      "../Data/2023_Paper_Submissions.xlsx",
-                      "../Data/2024_Paper_Submissions.xlsx"]
+    path_to_papers = [os.path.join(data_dir, "2019_Paper_Submissions.xlsx"),
+                      os.path.join(data_dir, "2020_Paper_Submissions.xlsx"),
+                      os.path.join(data_dir, "2021_Paper_Submissions.xlsx"),
+                      os.path.join(data_dir, "2022_Paper_Submissions.xlsx"),
+                      os.path.join(data_dir, "2023_Paper_Submissions.xlsx"),
+                      os.path.join(data_dir, "2024_Paper_Submissions.xlsx")]
 
     # Define Path to awardee file path *need actual path* - should be part of a config file
-    path_to_scholar = "../Data/Scholarships.xlsx"
-
-    # Establish standard variable names map ("XCD Name":"New Name")
-    standard_variables_list_schol = {"Subcommittee_Category": "Subcommittee",
-                                     "Main_Subcommittee_Category": "Subcommittee",
-                                     "Review_Status": "Abstract_Accept",
-                                     "Paper_Review_Status": "Paper_Accept",
-                                     "Education": "ED", "Training": "TR",
-                                     "Simulation": "SIM",
-                                     "Human Performance Analysis and Engineering": "HPAE",
-                                     "Emerging Concepts and Innovative Technologies": "ECIT",
-                                     "Policy, Standards, Management, and Acquisition": "PSMA",
-                                     "Initial Acceptance at Abstract Stage": "Abstract_Accepted", 																								  			"Initial Rejection at Abstract Stage": "Abstract_Rejected", "Final Acceptance at Paper Stage": "Paper_Accepted",                             		  "Final Rejection at Paper Stage": "Paper_Rejected", "IITSEC Paper Approved": "Paper_Accepted", 														"Final Acceptance at Paper Review ": "Paper_Accepted", "Final Rejection at Paper Review": "Paper_Rejected",
-                                     "Best Paper Winner": "Paper_Accepted",
-                                     "I/ITSEC 2021 BP Paper Approved": "Paper_Accepted",
-                                     "2023 Best Paper Nominee": "Paper_Accepted"}
+    path_to_scholar = export_path(data_dir, "Scholarships.xlsx", settings)
 
     # Call ScholarAnalytics object
-    ScholarAnalytics.ScholarAnalytics().Analytics(
-        path_to_papers, path_to_scholar, standard_variables_list_schol)
-
-
-# Run our main function to start the program
-main()
+    ScholarAnalytics.ScholarAnalytics(settings).Analytics(
+        path_to_papers, path_to_scholar, SCHOLARSHIP_ALIASES, workers)
+
+
+# Standard variable names map for the yearly paper exports ("XCD Name":"New Name"). It covers the names XCD has used
+# across every year, so the scholarship analysis and the submission warehouse both go through it
+SCHOLARSHIP_ALIASES = {"Subcommittee_Category": "Subcommittee",
+                       "Main_Subcommittee_Category": "Subcommittee",
+                       "Review_Status": "Abstract_Accept",
+                       "Paper_Review_Status": "Paper_Accept",
+                       "Education": "ED", "Training": "TR",
+                       "Simulation": "SIM",
+                       "Human Performance Analysis and Engineering": "HPAE",
+                       "Emerging Concepts and Innovative Technologies": "ECIT",
+                       "Policy, Standards, Management, and Acquisition": "PSMA",
+                       "Initial Acceptance at Abstract Stage": "Abstract_Accepted", 																								  			"Initial Rejection at Abstract Stage": "Abstract_Rejected", "Final Acceptance at Paper Stage": "Paper_Accepted",                             		  "Final Rejection at Paper Stage": "Paper_Rejected", "IITSEC Paper Approved": "Paper_Accepted", 														"Final Acceptance at Paper Review ": "Paper_Accepted", "Final Rejection at Paper Review": "Paper_Rejected",
+                       "Best Paper Winner": "Paper_Accepted",
+                       "I/ITSEC 2021 BP Paper Approved": "Paper_Accepted",
+                       "2023 Best Paper Nominee": "Paper_Accepted"}
+
+# Programs the submission warehouse can ingest. Only the papers have a report that reads the warehouse, the scholarship
+# analysis, so the tutorials and PDWs stay out until one of their reports does too. Papers use the scholarship map plus the
+# demographic names since it is the one that knows every year's XCD names. Format -> "program": ("module", "class", {"XCD_Name":"New_Name"})
+WAREHOUSE_PROGRAMS = {"papers": ("Papers.PaperAnalytics", "PaperAnalytics",
+                                 dict(SCHOLARSHIP_ALIASES,
+                                      **{"_Does_the_primary_or_secondary_author_(first_second_or_both)_reside_outside_the_US?_": "International(Y/N)",
+                                         "Primary_Contact_-_Country": "Origin_Country",
+                                         "How_would_you_label_your_submission?": "Org_Type"}))}
+
+# Report stages that can be run from the command line. Format -> "stage-name": function
+STAGES = {"post-abstract-submission-closure": post_abstract_submission_closure,
+          "pre-abstract-review": pre_absract_review,
+          "post-abstract-review": post_abstract_review_acceptance_numbers,
+          "pre-paper-review": pre_paper_review_acceptance_numbers,
+          "post-paper-review": post_paper_review_acceptance_numbers,
+          "scholarship": scholarship_analysis}
+
+# Exports each stage reads and the pattern a new download of each one comes in under. A stage reads the usual name, or in
+# --watch mode the newest download the watcher saw land for it. Abstract review exports end in a six digit time stamp
+# and paper review exports end in the year, which keeps the tut and PDW ones apart.
+# Format -> "stage-name": {"usual-file-name": "file-pattern"}
+STAGE_EXPORTS = {"post-abstract-submission-closure": {"papers_post_transfer.xlsx": "papers_post_transfer*.xlsx",
+                                                      "tut.xlsx": "tut.xlsx",
+                                                      "pdw.xlsx": "pdw.xlsx"},
+                 "pre-abstract-review": {"papers_review_iitsec_102934.xlsx": "papers_review_iitsec_*.xlsx",
+                                         "tut_review_iitsec_102725.xlsx": "tut_review_iitsec_[0-9][0-9][0-9][0-9][0-9][0-9].xlsx",
+                                         "PDW_review_iitsec_063607.xlsx": "PDW_review_iitsec_[0-9][0-9][0-9][0-9][0-9][0-9].xlsx"},
+                 "post-abstract-review": {"paper_final_rev.xlsx": "paper_final_rev*.xlsx",
+                                          "tut_final_rev.xlsx": "tut_final_rev*.xlsx",
+                                          "pdw_post_rev.xlsx": "pdw_post_rev*.xlsx"},
+                 "pre-paper-review": {"paper_review_iitsec_2024.xlsx": "paper_review_iitsec_*.xlsx",
+                                      "tut_review_iitsec_2024.xlsx": "tut_review_iitsec_[0-9][0-9][0-9][0-9].xlsx",
+                                      "PDW_review_iitsec_2024.xlsx": "PDW_review_iitsec_[0-9][0-9][0-9][0-9].xlsx"},
+                 "post-paper-review": {"2024_paper_Review_all_done.xlsx": "*_paper_Review_all_done.xlsx",
+                                       "TUT_done.xlsx": "TUT_done*.xlsx",
+                                       "PDW_Final_Acceptance_Numbers.xlsx": "PDW_Final_Acceptance_Numbers*.xlsx"},
+                 "scholarship": {"Scholarships.xlsx": "Scholarships*.xlsx"}}
+
+# Export file names the watcher looks for and the stages that read them. The yearly paper submissions are all read, so
+# any of them landing reruns the scholarship stage. Format -> "file-pattern": [stage-names]
+WATCH_PATTERNS = {pattern: [stage_name for stage_name, exports in STAGE_EXPORTS.items() if pattern in exports.values()]
+                  for pattern in dict.fromkeys(pattern for exports in STAGE_EXPORTS.values() for pattern in exports.values())}
+WATCH_PATTERNS["*_Paper_Submissions.xlsx"] = ["scholarship"]
+
+# Stages run to fill the JSON service when no --stage is given. These load the submission exports the dashboard shows
+SERVE_STAGES = ["post-abstract-submission-closure", "post-abstract-review"]
+
+# Analytics modules each stage needs. run_stages imports these right before the stage runs. Format -> "stage-name": [modules]
+STAGE_MODULES = {"post-abstract-submission-closure": ["Papers.PaperAnalytics", "TUT.TutorialAnalytics", "PDW.PDWAnalytics"],
+                 "pre-abstract-review": ["Papers.PaperAnalytics", "TUT.TutorialAnalytics", "PDW.PDWAnalytics"],
+                 "post-abstract-review": ["Papers.PaperAnalytics", "TUT.TutorialAnalytics"],
+                 "pre-paper-review": ["Papers.PaperAnalytics", "TUT.TutorialAnalytics", "PDW.PDWAnalytics"],
+                 "post-paper-review": ["Papers.PaperAnalytics", "TUT.TutorialAnalytics", "PDW.PDWAnalytics"],
+                 "scholarship": ["Scholarships.ScholarAnalytics"]}
+
+
+# Run our main function to start the program. The guard keeps worker processes from starting the menu again
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file lets the tests import the Utils and analytics modules the same way main.py does
+
+# Include the goodies we are going to need
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
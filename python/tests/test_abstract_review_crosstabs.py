@@ -0,0 +1,94 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that the post abstract review paper reports match the old crosstab code
+
+# Include the goodies we are going to need
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Papers.PaperAnalytics as PaperAnalytics
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+
+# Generated exports for the post abstract review stage, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 29, scale = 1)
+    for file_name in main.STAGE_EXPORTS["post-abstract-review"]:
+        getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run the post abstract review stage into its own directory. Hands back the paper export and aliases it counted
+def runPostAbstractReview(dataDir:str, outDir, monkeypatch):
+    loads = []
+    loadCountCube = PaperAnalytics.PaperAnalytics.loadCountCube
+
+    def recordingLoadCountCube(self, filePath:str, listOfColumnAliases:dict, *args):
+        loads.append((filePath, listOfColumnAliases))
+        return loadCountCube(self, filePath, listOfColumnAliases, *args)
+
+    monkeypatch.setattr(PaperAnalytics.PaperAnalytics, "loadCountCube", recordingLoadCountCube)
+
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.STAGES["post-abstract-review"](dataDir, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+    finally:
+        os.chdir(working_dir)
+
+    return loads[0]
+
+
+# The old loadXCDFile and cleanData
+def oldLoadClean(filePath:str, listOfColumnAliases:dict):
+    df_papers = pd.read_excel(filePath)
+    df_papers.columns = df_papers.columns.str.replace(' ', '_')
+    df_papers = df_papers.rename(columns = listOfColumnAliases)
+    return df_papers.replace(listOfColumnAliases)
+
+
+# The old percentageSubmissionsByOrgType
+def oldPercentageSubmissionsByOrgType(df_papers:pd.DataFrame, fileName:str):
+    submission_count = df_papers["ID"].nunique()
+    pie_chart = df_papers.drop_duplicates(subset = ["ID"]).groupby("Org_Type").size()
+    pie_chart.divide(submission_count).to_csv(fileName)
+
+
+# The old postAbstractReviewAcceptanceAnalytics, writing into outDir
+def oldPostAbstractReviewReports(df_records:pd.DataFrame, outDir):
+    pd.crosstab(df_records["Assigned_Subcommittee"], df_records["Abstract_Accept_Reject"]).to_csv(
+        os.path.join(str(outDir), "Papers_PostAbstractReview_Subcommittee_AcceptReject_Stats.csv"))
+
+    oldPercentageSubmissionsByOrgType(df_records[df_records["Abstract_Accept_Reject"] == "Abstract_Accepted"],
+                                      os.path.join(str(outDir), "Papers_PostAbstractReview_OrgType_TotalAccepts.csv"))
+    oldPercentageSubmissionsByOrgType(df_records[df_records["Abstract_Accept_Reject"] == "Abstract_Rejected"],
+                                      os.path.join(str(outDir), "Papers_PostAbstractReview_OrgType_TotalRejects.csv"))
+
+    for current_subcommittee in df_records["Assigned_Subcommittee"].unique():
+        df_current_subcommittee = df_records[df_records["Assigned_Subcommittee"] == str(current_subcommittee)]
+        pd.crosstab(df_current_subcommittee["Org_Type"], df_current_subcommittee["Abstract_Accept_Reject"]).to_csv(
+            os.path.join(str(outDir), "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv"))
+        pd.crosstab(df_current_subcommittee["International(Y/N)"], df_current_subcommittee["Abstract_Accept_Reject"]).to_csv(
+            os.path.join(str(outDir), "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv"))
+
+
+# Every paper report the count cube writes is the same file the old crosstabs wrote
+def test_paper_reports_match_old_crosstabs(dataDir, tmp_path, monkeypatch):
+    (tmp_path / "new").mkdir()
+    (tmp_path / "old").mkdir()
+    file_path, aliases = runPostAbstractReview(dataDir, tmp_path / "new", monkeypatch)
+    oldPostAbstractReviewReports(oldLoadClean(file_path, aliases), tmp_path / "old")
+
+    old_reports = sorted(os.listdir(str(tmp_path / "old")))
+    assert len(old_reports) > 3
+    for file_name in old_reports:
+        with open(str(tmp_path / "new" / file_name)) as new_report, open(str(tmp_path / "old" / file_name)) as old_report:
+            assert new_report.read() == old_report.read(), file_name
@@ -0,0 +1,119 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that the grouped birddog rosters match a plain loop over the reviews
+
+# Include the goodies we are going to need
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Papers.PaperAnalytics as PaperAnalytics
+import TUT.TutorialAnalytics as TutorialAnalytics
+import Utils.BirddogRoster as BirddogRoster
+import Utils.ReviewSummary as ReviewSummary
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Summary spec, summary report, and reverse index report for each program with a birddog question
+ROSTERS = [(PaperAnalytics.PAPER_ABSTRACT_REVIEW_SUMMARY, "Papers_AbstractReviewSummary.csv", "Papers_BirddogVolunteers.csv"),
+           (TutorialAnalytics.TUT_ABSTRACT_REVIEW_SUMMARY, "TUT_AbstractReviewSummary.csv", "TUT_BirddogVolunteers.csv")]
+
+
+# Run the pre abstract review stage once for the whole module. Hands back the output directory and the cleaned
+# reviews each summary spec was run over
+@pytest.fixture(scope = "module")
+def stageRun(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 41, scale = 1)
+    for file_name in main.STAGE_EXPORTS["pre-abstract-review"]:
+        getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    summarized = []
+    summarize = ReviewSummary.ReviewSummary.summarize
+
+    def recordingSummarize(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        summarized.append((self.spec, df_reviews))
+        return summarize(self, df_reviews, idColumn)
+
+    out_dir = str(tmp_path_factory.mktemp("out"))
+    working_dir = os.getcwd()
+    os.chdir(out_dir)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(ReviewSummary.ReviewSummary, "summarize", recordingSummarize)
+        try:
+            main.STAGES["pre-abstract-review"](data_dir, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+        finally:
+            os.chdir(working_dir)
+
+    return out_dir, summarized
+
+
+# The reviews a spec was run over
+def reviewsFor(summarized:list, spec:list):
+    return next(df_reviews for summarized_spec, df_reviews in summarized if summarized_spec is spec)
+
+
+# Read a report back as the text that was written
+def readReport(filePath:str):
+    return pd.read_csv(filePath, index_col = 0, dtype = str, keep_default_na = False)
+
+
+# The old per-ID filter for the volunteers, one name per line
+def oldVolunteers(df_reviews:pd.DataFrame):
+    volunteers = {}
+    for unique_id in df_reviews["ID"].unique():
+        df_current_record = df_reviews.loc[df_reviews["ID"] == unique_id]
+        df_volunteers = df_current_record[df_current_record["Birddog_Volunteer"] == "Yes"]
+        volunteers[str(unique_id)] = "\n".join(df_volunteers["ReviewerLastname"] + ',' + df_volunteers["ReviewerFirstname"])
+
+    return volunteers
+
+
+# Walk the reviews one at a time, noting each submission a reviewer volunteered for the first time they did
+def loopReviewerIndex(df_reviews:pd.DataFrame):
+    volunteered = {}
+    for _, review in df_reviews.iterrows():
+        if review["Birddog_Volunteer"] != "Yes" or pd.isna(review["ReviewerLastname"]) or pd.isna(review["ReviewerFirstname"]):
+            continue
+        submission_ids = volunteered.setdefault(review["ReviewerLastname"] + ',' + review["ReviewerFirstname"], [])
+        if str(review["ID"]) not in submission_ids:
+            submission_ids.append(str(review["ID"]))
+
+    reviewers = sorted(volunteered, key = lambda reviewer: (-len(volunteered[reviewer]), reviewer))
+    return pd.DataFrame({BirddogRoster.REVIEWER_COLUMN: reviewers,
+                         "Num_Volunteered": [str(len(volunteered[reviewer])) for reviewer in reviewers],
+                         "Volunteered_IDs": ["\n".join(volunteered[reviewer]) for reviewer in reviewers]})
+
+
+# Each summary lists the same volunteers the old per-ID filter found
+@pytest.mark.parametrize("spec, summaryReport, indexReport", ROSTERS, ids = ["papers", "tut"])
+def test_volunteer_column_matches_old_filter(stageRun, spec, summaryReport, indexReport):
+    out_dir, summarized = stageRun
+    df_summary = readReport(os.path.join(out_dir, summaryReport))
+
+    assert dict(zip(df_summary["ID"], df_summary["Birddog_Volunteer"])) == oldVolunteers(reviewsFor(summarized, spec))
+
+
+# The reverse index lists the same submissions per volunteer as walking the reviews one at a time
+@pytest.mark.parametrize("spec, summaryReport, indexReport", ROSTERS, ids = ["papers", "tut"])
+def test_reviewer_index_matches_loop(stageRun, spec, summaryReport, indexReport):
+    out_dir, summarized = stageRun
+    df_index = readReport(os.path.join(out_dir, indexReport)).reset_index(drop = True)
+
+    pd.testing.assert_frame_equal(df_index, loopReviewerIndex(reviewsFor(summarized, spec)))
+
+
+# Reviewing a submission twice only counts once, and reviewers missing a name or saying no are left out
+def test_reviewer_index_counts_each_submission_once():
+    df_reviews = pd.DataFrame({"ID": [1, 1, 2, 3, 3, 4],
+                               "ReviewerLastname": ["Smith", "Smith", "Smith", "Jones", None, "Jones"],
+                               "ReviewerFirstname": ["Ann", "Ann", "Ann", "Bo", "Cy", "Bo"],
+                               "Birddog_Volunteer": ["Yes", "Yes", "Yes", "Yes", "Yes", "No"]})
+
+    df_index = BirddogRoster.reviewerIndex(df_reviews)
+    assert df_index[BirddogRoster.REVIEWER_COLUMN].tolist() == ["Smith,Ann", "Jones,Bo"]
+    assert df_index["Num_Volunteered"].tolist() == [2, 1]
+    assert df_index["Volunteered_IDs"].tolist() == ["1\n2", "3"]
@@ -0,0 +1,115 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that every collect shape holds the same comments the old per-ID lists did
+
+# Include the goodies we are going to need
+import json
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Papers.PaperAnalytics as PaperAnalytics
+import Utils.ReviewSummary as ReviewSummary
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Report the shapes get checked on, the long shape's text table next to it, and the columns it collects
+SUMMARY_REPORT = "Papers_PaperReviewSummary.csv"
+TEXT_REPORT = "Papers_PaperReviewSummary_Text.csv"
+COLLECT_COLUMNS = [entry[0] for entry in PaperAnalytics.PAPER_PAPER_REVIEW_SUMMARY if entry[2] == "collect"]
+
+
+# Generated exports for the pre paper review stage, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 37, scale = 1)
+    for file_name in main.STAGE_EXPORTS["pre-paper-review"]:
+        getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run the pre paper review stage with the given shape into its own directory. Hands back the cleaned paper reviews
+def runPrePaperReview(dataDir:str, outDir, collectShape:str, monkeypatch):
+    summarized = []
+    summarize = ReviewSummary.ReviewSummary.summarize
+
+    def recordingSummarize(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        if self.spec is PaperAnalytics.PAPER_PAPER_REVIEW_SUMMARY:
+            summarized.append(df_reviews)
+        return summarize(self, df_reviews, idColumn)
+
+    monkeypatch.setattr(ReviewSummary.ReviewSummary, "summarize", recordingSummarize)
+
+    os.makedirs(str(outDir))
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.STAGES["pre-paper-review"](dataDir, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False), collectShape = collectShape))
+    finally:
+        os.chdir(working_dir)
+
+    return summarized[0]
+
+
+# Read a report back as the text that was written
+def readReport(filePath:str):
+    return pd.read_csv(filePath, index_col = 0, dtype = str, keep_default_na = False)
+
+
+# The old loops' comment lists. Format -> {(ID, Output_Column): [comments]}
+def oldCollation(df_papers:pd.DataFrame):
+    collated = {}
+    for unique_id in df_papers["ID"].unique():
+        df_current_paper = df_papers.loc[df_papers["ID"] == unique_id]
+        for entry in PaperAnalytics.PAPER_PAPER_REVIEW_SUMMARY:
+            if entry[2] == "collect":
+                collated[(str(unique_id), entry[0])] = [x for x in df_current_paper[entry[1]].tolist() if str(x) != 'nan']
+
+    return collated
+
+
+# The cells of the collected columns, keyed like oldCollation
+def collectedCells(df_summary:pd.DataFrame):
+    return {(unique_id, output_column): cell for output_column in COLLECT_COLUMNS
+            for unique_id, cell in zip(df_summary["ID"], df_summary[output_column])}
+
+
+# The list shape writes the same python lists the old loops did
+def test_list_shape_matches_old_lists(dataDir, tmp_path, monkeypatch):
+    df_papers = runPrePaperReview(dataDir, tmp_path / "list", "list", monkeypatch)
+
+    expected = {key: str(comments) for key, comments in oldCollation(df_papers).items()}
+    assert collectedCells(readReport(str(tmp_path / "list" / SUMMARY_REPORT))) == expected
+
+
+# The joined and json shapes hold the same comments in the same order, just laid out differently
+def test_joined_and_json_shapes_match_old_lists(dataDir, tmp_path, monkeypatch):
+    df_papers = runPrePaperReview(dataDir, tmp_path / "joined", "joined", monkeypatch)
+    runPrePaperReview(dataDir, tmp_path / "json", "json", monkeypatch)
+    old_collation = oldCollation(df_papers)
+
+    joined = collectedCells(readReport(str(tmp_path / "joined" / SUMMARY_REPORT)))
+    assert joined == {key: "\n".join(comments) for key, comments in old_collation.items()}
+
+    json_cells = collectedCells(readReport(str(tmp_path / "json" / SUMMARY_REPORT)))
+    assert {key: json.loads(cell) for key, cell in json_cells.items()} == old_collation
+
+
+# The long shape moves the comments out of the summary into one row per comment, in the old lists' order
+def test_long_shape_matches_old_lists(dataDir, tmp_path, monkeypatch):
+    df_papers = runPrePaperReview(dataDir, tmp_path / "long", "long", monkeypatch)
+
+    df_summary = readReport(str(tmp_path / "long" / SUMMARY_REPORT))
+    assert not set(COLLECT_COLUMNS) & set(df_summary.columns)
+
+    df_text = readReport(str(tmp_path / "long" / TEXT_REPORT))
+    long_collation = {}
+    for unique_id, output_column, value in zip(df_text["ID"], df_text["Column"], df_text["Value"]):
+        long_collation.setdefault((unique_id, output_column), []).append(value)
+
+    assert long_collation == {key: comments for key, comments in oldCollation(df_papers).items() if comments}
@@ -0,0 +1,91 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that streaming the count reports gives the same answers as loading the whole file
+
+# Include the goodies we are going to need
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Utils.CountCube as CountCube
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Chunk sizes to stream at. The small ones split most submissions across chunks, the big one reads the file in one go
+CHUNK_ROWS = [13, 97, 100000]
+
+# Stages whose reports all come out of the count cube
+COUNT_STAGES = ["post-abstract-submission-closure", "post-abstract-review"]
+
+
+# Generated exports for the count stages, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 7, scale = 1)
+    for stage_name in COUNT_STAGES:
+        for file_name in main.STAGE_EXPORTS[stage_name]:
+            getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run the count stages into their own directory and hand back every report they wrote
+def runCountStages(dataDir:str, outDir, chunkRows:int):
+    settings = RunSettings.RunSettings(XCDCache.XCDCache(enabled = False), chunkRows = chunkRows)
+
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        for stage_name in COUNT_STAGES:
+            main.STAGES[stage_name](dataDir, settings)
+    finally:
+        os.chdir(working_dir)
+
+    return {file_name: open(os.path.join(str(outDir), file_name)).read() for file_name in sorted(os.listdir(str(outDir)))}
+
+
+# Records with repeat IDs, submissions spread across chunks, and empty cells in both the cube and ID columns
+def recordsWithBlanks():
+    rng = np.random.default_rng(11)
+    n = 500
+
+    df_records = pd.DataFrame({"ID": rng.integers(0, 120, n).astype(float),
+                               "Track": rng.integers(0, 3, n).astype(float),
+                               "Country": np.asarray(["USA", "Canada", "Japan", None], dtype = object)[rng.integers(0, 4, n)],
+                               "Status": np.asarray(["Accept", "Reject"], dtype = object)[rng.integers(0, 2, n)]})
+    df_records.loc[rng.random(n) < 0.05, "ID"] = np.nan
+    df_records.loc[rng.random(n) < 0.05, "Track"] = np.nan
+
+    return df_records
+
+
+# Streaming the cube a chunk at a time counts each submission once, just like counting the whole frame
+@pytest.mark.parametrize("idColumns", [["ID"], ["ID", "Track"]])
+def test_chunked_cube_matches_whole_frame(idColumns):
+    df_records = recordsWithBlanks()
+    cube_columns = ["Country", "Status"]
+    whole = CountCube.CountCube(cube_columns, idColumns).update(df_records).result().sort_index()
+
+    for chunk_rows in CHUNK_ROWS:
+        count_cube = CountCube.CountCube(cube_columns, idColumns)
+        for start in range(0, len(df_records.index), chunk_rows):
+            count_cube.update(df_records.iloc[start:start + chunk_rows])
+
+        pd.testing.assert_frame_equal(count_cube.result().sort_index(), whole)
+
+
+# The count stages write the same reports whether the exports are streamed or loaded whole
+def test_streamed_reports_match_whole_file(dataDir, tmp_path):
+    (tmp_path / "whole").mkdir()
+    whole = runCountStages(dataDir, tmp_path / "whole", None)
+    assert whole
+
+    for chunk_rows in CHUNK_ROWS:
+        out_dir = tmp_path / ("chunk" + str(chunk_rows))
+        out_dir.mkdir()
+        assert runCountStages(dataDir, out_dir, chunk_rows) == whole
@@ -0,0 +1,120 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that the partitioned post paper review reports match the old per-subcommittee filters
+
+# Include the goodies we are going to need
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Papers.PaperAnalytics as PaperAnalytics
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+
+# Generated exports for the post paper review stage, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 31, scale = 1)
+    for file_name in main.STAGE_EXPORTS["post-paper-review"]:
+        getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run the post paper review stage into its own directory. Hands back the paper export, its aliases, and the combined table
+def runPostPaperReview(dataDir:str, outDir, monkeypatch):
+    runs = []
+    postPaperReview = PaperAnalytics.PaperAnalytics.postPaperReviewAcceptanceAnalytics
+
+    def recordingPostPaperReview(self, filePath:str, listOfColumnAliases:dict, maxWorkers:int = None):
+        combined = postPaperReview(self, filePath, listOfColumnAliases, maxWorkers)
+        runs.append((filePath, listOfColumnAliases, combined))
+        return combined
+
+    monkeypatch.setattr(PaperAnalytics.PaperAnalytics, "postPaperReviewAcceptanceAnalytics", recordingPostPaperReview)
+
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.run_stage("post-paper-review", dataDir, None, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+    finally:
+        os.chdir(working_dir)
+
+    return runs[0]
+
+
+# Run just the paper analytics into its own directory with the given number of threads and hand back the combined table
+def runPaperAnalytics(filePath:str, listOfColumnAliases:dict, outDir, maxWorkers:int):
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        analytics = PaperAnalytics.PaperAnalytics(RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+        return analytics.postPaperReviewAcceptanceAnalytics(filePath, listOfColumnAliases, maxWorkers)
+    finally:
+        os.chdir(working_dir)
+
+
+# The old loadXCDFile and cleanData
+def oldLoadClean(filePath:str, listOfColumnAliases:dict):
+    df_papers = pd.read_excel(filePath)
+    df_papers.columns = df_papers.columns.str.replace(' ', '_')
+    df_papers = df_papers.rename(columns = listOfColumnAliases)
+    return df_papers.replace(listOfColumnAliases)
+
+
+# The old per-subcommittee filters and country crosstabs in postPaperReviewAcceptanceAnalytics, writing into outDir.
+# The overall reports come out of the count cube, which the post abstract review tests already cover
+def oldPostPaperReviewReports(df_records:pd.DataFrame, outDir):
+    for current_subcommittee in df_records["Assigned_Subcommittee"].unique():
+        df_current_subcommittee = df_records[df_records["Assigned_Subcommittee"] == str(current_subcommittee)]
+        pd.crosstab(df_current_subcommittee["Org_Type"], df_current_subcommittee["Paper_Accept_Reject"]).to_csv(
+            os.path.join(str(outDir), "Papers_" + str(current_subcommittee) + "_Accept_Reject_ByOrg.csv"))
+        pd.crosstab(df_current_subcommittee["International(Y/N)"], df_current_subcommittee["Paper_Accept_Reject"]).to_csv(
+            os.path.join(str(outDir), "Papers_" + str(current_subcommittee) + "_Accept_Reject_International.csv"))
+
+    df_records_accepts = df_records[df_records["Paper_Accept_Reject"] == "Paper_Accepted"]
+    df_records_rejects = df_records[df_records["Paper_Accept_Reject"] == "Paper_Rejected"]
+
+    cross_tab_accepted = pd.crosstab(df_records_accepts["Origin_Country"], df_records_accepts["Assigned_Subcommittee"])
+    cross_tab_accepted['Paper_Accepted'] = cross_tab_accepted.sum(axis = 1)
+    cross_tab_rejected = pd.crosstab(df_records_rejects["Origin_Country"], df_records_rejects["Assigned_Subcommittee"])
+    cross_tab_rejected["Paper_Rejected"] = cross_tab_rejected.sum(axis = 1)
+
+    combined = pd.concat([cross_tab_accepted, cross_tab_rejected["Paper_Rejected"]], axis = 1)
+    return combined.fillna(0)
+
+
+# Same combined table as the old code. The cleaned columns are categorical now, so the labels can come back as categorical indexes
+def assertSameCombined(combined:pd.DataFrame, oldCombined:pd.DataFrame):
+    combined = combined.set_axis(combined.index.astype(str), axis = 0).set_axis(combined.columns.astype(str), axis = 1)
+    pd.testing.assert_frame_equal(combined, oldCombined)
+
+
+# Files the old code wrote are the same in the new directory
+def assertSameReports(oldDir, newDir):
+    old_reports = sorted(os.listdir(str(oldDir)))
+    assert len(old_reports) > 2
+    for file_name in old_reports:
+        with open(os.path.join(str(newDir), file_name)) as new_report, open(os.path.join(str(oldDir), file_name)) as old_report:
+            assert new_report.read() == old_report.read(), file_name
+
+
+# The per-subcommittee reports and the combined country table match the old filters, serial or threaded
+def test_partitioned_reports_match_old_filters(dataDir, tmp_path, monkeypatch):
+    for directory in ["stage", "threads", "old"]:
+        (tmp_path / directory).mkdir()
+
+    file_path, aliases, combined = runPostPaperReview(dataDir, tmp_path / "stage", monkeypatch)
+    old_combined = oldPostPaperReviewReports(oldLoadClean(file_path, aliases), tmp_path / "old")
+
+    assertSameReports(tmp_path / "old", tmp_path / "stage")
+    assertSameCombined(combined, old_combined)
+
+    threaded_combined = runPaperAnalytics(file_path, aliases, tmp_path / "threads", 4)
+    assertSameReports(tmp_path / "old", tmp_path / "threads")
+    assertSameCombined(threaded_combined, old_combined)
@@ -0,0 +1,143 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that the grouped paper review summaries match the old per-ID loops
+
+# Include the goodies we are going to need
+import io
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Papers.PaperAnalytics as PaperAnalytics
+import Utils.ReviewSummary as ReviewSummary
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Stages that write the paper review summaries
+SUMMARY_STAGES = ["pre-abstract-review", "pre-paper-review"]
+
+
+# Generated exports for the summary stages, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 19, scale = 1)
+    for stage_name in SUMMARY_STAGES:
+        for file_name in main.STAGE_EXPORTS[stage_name]:
+            getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run a stage into its own directory. Hands back the cleaned reviews each summary spec was run over
+def runStage(stageName:str, dataDir:str, outDir, monkeypatch):
+    summarized = []
+    summarize = ReviewSummary.ReviewSummary.summarize
+
+    def recordingSummarize(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        summarized.append((self.spec, df_reviews))
+        return summarize(self, df_reviews, idColumn)
+
+    monkeypatch.setattr(ReviewSummary.ReviewSummary, "summarize", recordingSummarize)
+
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.STAGES[stageName](dataDir, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+    finally:
+        os.chdir(working_dir)
+
+    return summarized
+
+
+# The reviews a spec was run over
+def reviewsFor(summarized:list, spec:list):
+    return next(df_reviews for summarized_spec, df_reviews in summarized if summarized_spec is spec)
+
+
+# Read a summary back the way the chairs see it. The old loops wrote 0 as every row label, so those are left out
+def readReport(report):
+    return pd.read_csv(report, index_col = 0).reset_index(drop = True)
+
+
+# Write the old loop's rows out and read them back, so both sides go through the same csv round trip
+def readReference(rows:list):
+    return readReport(io.StringIO(pd.DataFrame(rows).to_csv()))
+
+
+# Number of reviews for the paper with the given verdict
+def numVerdicts(df_current_paper:pd.DataFrame, verdict:str):
+    return len(df_current_paper[df_current_paper["Acceptance"] == verdict].index)
+
+
+# The non-empty comments in a column, the way the old loops filtered them
+def listComments(df_current_paper:pd.DataFrame, columnName:str):
+    return [x for x in df_current_paper[columnName].tolist() if str(x) != 'nan']
+
+
+# The old preAbstractReviewAnalytics loop
+def oldAbstractReviewSummary(df_papers:pd.DataFrame):
+    rows = []
+    for unique_id in df_papers["ID"].unique():
+        df_current_paper = df_papers.loc[df_papers["ID"] == unique_id]
+        df_volunteers = df_current_paper[df_current_paper["Birddog_Volunteer"] == "Yes"]
+
+        rows.append({"ID": unique_id,
+                     # The old loop took the title and subcommittee off the second review. The summary takes the first
+                     "Title": df_current_paper["Title"].iloc[0],
+                     # The old loop printed the names with Series.to_string. The summary puts one name per line
+                     "Birddog_Volunteer": "\n".join(df_volunteers["ReviewerLastname"] + ',' + df_volunteers["ReviewerFirstname"]),
+                     "Assigned_Subcommittee": df_current_paper["Assigned_Subcommittee"].iloc[0],
+                     "Mean_Substance_Rating": round(df_current_paper.loc[:, "Substance_Rating"].mean(), 2),
+                     "Mean_Originality_Rating": round(df_current_paper.loc[:, "Originality_Rating"].mean(), 2),
+                     "Mean_Sales_Pitch": round(df_current_paper.loc[:, "Sales_Pitch"].mean(), 2),
+                     "Num_Accept": numVerdicts(df_current_paper, "Accept"),
+                     "Num_Reject": numVerdicts(df_current_paper, "Reject"),
+                     "Num_Discuss": numVerdicts(df_current_paper, "Discuss"),
+                     "Comments_for_Birddog": listComments(df_current_paper, "Comments_for_Birddog"),
+                     "Comments_for_Subcommittee": listComments(df_current_paper, "Comments_for_Subcommittee")})
+
+    return readReference(rows)
+
+
+# The old prePaperReviewAnalytics loop
+def oldPaperReviewSummary(df_papers:pd.DataFrame):
+    rows = []
+    for unique_id in df_papers["ID"].unique():
+        df_current_paper = df_papers.loc[df_papers["ID"] == unique_id]
+
+        rows.append({"ID": unique_id,
+                     "Title": df_current_paper["Title"].iloc[0],
+                     "Birddog": df_current_paper["Birddog"].iloc[0],
+                     "Assigned_Subcommittee": df_current_paper["Assigned_Subcommittee"].iloc[0],
+                     "Num_Best_Paper_Votes": len(df_current_paper[df_current_paper["Best_Paper_Vote"] == "Yes"].index),
+                     "Mean_Substance_Rating": round(df_current_paper.loc[:, "Substance_Rating"].mean(), 2),
+                     "Mean_Originality_Rating": round(df_current_paper.loc[:, "Originality_Rating"].mean(), 2),
+                     "Mean_Style_Quality_Rating": round(df_current_paper.loc[:, "Quality_Rating"].mean(), 2),
+                     "Mean_Sales_Pitch": round(df_current_paper.loc[:, "Sales_Pitch"].mean(), 2),
+                     "Num_Accept": numVerdicts(df_current_paper, "Accept"),
+                     "Num_Reject": numVerdicts(df_current_paper, "Reject"),
+                     "Num_Discuss": numVerdicts(df_current_paper, "Discuss"),
+                     "Comments_for_Birddog": listComments(df_current_paper, "Comments_for_Birddog"),
+                     "Comments_for_Subcommittee": listComments(df_current_paper, "Comments_for_Subcommittee")})
+
+    return readReference(rows)
+
+
+# The pre abstract review summary matches the old loop, apart from the first-review and one-name-per-line changes
+def test_abstract_review_summary_matches_old_loop(dataDir, tmp_path, monkeypatch):
+    summarized = runStage("pre-abstract-review", dataDir, tmp_path, monkeypatch)
+    df_papers = reviewsFor(summarized, PaperAnalytics.PAPER_ABSTRACT_REVIEW_SUMMARY)
+
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "Papers_AbstractReviewSummary.csv")), oldAbstractReviewSummary(df_papers))
+
+
+# The pre paper review summary matches the old loop
+def test_paper_review_summary_matches_old_loop(dataDir, tmp_path, monkeypatch):
+    summarized = runStage("pre-paper-review", dataDir, tmp_path, monkeypatch)
+    df_papers = reviewsFor(summarized, PaperAnalytics.PAPER_PAPER_REVIEW_SUMMARY)
+
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "Papers_PaperReviewSummary.csv")), oldPaperReviewSummary(df_papers))
@@ -0,0 +1,109 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests for the dashboard's report service
+
+# Include the goodies we are going to need
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import Utils.AnalysisSession as AnalysisSession
+import Utils.ReportService as ReportService
+
+# Query the dashboard sends for the org type cross tab
+CROSSTAB_PATH = "/api/paper/papers/crosstab?rows=Org_Type&cols=Assigned_Subcommittee"
+
+
+# Stands in for the paper analytics, reading a csv instead of an excel export
+class PaperAnalytics:
+
+    def loadXCDFile(self, filePath:str, sheetName):
+        return pd.read_csv(filePath)
+
+    def cleanData(self, df_data:pd.DataFrame, listOfColumnAliases:dict):
+        return df_data.rename(columns = listOfColumnAliases)
+
+
+# Write a small export and hand back its path
+def writeExport(directory, rows:int):
+    file_path = os.path.join(str(directory), "papers.csv")
+    pd.DataFrame({"ID": [row // 2 for row in range(rows)],
+                  "Org_Type": ["Industry", "Academia", "Military"] * (rows // 3) + ["Industry"] * (rows % 3),
+                  "Assigned_Subcommittee": ["TR", "SIM"] * (rows // 2) + ["ED"] * (rows % 2),
+                  "Comments": ["Reviewer only"] * rows}).to_csv(file_path, index = False)
+    return file_path
+
+
+# Service over a session holding one cleaned export
+@pytest.fixture
+def service(tmp_path):
+    session = AnalysisSession.AnalysisSession()
+    session.getCleanFrame(PaperAnalytics(), writeExport(tmp_path, 12), {})
+    return ReportService.ReportService(session)
+
+
+# The service's status for a request that gets turned away
+def errorStatus(service:ReportService.ReportService, path:str):
+    with pytest.raises(ReportService.ServiceError) as error:
+        service.handle(path)
+    return error.value.status
+
+
+# A dashboard holding the current ETag gets a 304 with no body, and a new one once the export changes
+def test_etag_answers_not_modified(service, tmp_path):
+    status, body, etag = service.handle(CROSSTAB_PATH)
+    assert status == 200 and json.loads(body)["Industry"] == {"TR": 2, "SIM": 2}
+
+    assert service.handle(CROSSTAB_PATH, etag) == (304, b"", etag)
+    assert service.handle(CROSSTAB_PATH, '"stale", ' + etag)[0] == 304
+
+    writeExport(tmp_path, 30)
+    status, body, new_etag = service.handle(CROSSTAB_PATH, etag)
+    assert status == 200 and new_etag != etag
+    assert json.loads(body)["Industry"] == {"TR": 5, "SIM": 5}
+
+
+# An export re-cleaned into a frame too big for the session to keep is still served
+def test_changed_export_served_when_session_drops_it(service, tmp_path):
+    service.session.maxMemoryBytes = service.session.residentBytes() + 1
+    writeExport(tmp_path, 3000)
+
+    status, body, _ = service.handle("/api/paper/papers/columns")
+    assert status == 200 and json.loads(body)["rows"] == 3000
+    assert not service.session.frames
+
+
+# Columns outside the summary's dimensions never go out, and a deleted export is a 404 instead of a crash
+def test_rejects_columns_and_missing_exports(service, tmp_path):
+    assert errorStatus(service, "/api/paper/papers/counts?by=Comments") == 400
+    assert errorStatus(service, "/api/paper/papers/crosstab?rows=Org_Type&cols=Comments") == 400
+    assert errorStatus(service, "/api/paper/other/summary") == 404
+
+    os.remove(os.path.join(str(tmp_path), "papers.csv"))
+    assert errorStatus(service, CROSSTAB_PATH) == 404
+
+
+# Only the dashboard's origin can read the responses
+def test_other_origins_are_forbidden(service):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReportService.requestHandler(service))
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+    url = "http://127.0.0.1:" + str(server.server_address[1]) + CROSSTAB_PATH
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers = {"Origin": service.allowedOrigin})) as response:
+            assert response.status == 200
+            assert response.headers["Access-Control-Allow-Origin"] == service.allowedOrigin
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(url, headers = {"Origin": "http://evil.example"}))
+        assert error.value.code == 403
+        assert "Reviewer only" not in error.value.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
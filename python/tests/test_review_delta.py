@@ -0,0 +1,77 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that delta mode writes the same paper review summary as a full run
+
+# Include the goodies we are going to need
+import os
+import numpy as np
+import pandas as pd
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Export the paper review summary comes from, and the report it writes
+PAPER_REVIEWS = "paper_review_iitsec_2024.xlsx"
+SUMMARY_REPORT = "Papers_PaperReviewSummary.csv"
+
+
+# Run the pre paper review stage into its own directory and hand back the paper review summary it wrote
+def runPrePaperReview(dataDir:str, outDir, deltaStatePath:str = None):
+    settings = RunSettings.RunSettings(XCDCache.XCDCache(enabled = False), deltaStatePath = deltaStatePath)
+
+    os.makedirs(str(outDir))
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.STAGES["pre-paper-review"](dataDir, settings)
+    finally:
+        os.chdir(working_dir)
+
+    with open(os.path.join(str(outDir), SUMMARY_REPORT)) as report_file:
+        return report_file.read()
+
+
+# The next pull of the reviews. Some reviews get added, some taken back, and some edited
+def nextPull(df_reviews:pd.DataFrame):
+    rng = np.random.default_rng(5)
+
+    # Taken back, including every review of one paper
+    dropped = rng.choice(len(df_reviews.index), 15, replace = False)
+    df_next = df_reviews.drop(index = df_reviews.index[dropped])
+    df_next = df_next[df_next["ID"] != df_next["ID"].iloc[0]]
+
+    # Edited ratings, verdicts, and comments
+    edited = df_next.index[rng.choice(len(df_next.index), 20, replace = False)]
+    df_next.loc[edited[:8], "Substance_Rating"] = 5.0
+    df_next.loc[edited[8:14], "Acceptance"] = "Reject"
+    df_next.loc[edited[14:], "Comments for Birddog (for author feedback)"] = "Needs another pass on the results"
+
+    # New reviews of existing papers, a second review by someone who already reviewed the paper, and a new paper
+    df_added = df_next.iloc[:4].assign(ReviewerLastname = "Nguyen", ReviewerFirstname = "Anh")
+    df_repeat = df_next.iloc[[10]].assign(Acceptance = "Discuss")
+    df_new_paper = df_next.iloc[[20, 21]].assign(ID = df_reviews["ID"].max() + 1, Title = "Paper late entry")
+
+    return pd.concat([df_next, df_added, df_repeat, df_new_paper], ignore_index = True)
+
+
+# After adding, removing, and editing reviews the delta run writes exactly what a full run writes
+def test_delta_summary_matches_full_run(tmp_path):
+    data_dir = str(tmp_path / "data")
+    os.makedirs(data_dir)
+    generator = DataGenerator.DataGenerator(seed = 3, scale = 1)
+    for file_name in main.STAGE_EXPORTS["pre-paper-review"]:
+        getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+    state_path = str(tmp_path / "delta_state.pkl")
+
+    # The first delta run has no state yet, so it summarizes everything
+    assert runPrePaperReview(data_dir, tmp_path / "delta1", state_path) == runPrePaperReview(data_dir, tmp_path / "full1")
+
+    df_reviews = pd.read_excel(os.path.join(data_dir, PAPER_REVIEWS))
+    nextPull(df_reviews).to_excel(os.path.join(data_dir, PAPER_REVIEWS), index = False)
+    assert runPrePaperReview(data_dir, tmp_path / "delta2", state_path) == runPrePaperReview(data_dir, tmp_path / "full2")
+
+    # Nothing changed since the last pull
+    assert runPrePaperReview(data_dir, tmp_path / "delta3", state_path) == runPrePaperReview(data_dir, tmp_path / "full3")
@@ -0,0 +1,210 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests that the TUT and PDW review summary specs match the old per-ID loops
+
+# Include the goodies we are going to need
+import io
+import os
+import pandas as pd
+import pytest
+
+# Import our shared helpers
+import main
+import Benchmarks.DataGenerator as DataGenerator
+import TUT.TutorialAnalytics as TutorialAnalytics
+import PDW.PDWAnalytics as PDWAnalytics
+import Utils.ReviewSummary as ReviewSummary
+import Utils.RunSettings as RunSettings
+import Utils.XCDCache as XCDCache
+
+# Stages that write the TUT and PDW review summaries
+SUMMARY_STAGES = ["pre-abstract-review", "pre-paper-review"]
+
+
+# Generated exports for the summary stages, written once for the whole module
+@pytest.fixture(scope = "module")
+def dataDir(tmp_path_factory):
+    data_dir = str(tmp_path_factory.mktemp("data"))
+    generator = DataGenerator.DataGenerator(seed = 23, scale = 1)
+    for stage_name in SUMMARY_STAGES:
+        for file_name in main.STAGE_EXPORTS[stage_name]:
+            getattr(generator, DataGenerator.DATA_FILES[file_name])().to_excel(os.path.join(data_dir, file_name), index = False)
+
+    return data_dir
+
+
+# Run a stage into its own directory. Hands back the cleaned reviews each summary spec was run over
+def runStage(stageName:str, dataDir:str, outDir, monkeypatch):
+    summarized = []
+    summarize = ReviewSummary.ReviewSummary.summarize
+
+    def recordingSummarize(self, df_reviews:pd.DataFrame, idColumn:str = "ID"):
+        summarized.append((self.spec, df_reviews))
+        return summarize(self, df_reviews, idColumn)
+
+    monkeypatch.setattr(ReviewSummary.ReviewSummary, "summarize", recordingSummarize)
+
+    working_dir = os.getcwd()
+    os.chdir(str(outDir))
+    try:
+        main.STAGES[stageName](dataDir, RunSettings.RunSettings(XCDCache.XCDCache(enabled = False)))
+    finally:
+        os.chdir(working_dir)
+
+    return summarized
+
+
+# The reviews a spec was run over
+def reviewsFor(summarized:list, spec:list):
+    return next(df_reviews for summarized_spec, df_reviews in summarized if summarized_spec is spec)
+
+
+# Read a summary back the way the chairs see it. The old loops wrote 0 as every row label, so those are left out
+def readReport(report):
+    return pd.read_csv(report, index_col = 0).reset_index(drop = True)
+
+
+# Write the old loop's rows out and read them back, so both sides go through the same csv round trip
+def readReference(rows:list):
+    return readReport(io.StringIO(pd.DataFrame(rows).to_csv()))
+
+
+# Number of reviews for the submission where the column holds the value
+def numEqual(df_current_record:pd.DataFrame, columnName:str, value):
+    return len(df_current_record[df_current_record[columnName] == value].index)
+
+
+# The non-empty comments in a column, the way the old loops filtered them
+def listComments(df_current_record:pd.DataFrame, columnName:str):
+    return [x for x in df_current_record[columnName].tolist() if str(x) != 'nan']
+
+
+# Mean of the numbers in a column, ignoring text junk
+def meanRating(df_current_record:pd.DataFrame, columnName:str):
+    return round(pd.to_numeric(df_current_record[columnName], errors = "coerce").mean(), 2)
+
+
+# The old TUT preAbstractReviewAnalytics loop
+def oldTutAbstractReviewSummary(df_tut:pd.DataFrame):
+    rows = []
+    for unique_id in df_tut["ID"].unique():
+        df_current_record = df_tut.loc[df_tut["ID"] == unique_id]
+        df_volunteers = df_current_record[df_current_record["Birddog_Volunteer"] == "Yes"]
+
+        rows.append({"ID": unique_id,
+                     # The old loop took the tutorial's details off the second review. The summary takes the first
+                     "Title": df_current_record["Title"].iloc[0],
+                     # The old loop printed the names with Series.to_string. The summary puts one name per line
+                     "Birddog_Volunteer": "\n".join(df_volunteers["ReviewerLastname"] + ',' + df_volunteers["ReviewerFirstname"]),
+                     "International(Y/N)": df_current_record["International(Y/N)"].iloc[0],
+                     "Past_Year_Tutorial_Number": df_current_record["Past_Year_Tutorial_Number"].iloc[0],
+                     "Mean_Alignment": round(df_current_record.loc[:, "Mean_Alignment"].mean(), 2),
+                     "Mean_Learning_Objectives": round(df_current_record.loc[:, "Mean_Learning_Objectives"].mean(), 2),
+                     "Mean_Outline_Content": round(df_current_record.loc[:, "Mean_Outline_Content"].mean(), 2),
+                     "Num_Sales_Pitch": df_current_record.loc[:, "Num_Sales_Pitch"].sum(),
+                     "Num_Accept": numEqual(df_current_record, "Acceptance", "Accept"),
+                     "Num_Reject": numEqual(df_current_record, "Acceptance", "Reject"),
+                     "Num_Discuss": numEqual(df_current_record, "Acceptance", "Discuss"),
+                     "Organization_Type": df_current_record["Organization_Type"].iloc[0],
+                     "Comments": listComments(df_current_record, "Comments"),
+                     "Biography": listComments(df_current_record, "Biography")})
+
+    return readReference(rows)
+
+
+# The old TUT prePaperReviewAnalytics loop
+def oldTutPaperReviewSummary(df_tut:pd.DataFrame):
+    rows = []
+    for unique_id in df_tut["ID"].unique():
+        df_current_record = df_tut.loc[df_tut["ID"] == unique_id]
+
+        rows.append({"ID": unique_id,
+                     "Title": df_current_record["Title"].iloc[0],
+                     "Birddog": df_current_record["Birddog"].iloc[0],
+                     "International(Y/N)": df_current_record["International(Y/N)"].iloc[0],
+                     "Past_Year_Tutorial_Number": df_current_record["Past_Year_Tutorial_Number"].iloc[0],
+                     "Content_Quantity_Right": numEqual(df_current_record, "Content_Quantity_Appropriate", "Seems Right"),
+                     "Content_Quantity_Long": numEqual(df_current_record, "Content_Quantity_Appropriate", "Too Long"),
+                     # The old loop ran filter(None) over these first, which threw out the 0 votes. Ratings are never
+                     # 0, but a sales pitch vote is, so the mean sales pitch now counts the reviewers that said no
+                     "Content_Description": meanRating(df_current_record, "Content_Description"),
+                     "Slide_Quality": meanRating(df_current_record, "Slide_Quality"),
+                     "Mean_Sales_Pitch": meanRating(df_current_record, "Sales_Pitch"),
+                     "Num_Best_Tutorial": numEqual(df_current_record, "Best_Tutorial", "Yes"),
+                     "Num_Accept": numEqual(df_current_record, "Acceptance", "Accept"),
+                     "Num_Reject": numEqual(df_current_record, "Acceptance", "Reject"),
+                     "Num_Discuss": numEqual(df_current_record, "Acceptance", "Discuss"),
+                     "Organization_Type": df_current_record["Organization_Type"].iloc[0],
+                     "Comments_to_Birddog": listComments(df_current_record, "Comments_for_Birddog"),
+                     "Discussion_Comments": listComments(df_current_record, "Comments_for_Discussion"),
+                     "Biography": listComments(df_current_record, "Biography")})
+
+    return readReference(rows)
+
+
+# The old PDW preAbstractReviewAnalytics and prePaperReviewAnalytics loop
+def oldPdwReviewSummary(df_pdw:pd.DataFrame):
+    rows = []
+    for unique_id in df_pdw["ID"].unique():
+        df_current_record = df_pdw.loc[df_pdw["ID"] == unique_id]
+
+        rows.append({"ID": unique_id,
+                     "Title": df_current_record["Title"].iloc[0],
+                     "Num_Accept": numEqual(df_current_record, "Acceptance", 1),
+                     "Num_Reject": numEqual(df_current_record, "Acceptance", 2),
+                     "Num_Discuss": numEqual(df_current_record, "Acceptance", 3),
+                     "Comments": listComments(df_current_record, "Comments"),
+                     "Biography": listComments(df_current_record, "Biography"),
+                     # The old loop put the whole Room_Type column in, which only lined up on row label 0. The summary
+                     # takes the first value per workshop
+                     "Room_Type": df_current_record["Room_Type"].iloc[0]})
+
+    return readReference(rows)
+
+
+# The TUT and PDW summaries written before abstract review match the old loops
+def test_abstract_review_summaries_match_old_loops(dataDir, tmp_path, monkeypatch):
+    summarized = runStage("pre-abstract-review", dataDir, tmp_path, monkeypatch)
+
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "TUT_AbstractReviewSummary.csv")),
+                                  oldTutAbstractReviewSummary(reviewsFor(summarized, TutorialAnalytics.TUT_ABSTRACT_REVIEW_SUMMARY)))
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "PDW_AbstractReviewSummary.csv")),
+                                  oldPdwReviewSummary(reviewsFor(summarized, PDWAnalytics.PDW_REVIEW_SUMMARY)))
+
+
+# The TUT and PDW summaries written before paper review match the old loops
+def test_paper_review_summaries_match_old_loops(dataDir, tmp_path, monkeypatch):
+    summarized = runStage("pre-paper-review", dataDir, tmp_path, monkeypatch)
+
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "TUT_PaperReviewSummary.csv")),
+                                  oldTutPaperReviewSummary(reviewsFor(summarized, TutorialAnalytics.TUT_PAPER_REVIEW_SUMMARY)))
+    pd.testing.assert_frame_equal(readReport(str(tmp_path / "PDW_PaperReviewSummary.csv")),
+                                  oldPdwReviewSummary(reviewsFor(summarized, PDWAnalytics.PDW_REVIEW_SUMMARY)))
+
+
+# A reviewer saying there is no sales pitch counts toward the TUT mean
+def test_tut_mean_sales_pitch_counts_zero_votes():
+    df_tut = pd.DataFrame({column: [None] * 5 for column in ReviewSummary.sourceColumns(TutorialAnalytics.TUT_PAPER_REVIEW_SUMMARY)})
+    df_tut = df_tut.assign(ID = [1, 1, 1, 2, 2], Sales_Pitch = [0, 1, 0, 0, None])
+
+    df_summary = ReviewSummary.ReviewSummary(TutorialAnalytics.TUT_PAPER_REVIEW_SUMMARY).summarize(df_tut)
+    assert df_summary["Mean_Sales_Pitch"].tolist() == [0.33, 0.0]
+
+
+# The PDW room setup is the first one given for the workshop, even when the reviews disagree
+def test_pdw_room_type_is_first_value():
+    df_pdw = pd.DataFrame({"ID": [7, 7, 7, 8, 8],
+                           "Title": ["Workshop 7"] * 3 + ["Workshop 8"] * 2,
+                           "Acceptance": [1, 2, 1, 3, 3],
+                           "Comments": [None] * 5,
+                           "Biography": [None] * 5,
+                           "Room_Type": ["Theater", "Classroom", "Classroom", None, "Rounds"]})
+
+    df_summary = ReviewSummary.ReviewSummary(PDWAnalytics.PDW_REVIEW_SUMMARY).summarize(df_pdw)
+    assert df_summary["Room_Type"].tolist() == ["Theater", "Rounds"]
+
+
+# A spec asking for a reducer the engine doesn't have is turned away up front
+def test_unknown_reducer_rejected():
+    with pytest.raises(ValueError):
+        ReviewSummary.ReviewSummary([("Title", "Title", "median")])
@@ -0,0 +1,75 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests for the stage memo's input tracking
+
+# Include the goodies we are going to need
+import os
+import pandas as pd
+
+# Import our shared helpers
+import Utils.AnalysisSession as AnalysisSession
+import Utils.StageMemo as StageMemo
+
+
+# Stands in for the Paper/TUT/PDW analytics, reading a one column csv instead of an excel export
+class FakeAnalytics:
+
+    def loadXCDFile(self, filePath:str, sheetName):
+        return pd.read_csv(filePath)
+
+    def cleanData(self, df_data:pd.DataFrame, listOfColumnAliases:dict):
+        return df_data.rename(columns = listOfColumnAliases)
+
+
+# Write a small export and hand back its path
+def writeExport(directory, rows:int):
+    file_path = os.path.join(str(directory), "papers_review.csv")
+    pd.DataFrame({"ID": range(rows)}).to_csv(file_path, index = False)
+    return file_path
+
+
+# A frame the session already holds still counts as read by the stage that asked for it
+def test_session_hit_records_input(tmp_path):
+    file_path = writeExport(tmp_path, 10)
+    session = AnalysisSession.AnalysisSession()
+    session.getCleanFrame(FakeAnalytics(), file_path, {})
+
+    with StageMemo.StageRecorder() as recorder:
+        session.getCleanFrame(FakeAnalytics(), file_path, {})
+
+    assert session.hits == 1
+    assert list(recorder.inputs) == [os.path.abspath(file_path)]
+
+
+# A stage that read its export from the session gets rerun once the export shrinks
+def test_session_stage_reruns_after_export_changes(tmp_path):
+    file_path = writeExport(tmp_path, 10)
+    session = AnalysisSession.AnalysisSession()
+    memo = StageMemo.StageMemo(str(tmp_path / "memo"))
+    session.getCleanFrame(FakeAnalytics(), file_path, {})
+
+    report_path = str(tmp_path / "report.csv")
+    with StageMemo.StageRecorder() as recorder:
+        session.getCleanFrame(FakeAnalytics(), file_path, {}).to_csv(report_path)
+        StageMemo.recordOutput(report_path)
+    memo.store("pre-abstract-review", {}, "code", recorder, 1.0, "never run")
+
+    entry, _ = memo.lookup("pre-abstract-review", {}, "code")
+    assert entry is not None
+
+    writeExport(tmp_path, 5)
+    entry, reason = memo.lookup("pre-abstract-review", {}, "code")
+    assert entry is None
+    assert reason == "papers_review.csv changed"
+
+
+# An entry with no inputs would always be reused, so it never gets saved and an old one gets dropped
+def test_store_refuses_entry_without_inputs(tmp_path):
+    memo = StageMemo.StageMemo(str(tmp_path / "memo"))
+    os.makedirs(memo.entryDir("pre-abstract-review", {}))
+
+    memo.store("pre-abstract-review", {}, "code", StageMemo.StageRecorder(), 1.0, "forced")
+
+    assert not os.path.exists(memo.entryDir("pre-abstract-review", {}))
+    entry, reason = memo.lookup("pre-abstract-review", {}, "code")
+    assert entry is None
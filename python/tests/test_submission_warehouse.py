@@ -0,0 +1,51 @@
+# Created By: I/ITSEC KM
+# Created On: 10/18/2026
+# Description: This file contains the regression tests for when the submission warehouse re-ingests an export
+
+# Include the goodies we are going to need
+import os
+import pandas as pd
+
+# Import our shared helpers
+import Utils.SubmissionWarehouse as SubmissionWarehouse
+import Utils.XCDCache as XCDCache
+import Utils.RunSettings as RunSettings
+
+
+# Stands in for the Paper/TUT/PDW analytics, only renaming the columns
+class FakeAnalytics:
+
+    def __init__(self):
+        self.settings = RunSettings.RunSettings(XCDCache.XCDCache(enabled = False))
+
+    def cleanData(self, df_data:pd.DataFrame, listOfColumnAliases:dict):
+        return df_data.rename(columns = listOfColumnAliases)
+
+
+# Write a small export and hand back its path
+def writeExport(directory):
+    file_path = os.path.join(str(directory), "2023_Paper_Submissions.xlsx")
+    pd.DataFrame({"ID": [1, 2, 3], "Main Subcommittee Category": ["A", "B", "A"]}).to_excel(file_path, index = False)
+    return file_path
+
+
+# The same export is only skipped when it would be cleaned the same way as last time
+def test_ingest_reruns_when_aliases_or_cleaning_change(tmp_path, monkeypatch):
+    file_path = writeExport(tmp_path)
+    warehouse_dir = str(tmp_path / "warehouse")
+    aliases = {"Main Subcommittee Category": "Subcommittee"}
+
+    first = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir).ingest("papers", 2023, file_path, FakeAnalytics(), aliases)
+    again = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir).ingest("papers", 2023, file_path, FakeAnalytics(), aliases)
+    assert again["ingestedAt"] == first["ingestedAt"] and again["file"] == first["file"]
+
+    new_aliases = {"Main Subcommittee Category": "Main_Subcommittee"}
+    renamed = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir).ingest("papers", 2023, file_path, FakeAnalytics(), new_aliases)
+    assert renamed["file"] != first["file"]
+    assert "Main_Subcommittee" in renamed["columns"]
+
+    warehouse = SubmissionWarehouse.SubmissionWarehouse(warehouse_dir)
+    monkeypatch.setattr(warehouse, "cleanerFingerprint", lambda analytics: "newer cleaning")
+    recleaned = warehouse.ingest("papers", 2023, file_path, FakeAnalytics(), new_aliases)
+    assert recleaned["file"] != renamed["file"]
+    assert recleaned["cleaner"] == "newer cleaning"